@@ -47,6 +47,8 @@ def run_unittest_tests(python_exe):
         'test_swing_comparison',
         'test_recording_management',
         'test_swing_detector',
+        'test_dual_camera_recorder',
+        'test_pose_processor',
         'test_archive',
     ]
     
@@ -43,6 +43,10 @@ def load_windows_config(config_path: str = None) -> dict:
 class TabbedCameraGUI:
     """Single window GUI with tabs for camera setup and recording"""
     
+    # Wall clock for the on-screen recording timer and the duration printed
+    # when recording stops; tests pin it to check those values
+    _now = staticmethod(time.time)
+    
     # OpenCV camera property constants
     PROP_BRIGHTNESS = cv2.CAP_PROP_BRIGHTNESS
     PROP_CONTRAST = cv2.CAP_PROP_CONTRAST
@@ -504,7 +508,7 @@ class TabbedCameraGUI:
             
             # Recording duration
             if self.recording_start_time:
-                duration = time.time() - self.recording_start_time
+                duration = self._now() - self.recording_start_time
                 duration_text = f"Duration: {duration:.1f}s"
                 frame = self._put_text_pil(frame, duration_text, (200, status_y + 5), 
                                            size=0.6, color=(255, 255, 255), thickness=2)
@@ -855,13 +859,13 @@ class TabbedCameraGUI:
             # Apply stored camera settings to recorder cameras
             for prop_const, value in camera1_settings.items():
                 try:
-                    self.recorder.camera1.cap.set(prop_const, value)
+                    self.recorder.camera1.set_property(prop_const, value)
                 except:
                     pass  # Some properties may not be settable
             
             for prop_const, value in camera2_settings.items():
                 try:
-                    self.recorder.camera2.cap.set(prop_const, value)
+                    self.recorder.camera2.set_property(prop_const, value)
                 except:
                     pass  # Some properties may not be settable
             
@@ -871,7 +875,7 @@ class TabbedCameraGUI:
             
             self.recorder.start_recording(filename)
             self.is_recording = True
-            self.recording_start_time = time.time()
+            self.recording_start_time = self._now()
             # Store video file paths (constructed from filename like DualCameraRecorder does)
             self.recording_files = [
                 os.path.join(self.recorder.output_dir, f"{filename}_camera1.mp4"),
@@ -922,7 +926,7 @@ class TabbedCameraGUI:
             self.recorder.stop_cameras()  # Stop cameras first
             self.is_recording = False
             
-            duration = time.time() - self.recording_start_time if self.recording_start_time else 0
+            duration = self._now() - self.recording_start_time if self.recording_start_time else 0
             self.status_message = f"Recording stopped ({duration:.1f}s)"
             self.status_time = time.time()
             
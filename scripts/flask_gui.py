@@ -21,6 +21,9 @@ import time
 import numpy as np
 import re
 import glob as globmod
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Dict, List
 from datetime import datetime, timedelta
 
@@ -32,6 +35,17 @@ from sway_calculator import SwayCalculator
 from swing_detector import SwingDetector
 
 from flask import Flask, render_template, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 
 def load_windows_config(config_path: str = None) -> dict:
@@ -58,6 +72,20 @@ class CameraManager:
     the same recording and analysis pipeline.
     """
 
+    # Wall clock behind recording_duration(); tests pin it so the
+    # durations reported by /api/status and on stop are exact
+    _now = staticmethod(time.time)
+
+    # Raw annotated frames allowed to queue for JPEG encoding during analysis
+    ENCODE_AHEAD = 4
+
+    # Per-frame metric series exposed to the analysis UI
+    METRIC_KEYS = (
+        'sway', 'shoulder_turn', 'hip_turn', 'x_factor',
+        'head_sway', 'spine_tilt', 'knee_flex', 'weight_shift',
+        'spine_angle', 'lead_arm_angle',
+    )
+
     # OpenCV camera property constants
     PROP_MAP = {
         'brightness': cv2.CAP_PROP_BRIGHTNESS,
@@ -136,6 +164,7 @@ class CameraManager:
         self.analysis_frames_cam1 = []  # JPEG-compressed annotated frames
         self.analysis_frames_cam2 = []
         self.analysis_model_complexity = 2  # 0=lite, 1=full, 2=heavy
+        self._results_json = None  # (key, camera1, camera2, body) of the last encoding
 
         # Auto-detect state
         self.auto_detect_enabled = False
@@ -284,12 +313,14 @@ class CameraManager:
                     with self.frame_lock:
                         self.latest_frame1 = frame
 
-                    # Auto-detect: process every 4th frame (~15 fps)
-                    if self.auto_detect_enabled and self.swing_detector and not self.is_recording:
+                    # Auto-detect: process every 4th frame (~15 fps). Take a local
+                    # reference; toggle_auto_detect may clear it from a request thread.
+                    detector = self.swing_detector
+                    if self.auto_detect_enabled and detector and not self.is_recording:
                         self.auto_detect_frame_counter += 1
                         if self.auto_detect_frame_counter % 4 == 0:
                             try:
-                                event = self.swing_detector.process_frame(frame)
+                                event = detector.process_frame(frame)
                                 if event == 'start' and not self.is_recording:
                                     print("[AutoDetect] Swing detected — starting recording")
                                     self.start_recording()
@@ -449,12 +480,12 @@ class CameraManager:
             # Re-apply camera settings to the recorder's cameras
             for cv_prop, value in cam1_settings.items():
                 try:
-                    self.recorder.camera1.cap.set(cv_prop, value)
+                    self.recorder.camera1.set_property(cv_prop, value)
                 except Exception:
                     pass
             for cv_prop, value in cam2_settings.items():
                 try:
-                    self.recorder.camera2.cap.set(cv_prop, value)
+                    self.recorder.camera2.set_property(cv_prop, value)
                 except Exception:
                     pass
 
@@ -464,7 +495,7 @@ class CameraManager:
             self.recorder.start_recording(filename)
 
             self.is_recording = True
-            self.recording_start_time = time.time()
+            self.recording_start_time = self._now()
             self.recording_files = [
                 os.path.join(self.recorder.output_dir, f"{filename}_camera1.mp4"),
                 os.path.join(self.recorder.output_dir, f"{filename}_camera2.mp4"),
@@ -488,6 +519,11 @@ class CameraManager:
             self.status_time = time.time()
             return {'error': str(e)}
 
+    def recording_duration(self) -> float:
+        """Seconds since the current recording started, 0 when not recording."""
+        start = self.recording_start_time
+        return (self._now() - start) if start else 0
+
     def stop_recording(self) -> Dict:
         """Stop recording, reopen preview cameras, trigger analysis."""
         if not self.is_recording:
@@ -502,7 +538,7 @@ class CameraManager:
             self.recorder.stop_cameras()
             self.is_recording = False
 
-            duration = (time.time() - self.recording_start_time) if self.recording_start_time else 0
+            duration = self.recording_duration()
             self.status_message = f"Recording stopped ({duration:.1f}s)"
             self.status_time = time.time()
             self.recording_start_time = None
@@ -639,14 +675,33 @@ class CameraManager:
         self.analysis_frames_cam1 = []
         self.analysis_frames_cam2 = []
 
+    @staticmethod
+    def _compress_frame(frame) -> bytes:
+        """Compress one BGR numpy array to JPEG bytes."""
+        _, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        return buf.tobytes()
+
     @staticmethod
     def _compress_frames(bgr_frames: list) -> list:
         """Compress a list of BGR numpy arrays to JPEG bytes (~30x smaller)."""
-        compressed = []
-        for frame in bgr_frames:
-            _, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-            compressed.append(buf.tobytes())
-        return compressed
+        return [CameraManager._compress_frame(frame) for frame in bgr_frames]
+
+    @staticmethod
+    def _process_video_compressed(processor, video_path: str):
+        """Run pose detection on a video, JPEG-compressing each annotated
+        frame as it is produced so raw BGR frames never accumulate."""
+        landmarks, frames, pending = [], [], deque()
+        # Encoding runs on its own thread, overlapping inference on the next
+        # frame; iter_video yields a fresh array per frame, so this is safe.
+        # At most ENCODE_AHEAD raw frames wait for the encoder at once.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for lm, annotated in processor.iter_video(video_path):
+                landmarks.append(lm)
+                if len(pending) >= CameraManager.ENCODE_AHEAD:
+                    frames.append(pending.popleft().result())
+                pending.append(pool.submit(CameraManager._compress_frame, annotated))
+            frames.extend(f.result() for f in pending)
+        return landmarks, frames
 
     def _analyze_videos(self):
         """Background thread: run MediaPipe pose analysis on both videos."""
@@ -674,10 +729,8 @@ class CameraManager:
             mc = self.analysis_model_complexity
             self.analysis_progress = f"Processing Camera 1 (face-on, model={mc})..."
             processor1 = PoseProcessor(model_complexity=mc)
-            landmarks1, annotated1 = processor1.process_video(video1_path)
+            landmarks1, self.analysis_frames_cam1 = self._process_video_compressed(processor1, video1_path)
             processor1.release()
-            self.analysis_frames_cam1 = self._compress_frames(annotated1)
-            del annotated1  # free raw BGR memory immediately
 
             calc1 = SwayCalculator()
             analysis1 = calc1.analyze_sequence(landmarks1, frame_width1)
@@ -688,10 +741,8 @@ class CameraManager:
             # --- Camera 2 (down-the-line) ---
             self.analysis_progress = f"Processing Camera 2 (down-the-line, model={mc})..."
             processor2 = PoseProcessor(model_complexity=mc)
-            landmarks2, annotated2 = processor2.process_video(video2_path)
+            landmarks2, self.analysis_frames_cam2 = self._process_video_compressed(processor2, video2_path)
             processor2.release()
-            self.analysis_frames_cam2 = self._compress_frames(annotated2)
-            del annotated2
 
             calc2 = SwayCalculator()
             analysis2 = calc2.analyze_sequence(landmarks2, frame_width2)
@@ -734,32 +785,29 @@ class CameraManager:
                 'camera2': None,
             }
 
-        # All per-frame metric keys we expose
-        METRIC_KEYS = [
-            'sway', 'shoulder_turn', 'hip_turn', 'x_factor',
-            'head_sway', 'spine_tilt', 'knee_flex', 'weight_shift',
-            'spine_angle', 'lead_arm_angle',
-        ]
+        metric_keys = self.METRIC_KEYS
 
         # Determine max frame count across both cameras
         max_frames = 0
         for cam_data in (self.analysis_camera1, self.analysis_camera2):
             if cam_data:
-                for key in METRIC_KEYS:
-                    arr = cam_data.get(key, [])
+                for key in metric_keys:
+                    arr = cam_data.get(key, ())
                     if len(arr) > max_frames:
                         max_frames = len(arr)
 
-        # Clamp frame index
-        if max_frames > 0:
-            self.analysis_frame_index = max(0, min(max_frames - 1, self.analysis_frame_index))
+        # Clamp frame index; read it once so the reply describes a single frame
+        # even if the slider moves it from another request thread meanwhile
         frame_idx = self.analysis_frame_index
+        if max_frames > 0:
+            frame_idx = max(0, min(max_frames - 1, frame_idx))
+            self.analysis_frame_index = frame_idx
 
         results = {
             'is_analyzing': self.is_analyzing,
             'progress': self.analysis_progress,
             'analysis_error': self.analysis_error,
-            'frame_index': self.analysis_frame_index,
+            'frame_index': frame_idx,
             'max_frames': max_frames,
             'has_frames': has_frames,
             'camera1': None,
@@ -772,9 +820,10 @@ class CameraManager:
                 return None
             summary = cam_data.get('summary', {})
             # Current values for the selected frame
+            get = cam_data.get
             current = {}
-            for key in METRIC_KEYS:
-                arr = cam_data.get(key, [])
+            for key in metric_keys:
+                arr = get(key, ())
                 current[key] = arr[frame_idx] if frame_idx < len(arr) else None
             # Phase label for this frame
             phases = cam_data.get('phases', [])
@@ -782,9 +831,7 @@ class CameraManager:
             # Tempo (single value)
             current['tempo'] = cam_data.get('tempo')
             # Full time-series for the chart (None values kept for gaps)
-            timeseries = {}
-            for key in METRIC_KEYS:
-                timeseries[key] = cam_data.get(key, [])
+            timeseries = {key: get(key, []) for key in metric_keys}
             timeseries['phases'] = cam_data.get('phases', [])
             return {
                 'summary': summary,
@@ -798,6 +845,29 @@ class CameraManager:
 
         return results
 
+    def get_analysis_results_json(self) -> str:
+        """get_analysis_results() encoded as JSON, reused until its inputs change.
+
+        The frame slider requests results on every tick, and encoding the
+        full time-series dominates each of those requests.  Analysis dicts are
+        replaced, never mutated, once published, so identity checks suffice.
+        """
+        # Inputs are read before encoding so a concurrent update can only
+        # make the cache entry look stale, never hide a newer result
+        camera1, camera2 = self.analysis_camera1, self.analysis_camera2
+        state = (self.is_analyzing, self.analysis_progress, self.analysis_error,
+                 bool(self.analysis_frames_cam1 or self.analysis_frames_cam2))
+        cached = self._results_json
+        if (cached is not None and cached[0] == (self.analysis_frame_index,) + state
+                and cached[1] is camera1 and cached[2] is camera2):
+            return cached[3]
+        results = self.get_analysis_results()
+        body = app.json.dumps(results)
+        # Keyed on the clamped index the body was built from, so a slider move
+        # that lands mid-encode can't be cached against the wrong frame
+        self._results_json = ((results['frame_index'],) + state, camera1, camera2, body)
+        return body
+
     # ------------------------------------------------------------------
     # Save / load analysis results to JSON (for swing comparison)
     # ------------------------------------------------------------------
@@ -1009,6 +1079,34 @@ app = Flask(
     static_folder=os.path.join(_project_root, 'static'),
 )
 
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Encode and decode JSON with orjson; the UI polls the status and
+    analysis routes continuously and stdlib json dominates those requests."""
+
+    _OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+# Analysis results repeat ~10 per-frame series and are re-fetched on every
+# slider tick; they compress well.  The MJPEG streams are left alone.
+if Compress is not None:
+    app.config.update(
+        COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css',
+                            'application/javascript'],
+        COMPRESS_LEVEL=6,
+        COMPRESS_MIN_SIZE=500,
+    )
+    Compress(app)
+
 # Global singleton - set in main() or by tests
 camera_manager: Optional[CameraManager] = None
 
@@ -1069,10 +1167,23 @@ def generate_frames(camera_num: int):
 # Routes
 # ------------------------------------------------------------------
 
+# (body, etag) of the rendered index page; the template takes no variables,
+# so it is rendered once per process (restart to pick up template edits)
+_index_page: Optional[Tuple[bytes, str]] = None
+
+
 @app.route('/')
 def index():
     """Serve the main single-page UI."""
-    return render_template('index.html')
+    global _index_page
+    if _index_page is None:
+        body = render_template('index.html').encode('utf-8')
+        _index_page = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+    body, etag = _index_page
+    resp = Response(body, mimetype='text/html')
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'public, max-age=60'
+    return resp.make_conditional(request)
 
 
 @app.route('/video_feed/<int:camera_num>')
@@ -1210,7 +1321,7 @@ def api_status():
         'is_recording': mgr.is_recording,
         'is_analyzing': mgr.is_analyzing,
         'analysis_progress': mgr.analysis_progress,
-        'recording_duration': (time.time() - mgr.recording_start_time) if mgr.recording_start_time else 0,
+        'recording_duration': mgr.recording_duration(),
         'recording_files': [os.path.basename(f) for f in mgr.recording_files] if mgr.recording_files else [],
         'status_message': mgr.status_message,
         'fps': mgr.fps,
@@ -1310,7 +1421,7 @@ def api_analysis_results():
     mgr = get_manager()
     if mgr is None:
         return jsonify({'error': 'Not initialized'})
-    return jsonify(mgr.get_analysis_results())
+    return Response(mgr.get_analysis_results_json(), mimetype='application/json')
 
 
 @app.route('/api/analysis/frame', methods=['POST'])
@@ -1323,7 +1434,7 @@ def api_set_analysis_frame():
     if not data or 'index' not in data:
         return jsonify({'error': 'Missing index'}), 400
     mgr.analysis_frame_index = int(data['index'])
-    return jsonify(mgr.get_analysis_results())
+    return Response(mgr.get_analysis_results_json(), mimetype='application/json')
 
 
 @app.route('/api/analysis/frame/<int:camera_num>')
@@ -1614,6 +1725,18 @@ def api_list_analyses():
     return jsonify({'analyses': analyses, 'count': len(analyses)})
 
 
+# Summary metrics compared between two saved swings
+_SUMMARY_DELTA_KEYS = (
+    'max_shoulder_turn', 'max_hip_turn', 'max_x_factor',
+    'max_sway_left', 'max_sway_right',
+    'max_head_sway_left', 'max_head_sway_right',
+    'min_spine_tilt', 'max_spine_tilt',
+    'address_spine_angle', 'max_spine_angle_change',
+    'min_lead_arm_angle', 'address_knee_flex', 'max_knee_flex_change',
+    'max_weight_shift_forward', 'tempo_ratio',
+)
+
+
 @app.route('/api/compare')
 def api_compare():
     """Compare two swings.  Query: ?a=YYYYMMDD_HHMMSS&b=YYYYMMDD_HHMMSS"""
@@ -1630,23 +1753,13 @@ def api_compare():
         return jsonify({'error': f'Analysis not found for {ts_b}'}), 404
 
     # Build comparison: summary deltas for each camera
-    METRIC_SUMMARY_KEYS = [
-        'max_shoulder_turn', 'max_hip_turn', 'max_x_factor',
-        'max_sway_left', 'max_sway_right',
-        'max_head_sway_left', 'max_head_sway_right',
-        'min_spine_tilt', 'max_spine_tilt',
-        'address_spine_angle', 'max_spine_angle_change',
-        'min_lead_arm_angle', 'address_knee_flex', 'max_knee_flex_change',
-        'max_weight_shift_forward', 'tempo_ratio',
-    ]
-
     def _cam_deltas(cam_a, cam_b):
         if cam_a is None or cam_b is None:
             return None
         sa = cam_a.get('summary', {})
         sb = cam_b.get('summary', {})
         deltas = {}
-        for k in METRIC_SUMMARY_KEYS:
+        for k in _SUMMARY_DELTA_KEYS:
             va = sa.get(k)
             vb = sb.get(k)
             if va is not None and vb is not None:
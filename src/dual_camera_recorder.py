@@ -13,14 +13,45 @@ from datetime import datetime
 from typing import Optional, Tuple
 import numpy as np
 
+try:
+    import uvc  # pyuvc (libuvc bindings) - optional, keeps the USB bus saturated
+except ImportError:
+    uvc = None
+
+# OpenCV property -> (UVC control name, value conversion) for applying
+# settings on the libuvc path. The picture controls use the device's raw
+# units on both sides; exposure is stored on the DirectShow log2-seconds scale
+# and UVC wants 100us units. Properties without a UVC equivalent (white
+# balance is stored per channel, not as a temperature) are left out.
+_UVC_CONTROLS = {
+    cv2.CAP_PROP_BRIGHTNESS: ('Brightness', round),
+    cv2.CAP_PROP_CONTRAST: ('Contrast', round),
+    cv2.CAP_PROP_SATURATION: ('Saturation', round),
+    cv2.CAP_PROP_GAIN: ('Gain', round),
+    cv2.CAP_PROP_SHARPNESS: ('Sharpness', round),
+    cv2.CAP_PROP_GAMMA: ('Gamma', round),
+    cv2.CAP_PROP_FOCUS: ('Absolute Focus', round),
+    cv2.CAP_PROP_EXPOSURE: ('Absolute Exposure Time', lambda v: round(10000 * 2 ** v)),
+}
+
 
 class CameraCapture:
     """Handles individual camera capture with buffering"""
     
-    def __init__(self, camera_id, buffer_size: int = 2):
+    # Seconds of continuous read failures before warning (once per outage)
+    FAILURE_WARNING_SECONDS = 1.0
+    
+    def __init__(self, camera_id, buffer_size: int = 2, use_uvc: bool = False,
+                 uvc_uid: Optional[str] = None):
         # Support both int (index) and str (device path)
         self.camera_id = camera_id
         self.cap = None
+        # libuvc is opt-in: its device list is not in OpenCV index order, so
+        # the device is matched by its UID ("bus:address") or serial number
+        self.uvc_cap = None  # libuvc capture, used instead of self.cap when open
+        self.uvc_dims = None
+        self.use_uvc = use_uvc
+        self.uvc_uid = uvc_uid
         self.frame_queue = queue.Queue(maxsize=buffer_size)
         self.running = False
         self.thread = None
@@ -29,6 +60,12 @@ class CameraCapture:
         
     def start(self, width: int = 1280, height: int = 720, fps: int = 30):
         """Start camera capture thread"""
+        if self.use_uvc and uvc is not None and self._start_uvc(width, height, fps):
+            self.running = True
+            self.thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self.thread.start()
+            return self.uvc_dims
+
         # Use platform-appropriate backend
         import sys
         if sys.platform == 'win32' and isinstance(self.camera_id, int):
@@ -59,13 +96,77 @@ class CameraCapture:
         
         return (actual_width, actual_height, actual_fps)
     
+    def _start_uvc(self, width: int, height: int, fps: int) -> bool:
+        """Open the camera through libuvc, requesting MJPEG at the given mode.
+
+        libuvc keeps several isochronous transfers queued so the camera streams
+        continuously instead of waiting on host requests.  Returns False (and
+        leaves the OpenCV path to run) if the device or mode can't be matched.
+        """
+        if not self.uvc_uid:
+            print(f"Camera {self.camera_id}: no libuvc UID configured, using OpenCV")
+            return False
+        try:
+            uid = next((d['uid'] for d in uvc.device_list()
+                        if self.uvc_uid in (d['uid'], d.get('serialNumber'))), None)
+            if uid is None:
+                print(f"libuvc device {self.uvc_uid} not found, using OpenCV")
+                return False
+            cap = uvc.Capture(uid)
+            modes = [m for m in cap.available_modes
+                     if (m.width, m.height) == (width, height)]
+            if not modes:
+                cap.close()
+                return False
+            # Prefer MJPEG at the requested rate, then the closest rate
+            modes.sort(key=lambda m: (getattr(m, 'format_name', '') != 'MJPG',
+                                      abs(m.fps - fps)))
+            cap.frame_mode = modes[0]
+            cap.bandwidth_factor = 2.0
+        except Exception as e:
+            print(f"libuvc unavailable for camera {self.camera_id} ({e}), using OpenCV")
+            return False
+
+        self.uvc_cap = cap
+        mode = cap.frame_mode
+        self.uvc_dims = (mode.width, mode.height, float(mode.fps))
+        print(f"Camera {self.camera_id} (libuvc): {mode.width}x{mode.height} @ {mode.fps} FPS")
+        return True
+    
+    def set_property(self, prop: int, value: float) -> bool:
+        """Apply an OpenCV camera property (cv2.CAP_PROP_*) to whichever backend is active.
+        Returns False if the property could not be applied."""
+        if self.uvc_cap is None:
+            return self.cap is not None and self.cap.set(prop, value)
+        if prop not in _UVC_CONTROLS:
+            return False
+        name, convert = _UVC_CONTROLS[prop]
+        for control in self.uvc_cap.controls:
+            if control.display_name == name:
+                control.value = max(control.min_val, min(control.max_val, convert(value)))
+                return True
+        return False
+    
+    def _read(self):
+        """Read one frame from whichever backend is active"""
+        if self.uvc_cap is not None:
+            try:
+                return True, self.uvc_cap.get_frame_robust().bgr
+            except Exception:
+                return False, None
+        return self.cap.read()
+    
     def _capture_loop(self):
         """Internal capture loop running in separate thread"""
         consecutive_failures = 0
+        failing_since = None
+        warned = False
         while self.running:
-            ret, frame = self.cap.read()
+            ret, frame = self._read()
             if ret:
                 consecutive_failures = 0
+                failing_since = None
+                warned = False
                 timestamp = time.time()
                 # Drop old frames if queue is full (keep latest)
                 if self.frame_queue.full():
@@ -75,18 +176,26 @@ class CameraCapture:
                         pass
                 
                 try:
-                    self.frame_queue.put((frame.copy(), timestamp), block=False)
+                    # read() hands back a freshly allocated array each call and
+                    # consumers only read from it, so no defensive copy is needed
+                    self.frame_queue.put((frame, timestamp), block=False)
                     self.last_frame_time = timestamp
                     self.frame_count += 1
                 except queue.Full:
                     # Queue is full, skip this frame
                     pass
             else:
+                now = time.monotonic()
+                if failing_since is None:
+                    failing_since = now
+                elif not warned and now - failing_since >= self.FAILURE_WARNING_SECONDS:
+                    print(f"Warning: Camera {self.camera_id} has failed to read frames "
+                          f"for {now - failing_since:.1f}s")
+                    warned = True
+                # Back off exponentially (10ms, 20ms, ... up to 320ms) so a
+                # disconnected camera isn't polled 100x per second
+                time.sleep(0.01 * (1 << min(consecutive_failures, 5)))
                 consecutive_failures += 1
-                if consecutive_failures > 100:
-                    print(f"Warning: Camera {self.camera_id} failed to read {consecutive_failures} consecutive frames")
-                    consecutive_failures = 0
-                time.sleep(0.01)  # Small delay if read fails
     
     def get_frame(self, timeout: float = 0.1) -> Optional[Tuple[np.ndarray, float]]:
         """Get latest frame with timestamp"""
@@ -105,12 +214,16 @@ class CameraCapture:
             self.thread.join(timeout=2.0)
         if self.cap:
             self.cap.release()
+        if self.uvc_cap is not None:
+            self.uvc_cap.close()
+            self.uvc_cap = None
 
 
 class DualCameraRecorder:
     """Main recorder class for dual camera synchronized recording"""
     
-    def __init__(self, camera1_id = None, camera2_id = None):
+    def __init__(self, camera1_id = None, camera2_id = None,
+                 uvc_uids: Optional[Tuple[str, str]] = None):
         # Use platform-appropriate defaults if not specified
         import sys
         if sys.platform == 'win32':
@@ -122,8 +235,14 @@ class DualCameraRecorder:
             camera1_id = camera1_id if camera1_id is not None else 0
             camera2_id = camera2_id if camera2_id is not None else 1
         
-        self.camera1 = CameraCapture(camera1_id)
-        self.camera2 = CameraCapture(camera2_id)
+        # Capture through libuvc only when both devices are named explicitly.
+        # Library-only for now: neither GUI passes uvc_uids.
+        if uvc_uids:
+            self.camera1 = CameraCapture(camera1_id, use_uvc=True, uvc_uid=uvc_uids[0])
+            self.camera2 = CameraCapture(camera2_id, use_uvc=True, uvc_uid=uvc_uids[1])
+        else:
+            self.camera1 = CameraCapture(camera1_id)
+            self.camera2 = CameraCapture(camera2_id)
         self.recording = False
         self.video_writer1 = None
         self.video_writer2 = None
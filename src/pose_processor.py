@@ -13,8 +13,28 @@ from mediapipe.tasks.python import vision
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 import os
+import multiprocessing
+import queue
+import shutil
+import tempfile
+import threading
+import time
 import urllib.request
 
+from sway_calculator import LANDMARK_NAMES
+
+
+def _pose_connections() -> np.ndarray:
+    """Skeleton edges as an (E, 2) int32 array of landmark indices."""
+    # Newer MediaPipe releases renamed POSE_CONNECTIONS to POSE_LANDMARKS
+    connections = getattr(vision.PoseLandmarksConnections, 'POSE_CONNECTIONS', None)
+    if connections is None:
+        connections = getattr(vision.PoseLandmarksConnections, 'POSE_LANDMARKS', [])
+    return np.array([(c.start, c.end) for c in connections], dtype=np.int32).reshape(-1, 2)
+
+
+_POSE_CONN = _pose_connections()
+
 
 def get_model_path(model_complexity=2, models_dir=None):
     """
@@ -68,9 +88,60 @@ def get_model_path(model_complexity=2, models_dir=None):
     return model_path
 
 
+class _FrameReader(threading.Thread):
+    """Decodes frames from a VideoCapture on a background thread.
+
+    Frames are handed over through a small bounded queue so decoding the
+    next frame overlaps with pose inference on the current one.
+    """
+
+    def __init__(self, cap, maxsize: int = 4):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.queue = queue.Queue(maxsize=maxsize)
+        self._stop_event = threading.Event()
+
+    def run(self):
+        try:
+            while not self._stop_event.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                self._put(frame)
+        finally:
+            self._put(None)  # end-of-stream sentinel
+
+    def _put(self, item):
+        # Retry with a timeout so stop() can unblock a full queue
+        while not self._stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def __iter__(self):
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                return
+            yield frame
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
 class PoseProcessor:
     """Processes video frames to extract pose landmarks using MediaPipe"""
     
+    # MediaPipe pose landmark index for each entry of LANDMARK_NAMES
+    _LM_NAMES = LANDMARK_NAMES
+    _LM_INDICES = (0, 7, 8, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28)
+    
+    # Set once a GPU delegate fails to initialise in this process
+    _gpu_unavailable = False
+    
     # Default model paths (users need to download these)
     MODEL_PATHS = {
         0: None,  # Lite model - download from MediaPipe repository
@@ -81,16 +152,22 @@ class PoseProcessor:
     def __init__(self, model_complexity=2, 
                  min_detection_confidence=0.5,
                  min_tracking_confidence=0.5,
-                 model_path: Optional[str] = None):
+                 model_path: Optional[str] = None,
+                 inference_width: Optional[int] = 640,
+                 use_gpu: bool = True):
         """
         Initialize MediaPipe Pose
         
         Args:
-            model_complexity: 0=lite, 1=full, 2=heavy (not used in 0.10.30+ API)
-            min_detection_confidence: Minimum confidence for detection (not used in default model)
-            min_tracking_confidence: Minimum confidence for tracking (not used in default model)
+            model_complexity: 0=lite, 1=full, 2=heavy (selects the model file to download)
+            min_detection_confidence: Minimum confidence for person detection
+            min_tracking_confidence: Minimum confidence for tracking between frames
             model_path: Path to MediaPipe pose model file (.task file)
                        If None, will automatically download the model based on model_complexity
+            inference_width: Frames wider than this are downscaled before detection
+                             (the model itself runs at 256x256). None disables it.
+            use_gpu: Try MediaPipe's GPU delegate first, falling back to CPU
+                     if it cannot be created
         """
         # MediaPipe 0.10.30+ requires explicit model paths
         if model_path is None:
@@ -100,57 +177,130 @@ class PoseProcessor:
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
-        # Use create_from_model_path for simplicity
-        # Note: This uses default options (min_detection_confidence and min_tracking_confidence are ignored)
-        self.pose_landmarker = vision.PoseLandmarker.create_from_model_path(model_path)
+        # VIDEO mode tracks the pose ROI between frames and only re-runs the
+        # person detector when tracking is lost, instead of on every frame
+        def make_options(delegate):
+            return vision.PoseLandmarkerOptions(
+                base_options=python.BaseOptions(model_asset_path=model_path, delegate=delegate),
+                running_mode=vision.RunningMode.VIDEO,
+                num_poses=1,
+                min_pose_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence,
+            )
+        
+        # Warm up so the first real frame doesn't pay delegate/allocator setup.
+        # It is also the first real inference, where GL/EGL delegates tend to
+        # fail even after creating successfully, so it is part of the GPU check.
+        warmup = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.zeros((64, 64, 3), dtype=np.uint8))
+        
+        self.pose_landmarker = None
+        self.uses_gpu = False
+        if use_gpu and not PoseProcessor._gpu_unavailable:
+            try:
+                self.pose_landmarker = vision.PoseLandmarker.create_from_options(
+                    make_options(python.BaseOptions.Delegate.GPU))
+                self.pose_landmarker.detect_for_video(warmup, 0)
+                self.uses_gpu = True
+            except Exception as e:
+                if self.pose_landmarker is not None:
+                    try:
+                        self.pose_landmarker.close()
+                    except Exception:
+                        pass
+                    self.pose_landmarker = None
+                # Remember for this process so later instances skip straight to CPU
+                PoseProcessor._gpu_unavailable = True
+                print(f"GPU delegate unavailable, using CPU: {str(e).splitlines()[0][:200]}")
+        if self.pose_landmarker is None:
+            self.pose_landmarker = vision.PoseLandmarker.create_from_options(
+                make_options(python.BaseOptions.Delegate.CPU))
+            self.pose_landmarker.detect_for_video(warmup, 0)
+        
+        # VIDEO mode requires strictly increasing timestamps; the warmup used 0
+        self._last_timestamp_ms = 0
         
         # Store processed results
         self.landmarks_sequence = []
+        
+        self.inference_width = inference_width
+        
+        # Lets process_video rebuild an equivalent processor in worker processes
+        self._worker_kwargs = {
+            'model_path': model_path,
+            'min_detection_confidence': min_detection_confidence,
+            'min_tracking_confidence': min_tracking_confidence,
+            'inference_width': inference_width,
+            'use_gpu': False,
+        }
+        
+        # RGB input buffer reused across frames of the same size
+        self._rgb_buf = None
     
-    def process_frame(self, frame):
+    def process_frame(self, frame, timestamp_ms: Optional[int] = None, draw_inplace: bool = False):
         """
         Process a single frame
         
         Args:
             frame: BGR image from OpenCV
+            timestamp_ms: Frame timestamp in milliseconds (default: wall clock).
+                          Bumped forward if not past the previous frame's.
+            draw_inplace: Draw landmarks directly on frame instead of a copy
+                          (for callers that don't need the original)
             
         Returns:
             results: MediaPipe pose results (PoseLandmarkerResult)
             annotated_frame: Frame with landmarks drawn
         """
-        # Convert BGR to RGB
-        image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w = image_rgb.shape[:2]
+        h, w = frame.shape[:2]
+        
+        # Downscale large frames; landmarks come back normalised, so drawing
+        # on the full-size frame below is unaffected
+        in_shape = frame.shape
+        if self.inference_width and w > self.inference_width:
+            new_h = max(1, round(h * self.inference_width / w))
+            in_shape = (new_h, self.inference_width) + frame.shape[2:]
+        if self._rgb_buf is None or self._rgb_buf.shape != in_shape:
+            self._rgb_buf = np.empty(in_shape, dtype=np.uint8)
+        
+        # Convert BGR to RGB into the reused buffer. When downscaling, resize
+        # into it and swap channels in place, so the full-size frame is read
+        # once and no intermediate image is allocated.
+        if in_shape != frame.shape:
+            small = cv2.resize(frame, (in_shape[1], in_shape[0]), dst=self._rgb_buf,
+                               interpolation=cv2.INTER_AREA)
+            image_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=small)
+        else:
+            image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
-        # Convert to MediaPipe Image
+        # Convert to MediaPipe Image. The constructor copies the array, so
+        # _rgb_buf is free to be overwritten by the next frame straight away.
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image_rgb)
         
         # Process with MediaPipe
-        detection_result = self.pose_landmarker.detect(mp_image)
+        if timestamp_ms is None:
+            timestamp_ms = int(time.monotonic() * 1000)
+        timestamp_ms = max(int(timestamp_ms), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        detection_result = self.pose_landmarker.detect_for_video(mp_image, timestamp_ms)
         
-        # Draw landmarks on frame
-        annotated_frame = frame.copy()
+        # Draw landmarks on frame. Never a shared buffer: process_video and
+        # the GUIs keep the returned frames, so reuse would alias them.
+        annotated_frame = frame if draw_inplace else frame.copy()
         pose_landmarks_list = detection_result.pose_landmarks if detection_result.pose_landmarks else []
         
         if pose_landmarks_list:
             for pose_landmarks in pose_landmarks_list:
+                pts = self.denormalize(
+                    np.array([(lm.x, lm.y) for lm in pose_landmarks], dtype=np.float32), frame.shape)
+                
                 # Draw landmarks
-                for landmark in pose_landmarks:
-                    x = int(landmark.x * w)
-                    y = int(landmark.y * h)
+                for x, y in pts.tolist():
                     cv2.circle(annotated_frame, (x, y), 5, (0, 255, 0), -1)
                 
-                # Draw connections
-                connections = vision.PoseLandmarksConnections.POSE_CONNECTIONS
-                for connection in connections:
-                    start_idx = connection.start
-                    end_idx = connection.end
-                    if start_idx < len(pose_landmarks) and end_idx < len(pose_landmarks):
-                        start_landmark = pose_landmarks[start_idx]
-                        end_landmark = pose_landmarks[end_idx]
-                        start_point = (int(start_landmark.x * w), int(start_landmark.y * h))
-                        end_point = (int(end_landmark.x * w), int(end_landmark.y * h))
-                        cv2.line(annotated_frame, start_point, end_point, (0, 255, 0), 2)
+                # Draw connections in a single call
+                conn = _POSE_CONN[(_POSE_CONN < len(pts)).all(axis=1)]
+                if len(conn):
+                    cv2.polylines(annotated_frame, pts[conn], False, (0, 255, 0), 2)
         
         # Create a results object similar to the old API for compatibility
         class Results:
@@ -161,55 +311,170 @@ class PoseProcessor:
         
         return results, annotated_frame
     
-    def process_video(self, video_path):
+    def iter_video(self, video_path):
         """
-        Process entire video file
+        Process a video file one frame at a time
+        
+        Only the current frame is held in memory, so callers that encode or
+        write frames as they arrive use O(1) memory regardless of length.
         
         Args:
             video_path: Path to video file
             
-        Returns:
-            landmarks_sequence: List of landmark dictionaries for each frame
-            annotated_frames: List of frames with landmarks drawn
+        Yields:
+            (landmarks, annotated_frame) per frame; landmarks is a landmark
+            dictionary or None if no pose was detected (annotated_frame is
+            then the raw frame)
         """
         cap = cv2.VideoCapture(video_path)
         
         if not cap.isOpened():
             raise RuntimeError(f"Failed to open video: {video_path}")
         
-        landmarks_sequence = []
-        annotated_frames = []
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_ms = 1000.0 / fps if fps and fps > 0 else 1000.0 / 30
+        start_ms = self._last_timestamp_ms + 1
         frame_count = 0
         
         print(f"Processing video: {video_path}")
         
-        while cap.isOpened():
-            ret, frame = cap.read()
-            
-            if not ret:
-                break
-            
-            # Process frame
-            results, annotated_frame = self.process_frame(frame)
+        # Decode on a background thread while this one runs inference
+        reader = _FrameReader(cap)
+        reader.start()
+        
+        try:
+            for frame in reader:
+                # Process frame
+                # Each decoded frame is a fresh array owned by this loop
+                results, annotated_frame = self.process_frame(
+                    frame, start_ms + int(frame_count * frame_ms), draw_inplace=True)
+                
+                # Extract landmarks
+                if results.pose_landmarks:
+                    yield self._extract_landmarks(results.pose_landmarks), annotated_frame
+                else:
+                    yield None, frame
+                
+                frame_count += 1
+                
+                if frame_count % 30 == 0:
+                    print(f"  Processed {frame_count} frames...")
+        finally:
+            reader.stop()
+            cap.release()
+        
+        print(f"Video processing complete: {frame_count} frames")
+    
+    def process_video(self, video_path, output_path: Optional[str] = None, n_workers: int = 1):
+        """
+        Process entire video file
+        
+        Args:
+            video_path: Path to video file
+            output_path: If given, annotated frames are written to this video
+                         file as they are produced instead of kept in memory
+            n_workers: With output_path, split the video into this many
+                       segments and process them in parallel worker processes
+                       (spawned, so the calling script needs an
+                       ``if __name__ == '__main__'`` guard)
             
-            # Extract landmarks
-            if results.pose_landmarks:
-                landmarks_dict = self._extract_landmarks(results.pose_landmarks)
-                landmarks_sequence.append(landmarks_dict)
+        Returns:
+            landmarks_sequence: List of landmark dictionaries for each frame
+            annotated_frames: List of frames with landmarks drawn, or
+                              output_path when writing to a file
+        """
+        landmarks_sequence = []
+        
+        if output_path is None:
+            annotated_frames = []
+            for landmarks, annotated_frame in self.iter_video(video_path):
+                landmarks_sequence.append(landmarks)
                 annotated_frames.append(annotated_frame)
-            else:
-                landmarks_sequence.append(None)
-                annotated_frames.append(frame)
-            
-            frame_count += 1
-            
-            if frame_count % 30 == 0:
-                print(f"  Processed {frame_count} frames...")
+            return landmarks_sequence, annotated_frames
         
+        cap = cv2.VideoCapture(video_path)
+        fps = cap.get(cv2.CAP_PROP_FPS) if cap.isOpened() else 0
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) if cap.isOpened() else 0
         cap.release()
-        print(f"Video processing complete: {frame_count} frames")
         
-        return landmarks_sequence, annotated_frames
+        if n_workers > 1 and total_frames > n_workers:
+            return self._process_video_parallel(video_path, output_path, n_workers, total_frames), output_path
+        
+        writer = None
+        try:
+            for landmarks, annotated_frame in self.iter_video(video_path):
+                if writer is None:
+                    h, w = annotated_frame.shape[:2]
+                    writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*'mp4v'),
+                                             fps or 30.0, (w, h))
+                writer.write(annotated_frame)
+                landmarks_sequence.append(landmarks)
+        finally:
+            if writer is not None:
+                writer.release()
+        
+        return landmarks_sequence, output_path
+    
+    def _process_video_parallel(self, video_path, output_path, n_workers, total_frames):
+        """Process contiguous segments in a process pool, then join the
+        per-segment annotated videos into output_path."""
+        seg_len = -(-total_frames // n_workers)
+        tmp_dir = tempfile.mkdtemp(prefix='pose_segments_')
+        jobs = [(video_path, start, seg_len, os.path.join(tmp_dir, f"seg_{i:03d}.mp4"))
+                for i, start in enumerate(range(0, total_frames, seg_len))]
+        
+        print(f"Processing video: {video_path} ({len(jobs)} segments)")
+        
+        # spawn, not fork: MediaPipe's graph threads don't survive a fork
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(len(jobs), initializer=_init_worker, initargs=(self._worker_kwargs,)) as pool:
+            segments = sorted(pool.map(_process_segment, jobs))
+        
+        landmarks_sequence = []
+        writer = None
+        try:
+            for _, landmarks, seg_path, fps in segments:
+                landmarks_sequence.extend(landmarks)
+                cap = cv2.VideoCapture(seg_path)
+                while True:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    if writer is None:
+                        h, w = frame.shape[:2]
+                        writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*'mp4v'),
+                                                 fps or 30.0, (w, h))
+                    writer.write(frame)
+                cap.release()
+                os.remove(seg_path)
+        finally:
+            if writer is not None:
+                writer.release()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        
+        print(f"Video processing complete: {len(landmarks_sequence)} frames")
+        return landmarks_sequence
+    
+    def _extract_landmark_array(self, pose_landmarks) -> np.ndarray:
+        """
+        Gather the tracked landmarks into a single array
+        
+        Args:
+            pose_landmarks: MediaPipe pose landmarks list
+            
+        Returns:
+            (len(LANDMARK_NAMES), 4) float32 array of x, y, z, visibility,
+            rows in LANDMARK_NAMES order. Rows for landmarks the model did
+            not return are NaN.
+        """
+        n = len(pose_landmarks)
+        arr = np.full((len(self._LM_INDICES), 4), np.nan, dtype=np.float32)
+        rows = [(pose_landmarks[idx].x, pose_landmarks[idx].y, pose_landmarks[idx].z,
+                 getattr(pose_landmarks[idx], 'visibility', None))
+                for idx in self._LM_INDICES if idx < n]
+        if rows:
+            arr[:len(rows)] = [(x, y, z, 1.0 if v is None else v) for x, y, z, v in rows]
+        return arr
     
     def _extract_landmarks(self, pose_landmarks):
         """
@@ -221,37 +486,11 @@ class PoseProcessor:
         Returns:
             Dictionary with landmark names and coordinates
         """
+        arr = self._extract_landmark_array(pose_landmarks)
         landmarks = {}
-        
-        # Key landmarks we care about for golf swing
-        landmark_names = {
-            0: 'nose',
-            7: 'left_ear',
-            8: 'right_ear',
-            11: 'left_shoulder',
-            12: 'right_shoulder',
-            13: 'left_elbow',
-            14: 'right_elbow',
-            15: 'left_wrist',
-            16: 'right_wrist',
-            23: 'left_hip',
-            24: 'right_hip',
-            25: 'left_knee',
-            26: 'right_knee',
-            27: 'left_ankle',
-            28: 'right_ankle',
-        }
-        
-        for idx, name in landmark_names.items():
-            if idx < len(pose_landmarks):
-                landmark = pose_landmarks[idx]
-                landmarks[name] = {
-                    'x': landmark.x,
-                    'y': landmark.y,
-                    'z': landmark.z,
-                    'visibility': landmark.visibility if hasattr(landmark, 'visibility') else 1.0
-                }
-        
+        for name, (x, y, z, visibility) in zip(self._LM_NAMES, arr.tolist()):
+            if x == x:  # skip NaN rows (landmark not returned)
+                landmarks[name] = {'x': x, 'y': y, 'z': z, 'visibility': visibility}
         return landmarks
     
     def get_landmark_point(self, landmarks_dict, landmark_name, frame_shape):
@@ -269,15 +508,79 @@ class PoseProcessor:
         if landmarks_dict is None or landmark_name not in landmarks_dict:
             return None
         
-        height, width = frame_shape[:2]
         landmark = landmarks_dict[landmark_name]
-        
-        x = int(landmark['x'] * width)
-        y = int(landmark['y'] * height)
+        x, y = self.denormalize(np.array([landmark['x'], landmark['y']], dtype=np.float32),
+                                frame_shape).tolist()
         
         return (x, y)
     
+    @staticmethod
+    def denormalize(coords: np.ndarray, frame_shape) -> np.ndarray:
+        """
+        Convert normalized landmark coordinates to pixel coordinates
+        
+        Args:
+            coords: Array whose last axis starts with x, y, e.g. (K, 4) from
+                    _extract_landmark_array or (N, K, 4) for a whole sequence
+            frame_shape: Shape of frame (height, width, channels)
+            
+        Returns:
+            int32 array of shape coords.shape[:-1] + (2,)
+        """
+        height, width = frame_shape[:2]
+        scale = np.array([width, height], dtype=np.float32)
+        return (coords[..., :2] * scale).astype(np.int32)
+    
     def release(self):
         """Release MediaPipe resources"""
         if hasattr(self, 'pose_landmarker'):
             self.pose_landmarker.close()
+
+
+# Per-process PoseProcessor used by process_video(n_workers > 1)
+_worker_processor = None
+
+
+def _init_worker(kwargs):
+    """Pool initializer: load the model once per worker process."""
+    global _worker_processor
+    _worker_processor = PoseProcessor(**kwargs)
+
+
+def _process_segment(job):
+    """
+    Process frames [start_frame, start_frame + n_frames) of a video
+
+    Returns:
+        (start_frame, landmarks, annotated_path, fps)
+    """
+    video_path, start_frame, n_frames, out_path = job
+    cap = cv2.VideoCapture(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    frame_ms = 1000.0 / fps if fps and fps > 0 else 1000.0 / 30
+    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+
+    landmarks_sequence = []
+    writer = None
+    try:
+        for i in range(n_frames):
+            ret, frame = cap.read()
+            if not ret:
+                break
+            results, annotated_frame = _worker_processor.process_frame(
+                frame, int((start_frame + i) * frame_ms), draw_inplace=True)
+            if results.pose_landmarks:
+                landmarks_sequence.append(_worker_processor._extract_landmarks(results.pose_landmarks))
+            else:
+                landmarks_sequence.append(None)
+                annotated_frame = frame
+            if writer is None:
+                h, w = annotated_frame.shape[:2]
+                writer = cv2.VideoWriter(out_path, cv2.VideoWriter_fourcc(*'mp4v'), fps or 30.0, (w, h))
+            writer.write(annotated_frame)
+    finally:
+        cap.release()
+        if writer is not None:
+            writer.release()
+
+    return start_frame, landmarks_sequence, out_path, fps
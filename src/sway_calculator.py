@@ -5,8 +5,16 @@ Calculates lateral sway, rotation, and biomechanical metrics from pose landmarks
 
 import math
 import numpy as np
+from collections import Counter
 from typing import List, Dict, Optional, Tuple
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_RAD2DEG = 180.0 / math.pi
+
 
 def _angle_between(a: Tuple[float, float], b: Tuple[float, float], c: Tuple[float, float]) -> Optional[float]:
     """
@@ -21,7 +29,180 @@ def _angle_between(a: Tuple[float, float], b: Tuple[float, float], c: Tuple[floa
     if mag_ba < 1e-9 or mag_bc < 1e-9:
         return None
     cos_angle = max(-1.0, min(1.0, dot / (mag_ba * mag_bc)))
-    return math.degrees(math.acos(cos_angle))
+    return math.acos(cos_angle) * _RAD2DEG
+
+
+def _angle_terms(a: np.ndarray, b: np.ndarray, c: np.ndarray):
+    """
+    Vectorised building blocks of _angle_between over (N, 2) point arrays.
+    The angle at b is atan2(|cross|, dot), which stays accurate near 0 and
+    180 degrees where acos of the normalised dot product does not.
+
+    Returns:
+        (|cross|, dot, degenerate) where degenerate marks frames in which
+        either segment has (near) zero length
+    """
+    ba = a - b
+    bc = c - b
+    dot = ba[:, 0] * bc[:, 0] + ba[:, 1] * bc[:, 1]
+    cross = ba[:, 0] * bc[:, 1] - ba[:, 1] * bc[:, 0]
+    degenerate = (np.hypot(ba[:, 0], ba[:, 1]) < 1e-9) | (np.hypot(bc[:, 0], bc[:, 1]) < 1e-9)
+    return np.abs(cross), dot, degenerate
+
+
+# Landmarks tracked for swing analysis, in the row order used by landmark
+# arrays (see PoseProcessor._extract_landmark_array and _stack_landmarks).
+# Columns are x, y, z, visibility.
+LANDMARK_NAMES = (
+    'nose', 'left_ear', 'right_ear',
+    'left_shoulder', 'right_shoulder', 'left_elbow', 'right_elbow',
+    'left_wrist', 'right_wrist', 'left_hip', 'right_hip',
+    'left_knee', 'right_knee', 'left_ankle', 'right_ankle',
+)
+_LSH = LANDMARK_NAMES.index('left_shoulder')
+_RSH = LANDMARK_NAMES.index('right_shoulder')
+_LHIP = LANDMARK_NAMES.index('left_hip')
+_RHIP = LANDMARK_NAMES.index('right_hip')
+_NOSE = LANDMARK_NAMES.index('nose')
+_LELB = LANDMARK_NAMES.index('left_elbow')
+_LWRI = LANDMARK_NAMES.index('left_wrist')
+_LKNEE = LANDMARK_NAMES.index('left_knee')
+_LANK = LANDMARK_NAMES.index('left_ankle')
+_RANK = LANDMARK_NAMES.index('right_ankle')
+
+# Swing phases in order; per-frame phases are int8 indices into this tuple
+# until they are turned into names for the results dict.
+PHASE_NAMES = ('Address', 'Backswing', 'Top', 'Downswing', 'Impact', 'Follow-through')
+(_PHASE_ADDRESS, _PHASE_BACKSWING, _PHASE_TOP,
+ _PHASE_DOWNSWING, _PHASE_IMPACT, _PHASE_FOLLOW_THROUGH) = range(len(PHASE_NAMES))
+
+
+def _stack_landmarks(landmarks_sequence: List[Optional[Dict]]) -> np.ndarray:
+    """
+    Pack a landmark sequence into one (N, K, 4) float64 array.
+    Frames that are None and landmarks that are missing are left as NaN,
+    so they propagate through the vectorised maths as "no value".
+    float64 keeps the metrics identical to the per-frame scalar methods.
+    """
+    arr = np.full((len(landmarks_sequence), len(LANDMARK_NAMES), 4), np.nan)
+    for i, landmarks in enumerate(landmarks_sequence):
+        if landmarks is None:
+            continue
+        for j, name in enumerate(LANDMARK_NAMES):
+            lm = landmarks.get(name)
+            if lm is not None:
+                arr[i, j] = (lm['x'], lm['y'], lm['z'], lm.get('visibility', 1.0))
+    return arr
+
+
+# Fixed-point scale for packed int16 landmark storage: covers +/-4.0 (z and
+# slightly off-frame x/y) at ~1.2e-4 resolution. The minimum int16 marks a
+# missing landmark.
+_PACK_SCALE = 8192.0
+_PACK_MISSING = np.iinfo(np.int16).min
+
+
+def pack_landmarks(landmarks_sequence: List[Optional[Dict]]) -> np.ndarray:
+    """
+    Quantise a landmark sequence to an (N, K, 4) int16 array.
+    A quarter of the float64 stacked size and a small fraction of the dict form;
+    SwayCalculator.analyze_sequence accepts the packed array directly.
+    """
+    arr = _stack_landmarks(landmarks_sequence)
+    missing = np.isnan(arr)
+    packed = np.clip(np.rint(np.where(missing, 0, arr) * _PACK_SCALE), -32767, 32767).astype(np.int16)
+    packed[missing] = _PACK_MISSING
+    return packed
+
+
+def _unpack_array(packed: np.ndarray) -> np.ndarray:
+    """Dequantise a packed int16 array back to (N, K, 4) float64 with NaN gaps."""
+    arr = packed * (1.0 / _PACK_SCALE)
+    arr[packed == _PACK_MISSING] = np.nan
+    return arr
+
+
+def _array_to_landmarks(arr: np.ndarray) -> List[Optional[Dict]]:
+    """Convert an (N, K, 4) landmark array back to per-frame dicts (or None)."""
+    sequence = []
+    for frame in arr.tolist():
+        landmarks = {name: {'x': x, 'y': y, 'z': z, 'visibility': v}
+                     for name, (x, y, z, v) in zip(LANDMARK_NAMES, frame) if not math.isnan(x)}
+        sequence.append(landmarks or None)
+    return sequence
+
+
+def unpack_landmarks(packed: np.ndarray) -> List[Optional[Dict]]:
+    """Inverse of pack_landmarks. Frames without any landmarks come back as None."""
+    return _array_to_landmarks(_unpack_array(packed))
+
+
+def _core_metrics_numpy(arr: np.ndarray, address_idx: int, frame_width: float):
+    """Sway, shoulder turn, hip turn and X-factor over a stacked landmark array."""
+    ls, rs = arr[:, _LSH], arr[:, _RSH]
+    lh, rh = arr[:, _LHIP], arr[:, _RHIP]
+    hip_x = (lh[:, 0] + rh[:, 0]) * 0.5
+    address_hip_x = hip_x[address_idx] if address_idx >= 0 else np.nan
+    sway = (hip_x - address_hip_x) * frame_width
+    shoulder_turn = np.degrees(np.arctan2(rs[:, 2] - ls[:, 2], np.abs(rs[:, 0] - ls[:, 0])))
+    hip_turn = np.degrees(np.arctan2(rh[:, 2] - lh[:, 2], np.abs(rh[:, 0] - lh[:, 0])))
+    x_factor = np.abs(shoulder_turn - hip_turn)
+    return sway, shoulder_turn, hip_turn, x_factor
+
+
+def _core_metrics_loop(arr, address_idx, frame_width):
+    """
+    Same as _core_metrics_numpy as a single fused loop, compiled with Numba
+    when it is installed. No fastmath: NaN marks missing landmarks and must
+    propagate.
+    """
+    n = arr.shape[0]
+    sway = np.empty(n)
+    shoulder_turn = np.empty(n)
+    hip_turn = np.empty(n)
+    x_factor = np.empty(n)
+    address_hip_x = np.nan
+    if address_idx >= 0:
+        address_hip_x = (arr[address_idx, _LHIP, 0] + arr[address_idx, _RHIP, 0]) * 0.5
+    for i in range(n):
+        hip_x = (arr[i, _LHIP, 0] + arr[i, _RHIP, 0]) * 0.5
+        sway[i] = (hip_x - address_hip_x) * frame_width
+        st = math.atan2(arr[i, _RSH, 2] - arr[i, _LSH, 2], abs(arr[i, _RSH, 0] - arr[i, _LSH, 0])) * _RAD2DEG
+        ht = math.atan2(arr[i, _RHIP, 2] - arr[i, _LHIP, 2], abs(arr[i, _RHIP, 0] - arr[i, _LHIP, 0])) * _RAD2DEG
+        shoulder_turn[i] = st
+        hip_turn[i] = ht
+        x_factor[i] = abs(st - ht)
+    return sway, shoulder_turn, hip_turn, x_factor
+
+
+_core_metrics = njit(cache=True)(_core_metrics_loop) if njit is not None else _core_metrics_numpy
+
+
+def _to_list(values: np.ndarray) -> List[Optional[float]]:
+    """Convert a 1-D metric array to a list of floats, NaN -> None."""
+    return [None if math.isnan(v) else v for v in values.tolist()]
+
+
+def _points_to_list(points: np.ndarray) -> List[Optional[Tuple[float, float]]]:
+    """Convert an (N, 2) array of points to a list of (x, y) tuples, NaN -> None."""
+    return [None if math.isnan(x) or math.isnan(y) else (x, y) for x, y in points.tolist()]
+
+
+def _nan_first(values: np.ndarray) -> Optional[float]:
+    valid = np.flatnonzero(~np.isnan(values))
+    return float(values[valid[0]]) if valid.size else None
+
+
+# fmin/fmax skip NaN as they go, so each reduction is one pass with no
+# filtered copy and no all-NaN warnings; NaN comes back only if every value is NaN.
+def _nan_min(values: np.ndarray) -> Optional[float]:
+    result = np.fmin.reduce(values) if values.size else np.nan
+    return None if np.isnan(result) else float(result)
+
+
+def _nan_max(values: np.ndarray) -> Optional[float]:
+    result = np.fmax.reduce(values) if values.size else np.nan
+    return None if np.isnan(result) else float(result)
 
 
 class SwayCalculator:
@@ -30,6 +211,19 @@ class SwayCalculator:
     def __init__(self):
         self.address_landmarks = None  # Reference position (first frame or manual set)
 
+    @property
+    def address_landmarks(self) -> Optional[Dict]:
+        return self._address_landmarks
+
+    @address_landmarks.setter
+    def address_landmarks(self, landmarks: Optional[Dict]):
+        # Cache the address reference x positions; they are the same for every frame
+        self._address_landmarks = landmarks
+        hip = self.calculate_hip_center(landmarks)
+        nose = landmarks.get('nose') if landmarks is not None else None
+        self._address_hip_x = hip[0] if hip is not None else None
+        self._address_nose_x = nose['x'] if nose is not None else None
+
     def set_address_position(self, landmarks: Dict):
         """Set the address position as reference for all measurements"""
         self.address_landmarks = landmarks
@@ -70,13 +264,12 @@ class SwayCalculator:
         Positive = toward target, Negative = away from target.
         Returns pixels (or normalised if frame_width=1).
         """
-        if self.address_landmarks is None or landmarks is None:
+        if self._address_hip_x is None or landmarks is None:
             return None
         current_hip = self.calculate_hip_center(landmarks)
-        address_hip = self.calculate_hip_center(self.address_landmarks)
-        if current_hip is None or address_hip is None:
+        if current_hip is None:
             return None
-        return (current_hip[0] - address_hip[0]) * frame_width
+        return (current_hip[0] - self._address_hip_x) * frame_width
 
     def calculate_shoulder_turn(self, landmarks: Dict) -> Optional[float]:
         """
@@ -92,7 +285,7 @@ class SwayCalculator:
             return None
         shoulder_width = abs(rs['x'] - ls['x'])
         z_diff = rs['z'] - ls['z']
-        return np.degrees(np.arctan2(z_diff, shoulder_width))
+        return math.atan2(z_diff, shoulder_width) * _RAD2DEG
 
     def calculate_hip_turn(self, landmarks: Dict) -> Optional[float]:
         """Hip rotation angle in degrees (same method as shoulder turn)."""
@@ -104,7 +297,7 @@ class SwayCalculator:
             return None
         hip_width = abs(rh['x'] - lh['x'])
         z_diff = rh['z'] - lh['z']
-        return np.degrees(np.arctan2(z_diff, hip_width))
+        return math.atan2(z_diff, hip_width) * _RAD2DEG
 
     def calculate_x_factor(self, landmarks: Dict) -> Optional[float]:
         """X-Factor = |shoulder_turn - hip_turn| (degrees)."""
@@ -124,13 +317,12 @@ class SwayCalculator:
         Tracks the nose landmark. Positive = toward target.
         Returns pixels.
         """
-        if self.address_landmarks is None or landmarks is None:
+        if self._address_nose_x is None or landmarks is None:
             return None
         nose = landmarks.get('nose')
-        addr_nose = self.address_landmarks.get('nose')
-        if nose is None or addr_nose is None:
+        if nose is None:
             return None
-        return (nose['x'] - addr_nose['x']) * frame_width
+        return (nose['x'] - self._address_nose_x) * frame_width
 
     def calculate_spine_tilt(self, landmarks: Dict) -> Optional[float]:
         """
@@ -147,7 +339,7 @@ class SwayCalculator:
         dy = sc[1] - hc[1]  # y increases downward in image
         # Angle from vertical (straight up would be dx=0, dy<0)
         # atan2(dx, -dy) gives angle from vertical; positive = leaning right in image
-        return math.degrees(math.atan2(dx, -dy))
+        return math.atan2(dx, -dy) * _RAD2DEG
 
     def calculate_knee_flex(self, landmarks: Dict) -> Optional[float]:
         """
@@ -206,7 +398,7 @@ class SwayCalculator:
         dy = sc[1] - hc[1]
         # In DTL view the forward bend shows as x displacement
         # Angle from vertical
-        return math.degrees(math.atan2(abs(dx), abs(dy)))
+        return math.atan2(abs(dx), abs(dy)) * _RAD2DEG
 
     def calculate_lead_arm_angle(self, landmarks: Dict) -> Optional[float]:
         """
@@ -232,75 +424,74 @@ class SwayCalculator:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def detect_swing_phases(shoulder_turn: List[Optional[float]],
-                            sway: List[Optional[float]]) -> List[str]:
-        """
-        Label each frame with a swing phase.
-        Phases: Address, Backswing, Top, Downswing, Impact, Follow-through.
-        Heuristic based on shoulder turn profile.
-        """
+    def _phase_codes(shoulder_turn: List[Optional[float]]) -> np.ndarray:
+        """Swing phase of each frame as an int8 index into PHASE_NAMES."""
         n = len(shoulder_turn)
-        phases = ['Address'] * n
-
-        # Find valid shoulder turn values (replace None with 0)
-        st = [v if v is not None else 0.0 for v in shoulder_turn]
+        codes = np.full(n, _PHASE_ADDRESS, dtype=np.int8)
 
         if n < 5:
-            return phases
+            return codes
+
+        # Find valid shoulder turn values (replace None with 0)
+        st = np.array([v if v is not None else 0.0 for v in shoulder_turn], dtype=np.float64)
 
-        # Smooth with a small window
+        # Smooth with a small window: mean over the in-bounds neighbours,
+        # so the two edge frames average over two values rather than three
         kernel = 3
-        smoothed = []
-        for i in range(n):
-            lo = max(0, i - kernel // 2)
-            hi = min(n, i + kernel // 2 + 1)
-            smoothed.append(sum(st[lo:hi]) / (hi - lo))
+        ones = np.ones(kernel)
+        smoothed = np.convolve(st, ones, mode='same') / np.convolve(np.ones(n), ones, mode='same')
 
         # Find peak shoulder turn (top of backswing)
-        top_idx = int(np.argmax(smoothed))
+        top_idx = int(smoothed.argmax())
 
         # Find minimum shoulder turn after top (closest to impact)
-        post_top = smoothed[top_idx:]
-        if len(post_top) > 2:
-            impact_offset = int(np.argmin(post_top))
-            impact_idx = top_idx + impact_offset
+        if n - top_idx > 2:
+            impact_idx = top_idx + int(smoothed[top_idx:].argmin())
         else:
             impact_idx = min(top_idx + 1, n - 1)
 
         # Address = first ~10% of frames before significant movement
-        threshold = max(smoothed) * 0.1 if max(smoothed) > 0 else 1.0
-        address_end = 0
-        for i in range(min(top_idx, n)):
-            if abs(smoothed[i] - smoothed[0]) > threshold:
-                address_end = i
-                break
-
-        # Label phases
-        for i in range(n):
-            if i <= address_end:
-                phases[i] = 'Address'
-            elif i < top_idx:
-                phases[i] = 'Backswing'
-            elif i == top_idx:
-                phases[i] = 'Top'
-            elif i < impact_idx:
-                phases[i] = 'Downswing'
-            elif i == impact_idx:
-                phases[i] = 'Impact'
-            else:
-                phases[i] = 'Follow-through'
+        peak = smoothed[top_idx]
+        threshold = peak * 0.1 if peak > 0 else 1.0
+        moved = np.flatnonzero(np.abs(smoothed[:top_idx] - smoothed[0]) > threshold)
+        address_end = int(moved[0]) if moved.size else 0
+
+        # Label phases, later assignments taking precedence
+        codes[:] = _PHASE_FOLLOW_THROUGH
+        codes[:impact_idx] = _PHASE_DOWNSWING
+        codes[impact_idx] = _PHASE_IMPACT
+        codes[top_idx] = _PHASE_TOP
+        codes[:top_idx] = _PHASE_BACKSWING
+        codes[:address_end + 1] = _PHASE_ADDRESS
+        return codes
 
-        return phases
+    @staticmethod
+    def detect_swing_phases(shoulder_turn: List[Optional[float]],
+                            sway: List[Optional[float]]) -> List[str]:
+        """
+        Label each frame with a swing phase.
+        Phases: Address, Backswing, Top, Downswing, Impact, Follow-through.
+        Heuristic based on shoulder turn profile.
+        """
+        codes = SwayCalculator._phase_codes(shoulder_turn)
+        return [PHASE_NAMES[c] for c in codes.tolist()]
 
     @staticmethod
-    def calculate_tempo(phases: List[str]) -> Optional[float]:
+    def calculate_tempo(phases) -> Optional[float]:
         """
         Tempo ratio = backswing frames / downswing frames.
         Pros average ~3:1.
+        Accepts phase names or an int8 array of phase codes.
         Returns None if either phase has 0 frames.
         """
-        backswing = sum(1 for p in phases if p == 'Backswing')
-        downswing = sum(1 for p in phases if p == 'Downswing')
+        if isinstance(phases, np.ndarray):
+            counts = np.bincount(phases, minlength=len(PHASE_NAMES))
+            backswing = int(counts[_PHASE_BACKSWING])
+            downswing = int(counts[_PHASE_DOWNSWING])
+        else:
+            counts = Counter(phases)
+            backswing = counts['Backswing']
+            downswing = counts['Downswing']
         if downswing == 0:
             return None
         return round(backswing / downswing, 2)
@@ -309,103 +500,134 @@ class SwayCalculator:
     # Full sequence analysis
     # ------------------------------------------------------------------
 
-    def analyze_sequence(self, landmarks_sequence: List[Dict], frame_width: int = 1) -> Dict:
+    def analyze_sequence(self, landmarks_sequence: List[Dict], frame_width: int = 1,
+                         address_frame_idx: Optional[int] = None) -> Dict:
         """
         Analyze a full swing sequence.
 
         Args:
-            landmarks_sequence: List of landmarks for each frame
+            landmarks_sequence: List of landmarks for each frame, an (N, K, 4)
+                                float array in LANDMARK_NAMES row order (NaN
+                                where missing), or an array from pack_landmarks
             frame_width: Frame width for scaling sway/head_sway to pixels
+            address_frame_idx: Index of the address frame, if already known.
+                               Default: first frame with landmarks.
 
         Returns:
             Dictionary with per-frame arrays and summary statistics
         """
-        # Set first valid frame as address position
-        for landmarks in landmarks_sequence:
-            if landmarks is not None:
-                self.set_address_position(landmarks)
-                break
+        # All metrics are computed on one stacked (N, K, 4) landmark array
+        if isinstance(landmarks_sequence, np.ndarray):
+            if landmarks_sequence.dtype == np.int16:
+                arr = _unpack_array(landmarks_sequence)
+            else:
+                arr = np.asarray(landmarks_sequence, dtype=np.float64)
+            present = ~np.isnan(arr[:, :, 0]).all(axis=1)
+        else:
+            arr = _stack_landmarks(landmarks_sequence)
+            present = np.array([lm is not None for lm in landmarks_sequence], dtype=bool)
+
+        # Set first valid frame (or the caller's choice) as address position
+        if address_frame_idx is not None:
+            if not present[address_frame_idx]:
+                raise ValueError(f"Address frame {address_frame_idx} has no landmarks")
+            address_idx = address_frame_idx % len(arr)
+        else:
+            valid_idx = np.flatnonzero(present)
+            address_idx = int(valid_idx[0]) if valid_idx.size else None
+        if address_idx is not None:
+            if isinstance(landmarks_sequence, np.ndarray):
+                self.set_address_position(_array_to_landmarks(arr[address_idx:address_idx + 1])[0])
+            else:
+                self.set_address_position(landmarks_sequence[address_idx])
+
+        shoulder_center = (arr[:, _LSH, :2] + arr[:, _RSH, :2]) * 0.5
+        hip_center = (arr[:, _LHIP, :2] + arr[:, _RHIP, :2]) * 0.5
+        sway, shoulder_turn, hip_turn, x_factor = _core_metrics(
+            arr, -1 if address_idx is None else address_idx, frame_width)
+
+        # Head sway: nose x relative to the address frame's nose
+        nose_x = arr[:, _NOSE, 0]
+        head_sway = (nose_x - (nose_x[address_idx] if address_idx is not None else np.nan)) * frame_width
+
+        # Spine tilt (frontal) and spine angle (sagittal) share the same vector
+        dx = shoulder_center[:, 0] - hip_center[:, 0]
+        dy = shoulder_center[:, 1] - hip_center[:, 1]  # y increases downward in image
+        knee_y, knee_x, knee_degenerate = _angle_terms(
+            arr[:, _LHIP, :2], arr[:, _LKNEE, :2], arr[:, _LANK, :2])
+        arm_y, arm_x, arm_degenerate = _angle_terms(
+            arr[:, _LSH, :2], arr[:, _LELB, :2], arr[:, _LWRI, :2])
+
+        # All four angles in a single arctan2 pass over a (4, N) stack
+        spine_tilt, spine_angle, knee_flex, lead_arm = np.degrees(np.arctan2(
+            np.stack((dx, np.abs(dx), knee_y, arm_y)),
+            np.stack((-dy, np.abs(dy), knee_x, arm_x)),
+        ))
+        knee_flex[knee_degenerate] = np.nan
+        lead_arm[arm_degenerate] = np.nan
+
+        # Weight shift: hip center between the ankles, 50% when they overlap.
+        # Branchless: "0 * hip_offset" carries NaN from missing landmarks into
+        # the 50% branch, so no separate masking pass is needed.
+        right_ankle_x = arr[:, _RANK, 0]
+        ankle_span = arr[:, _LANK, 0] - right_ankle_x
+        hip_offset = hip_center[:, 0] - right_ankle_x
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = np.clip(hip_offset / ankle_span * 100.0, 0.0, 100.0)
+        weight_shift = np.where(np.abs(ankle_span) < 1e-6, 50.0 + 0.0 * hip_offset, pct)
 
         results = {
             # Existing
-            'sway': [],
-            'shoulder_turn': [],
-            'hip_turn': [],
-            'x_factor': [],
-            'shoulder_center': [],
-            'hip_center': [],
+            'sway': _to_list(sway),
+            'shoulder_turn': _to_list(shoulder_turn),
+            'hip_turn': _to_list(hip_turn),
+            'x_factor': _to_list(x_factor),
+            'shoulder_center': _points_to_list(shoulder_center),
+            'hip_center': _points_to_list(hip_center),
             # New
-            'head_sway': [],
-            'spine_tilt': [],
-            'knee_flex': [],
-            'weight_shift': [],
-            'spine_angle': [],
-            'lead_arm_angle': [],
+            'head_sway': _to_list(head_sway),
+            'spine_tilt': _to_list(spine_tilt),
+            'knee_flex': _to_list(knee_flex),
+            'weight_shift': _to_list(weight_shift),
+            'spine_angle': _to_list(spine_angle),
+            'lead_arm_angle': _to_list(lead_arm),
         }
 
-        for landmarks in landmarks_sequence:
-            results['sway'].append(self.calculate_lateral_sway(landmarks, frame_width))
-            results['shoulder_turn'].append(self.calculate_shoulder_turn(landmarks))
-            results['hip_turn'].append(self.calculate_hip_turn(landmarks))
-            results['x_factor'].append(self.calculate_x_factor(landmarks))
-            results['shoulder_center'].append(self.calculate_shoulder_center(landmarks))
-            results['hip_center'].append(self.calculate_hip_center(landmarks))
-            # New
-            results['head_sway'].append(self.calculate_head_sway(landmarks, frame_width))
-            results['spine_tilt'].append(self.calculate_spine_tilt(landmarks))
-            results['knee_flex'].append(self.calculate_knee_flex(landmarks))
-            results['weight_shift'].append(self.calculate_weight_shift(landmarks))
-            results['spine_angle'].append(self.calculate_spine_angle(landmarks))
-            results['lead_arm_angle'].append(self.calculate_lead_arm_angle(landmarks))
-
         # --- Swing phases and tempo ---
-        results['phases'] = self.detect_swing_phases(results['shoulder_turn'], results['sway'])
-        results['tempo'] = self.calculate_tempo(results['phases'])
+        phase_codes = self._phase_codes(results['shoulder_turn'])
+        results['phases'] = [PHASE_NAMES[c] for c in phase_codes.tolist()]
+        results['tempo'] = self.calculate_tempo(phase_codes)
 
         # --- Summary statistics ---
-        def _valid(arr):
-            return [v for v in arr if v is not None]
-
-        valid_sway = _valid(results['sway'])
-        valid_shoulder = _valid(results['shoulder_turn'])
-        valid_hip = _valid(results['hip_turn'])
-        valid_xfactor = _valid(results['x_factor'])
-        valid_head = _valid(results['head_sway'])
-        valid_tilt = _valid(results['spine_tilt'])
-        valid_knee = _valid(results['knee_flex'])
-        valid_weight = _valid(results['weight_shift'])
-        valid_spine_a = _valid(results['spine_angle'])
-        valid_arm = _valid(results['lead_arm_angle'])
-
         # Address values for "change" metrics
-        addr_spine_angle = valid_spine_a[0] if valid_spine_a else None
-        addr_knee_flex = valid_knee[0] if valid_knee else None
+        addr_spine_angle = _nan_first(spine_angle)
+        addr_knee_flex = _nan_first(knee_flex)
 
         results['summary'] = {
             # Existing
-            'max_sway_left': min(valid_sway) if valid_sway else None,
-            'max_sway_right': max(valid_sway) if valid_sway else None,
-            'max_shoulder_turn': max(valid_shoulder) if valid_shoulder else None,
-            'max_hip_turn': max(valid_hip) if valid_hip else None,
-            'max_x_factor': max(valid_xfactor) if valid_xfactor else None,
+            'max_sway_left': _nan_min(sway),
+            'max_sway_right': _nan_max(sway),
+            'max_shoulder_turn': _nan_max(shoulder_turn),
+            'max_hip_turn': _nan_max(hip_turn),
+            'max_x_factor': _nan_max(x_factor),
             # Head sway
-            'max_head_sway_left': min(valid_head) if valid_head else None,
-            'max_head_sway_right': max(valid_head) if valid_head else None,
+            'max_head_sway_left': _nan_min(head_sway),
+            'max_head_sway_right': _nan_max(head_sway),
             # Spine tilt (frontal)
-            'min_spine_tilt': min(valid_tilt) if valid_tilt else None,
-            'max_spine_tilt': max(valid_tilt) if valid_tilt else None,
+            'min_spine_tilt': _nan_min(spine_tilt),
+            'max_spine_tilt': _nan_max(spine_tilt),
             # Spine angle (sagittal / posture)
             'address_spine_angle': addr_spine_angle,
-            'max_spine_angle_change': (max(abs(v - addr_spine_angle) for v in valid_spine_a)
-                                       if valid_spine_a and addr_spine_angle is not None else None),
+            'max_spine_angle_change': (_nan_max(np.abs(spine_angle - addr_spine_angle))
+                                       if addr_spine_angle is not None else None),
             # Lead arm
-            'min_lead_arm_angle': min(valid_arm) if valid_arm else None,
+            'min_lead_arm_angle': _nan_min(lead_arm),
             # Knee flex
             'address_knee_flex': addr_knee_flex,
-            'max_knee_flex_change': (max(abs(v - addr_knee_flex) for v in valid_knee)
-                                     if valid_knee and addr_knee_flex is not None else None),
+            'max_knee_flex_change': (_nan_max(np.abs(knee_flex - addr_knee_flex))
+                                     if addr_knee_flex is not None else None),
             # Weight shift
-            'max_weight_shift_forward': max(valid_weight) if valid_weight else None,
+            'max_weight_shift_forward': _nan_max(weight_shift),
             # Tempo
             'tempo_ratio': results['tempo'],
         }
@@ -10,12 +10,37 @@ State machine:
     IDLE -> MOTION_DETECTED -> RECORDING -> COOLDOWN -> IDLE
 """
 
+import math
+import statistics
+import threading
 import time
-import numpy as np
 from collections import deque
 from typing import Optional
 
 from pose_processor import PoseProcessor
+from sway_calculator import LANDMARK_NAMES
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_LSH = LANDMARK_NAMES.index('left_shoulder')
+_RSH = LANDMARK_NAMES.index('right_shoulder')
+_RAD2DEG = 180.0 / math.pi
+
+
+def _shoulder_turn_scalar(lsx: float, lsz: float, rsx: float, rsz: float) -> float:
+    """Shoulder turn in degrees, NaN when the shoulders overlap in x."""
+    width = abs(rsx - lsx)
+    if width < 1e-9:
+        return math.nan
+    return math.atan2(rsz - lsz, width) * _RAD2DEG
+
+
+if njit is not None:
+    _shoulder_turn_scalar = njit(cache=True)(_shoulder_turn_scalar)
+    _shoulder_turn_scalar(0.0, 0.0, 1.0, 0.0)  # compile now, not on the first live frame
 
 
 class SwingDetector:
@@ -27,6 +52,14 @@ class SwingDetector:
     RECORDING = 'recording'
     COOLDOWN = 'cooldown'
 
+    # Longest gap (seconds) between pose checks while idle, however the
+    # frame skipping works out at low frame rates
+    MAX_IDLE_GAP = 0.25
+
+    # Monotonic clock that paces idle pose checks; tests pin it to make the
+    # frame skipping independent of how fast they run
+    _now = staticmethod(time.monotonic)
+
     def __init__(
         self,
         motion_threshold: float = 15.0,
@@ -34,6 +67,7 @@ class SwingDetector:
         cooldown_seconds: float = 2.0,
         window_size: int = 10,
         model_complexity: int = 0,
+        idle_skip: int = 2,
     ):
         """
         Args:
@@ -45,25 +79,34 @@ class SwingDetector:
                               recording stops.
             window_size: Number of recent shoulder-turn values to keep.
             model_complexity: MediaPipe model complexity (0=lite for speed).
+            idle_skip: Frames to skip between pose checks while idle or
+                       cooling down. Every frame is checked once motion
+                       is seen.
         """
         self.motion_threshold = motion_threshold
         self.confirmation_frames = confirmation_frames
         self.cooldown_seconds = cooldown_seconds
         self.window_size = window_size
         self.model_complexity = model_complexity
+        self.idle_skip = idle_skip
 
         # State
         self.state = self.IDLE
         self._confirm_count = 0
         self._cooldown_start: Optional[float] = None
+        self._frame_counter = 0
+        self._last_checked = 0.0
 
         # Shoulder-turn tracking
         self._baseline: Optional[float] = None
         self._history: deque = deque(maxlen=window_size)
         self._current_turn: Optional[float] = None
 
-        # Pose processor (lazy-init on first frame)
+        # Pose processor (lazy-init on first frame). The lock keeps release()
+        # from another thread from closing it mid-inference.
         self._processor: Optional[PoseProcessor] = None
+        self._processor_lock = threading.Lock()
+        self._released = False
         self._model_complexity = model_complexity
 
     # ------------------------------------------------------------------
@@ -79,6 +122,16 @@ class SwingDetector:
             "start" -- swing detected, start recording
             "stop"  -- swing ended, stop recording
         """
+        # Pose inference dominates the cost; while nothing is moving only
+        # every (idle_skip + 1)-th frame is worth checking
+        self._frame_counter += 1
+        now = self._now()
+        if (self.state in (self.IDLE, self.COOLDOWN)
+                and self._frame_counter % (self.idle_skip + 1)
+                and now - self._last_checked < self.MAX_IDLE_GAP):
+            return None
+        self._last_checked = now
+
         turn = self._get_shoulder_turn(frame)
         if turn is None:
             return None
@@ -89,7 +142,7 @@ class SwingDetector:
         # Establish baseline from first few stable readings
         if self._baseline is None:
             if len(self._history) >= 3:
-                self._baseline = float(np.median(list(self._history)))
+                self._baseline = float(statistics.median(self._history))
             return None
 
         delta = abs(turn - self._baseline)
@@ -139,7 +192,7 @@ class SwingDetector:
                 self.state = self.IDLE
                 self._cooldown_start = None
                 # Re-baseline after the swing settles
-                self._baseline = float(np.median(list(self._history)))
+                self._baseline = float(statistics.median(self._history))
                 return 'stop'
             return None
 
@@ -150,15 +203,21 @@ class SwingDetector:
         self.state = self.IDLE
         self._confirm_count = 0
         self._cooldown_start = None
+        self._frame_counter = 0
+        self._last_checked = 0.0
         self._baseline = None
         self._history.clear()
         self._current_turn = None
 
     def release(self):
-        """Release the MediaPipe resources."""
-        if self._processor is not None:
-            self._processor.release()
-            self._processor = None
+        """Release the MediaPipe resources. The detector stops checking poses."""
+        with self._processor_lock:
+            # A capture thread may still hold this detector; it must not
+            # build a new landmarker after this point
+            self._released = True
+            if self._processor is not None:
+                self._processor.release()
+                self._processor = None
 
     def get_status(self) -> dict:
         """Return a JSON-serialisable status dict for the API."""
@@ -180,25 +239,22 @@ class SwingDetector:
 
     def _get_shoulder_turn(self, frame) -> Optional[float]:
         """Run lightweight pose detection and compute shoulder turn angle."""
-        if self._processor is None:
-            self._processor = PoseProcessor(model_complexity=self._model_complexity)
-
-        results, _ = self._processor.process_frame(frame)
+        with self._processor_lock:
+            if self._released:
+                return None
+            if self._processor is None:
+                self._processor = PoseProcessor(model_complexity=self._model_complexity)
 
-        if results.pose_landmarks is None:
-            return None
+            results, _ = self._processor.process_frame(frame)
 
-        landmarks = self._processor._extract_landmarks(results.pose_landmarks)
-        if landmarks is None:
-            return None
+            if results.pose_landmarks is None:
+                return None
 
-        ls = landmarks.get('left_shoulder')
-        rs = landmarks.get('right_shoulder')
-        if ls is None or rs is None:
+            lm = self._processor._extract_landmark_array(results.pose_landmarks)
+        lsx, _, lsz, _ = lm[_LSH].tolist()
+        rsx, _, rsz, _ = lm[_RSH].tolist()
+        if math.isnan(lsx) or math.isnan(rsx):
             return None
 
-        shoulder_width = abs(rs['x'] - ls['x'])
-        if shoulder_width < 1e-9:
-            return None
-        z_diff = rs['z'] - ls['z']
-        return float(np.degrees(np.arctan2(z_diff, shoulder_width)))
+        turn = _shoulder_turn_scalar(lsx, lsz, rsx, rsz)
+        return None if math.isnan(turn) else turn
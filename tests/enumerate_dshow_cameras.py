@@ -5,6 +5,55 @@ Enumerate DirectShow cameras and try to match device paths
 import cv2
 import sys
 
+
+def _probe_camera(i):
+    """Open camera index i; returns (camera info or None, status message)"""
+    try:
+        cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
+        
+        if not cap.isOpened():
+            return None, "[X] - Cannot open"
+        try:
+            # DirectShow reports the negotiated format without streaming, so
+            # grab one frame to prove the device delivers; it is only decoded
+            # when the driver does not report a frame size
+            if not cap.grab():
+                return None, "[X] - Opened but cannot read frames"
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            if width <= 0 or height <= 0:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    return None, "[X] - Opened but cannot read frames"
+                height, width = frame.shape[:2]
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            backend = cap.getBackendName()
+            info = {
+                'index': i,
+                'width': width,
+                'height': height,
+                'fps': fps,
+                'backend': backend
+            }
+            return info, f"[OK] - {width}x{height} @ {fps}fps, Backend: {backend}"
+        finally:
+            cap.release()
+    except Exception as e:
+        return None, f"[ERROR] - {e}"
+
+
+def _probe_path(path):
+    """True if the device path opens and delivers a frame"""
+    try:
+        cap = cv2.VideoCapture(path, cv2.CAP_DSHOW)
+        try:
+            return cap.isOpened() and cap.read()[0]
+        finally:
+            cap.release()
+    except:
+        return False
+
+
 def enumerate_cameras():
     """Try to enumerate and test all available cameras"""
     print("=" * 60)
@@ -16,37 +65,16 @@ def enumerate_cameras():
     print(f"Looking for camera with path: {target_path}")
     print()
     
-    # Try cameras 0-10
+    # Try cameras 0-10, one at a time: OpenCV's DirectShow backend is not
+    # known to be safe to open from several threads at once
     working_cameras = []
     
     for i in range(10):
-        try:
-            print(f"Testing camera index {i}...", end=" ")
-            cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
-            
-            if cap.isOpened():
-                ret, frame = cap.read()
-                if ret:
-                    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    fps = cap.get(cv2.CAP_PROP_FPS)
-                    backend = cap.getBackendName()
-                    
-                    print(f"[OK] - {width}x{height} @ {fps}fps, Backend: {backend}")
-                    working_cameras.append({
-                        'index': i,
-                        'width': width,
-                        'height': height,
-                        'fps': fps,
-                        'backend': backend
-                    })
-                else:
-                    print("[X] - Opened but cannot read frames")
-                cap.release()
-            else:
-                print("[X] - Cannot open")
-        except Exception as e:
-            print(f"[ERROR] - {e}")
+        print(f"Testing camera index {i}...", end=" ")
+        info, message = _probe_camera(i)
+        print(message)
+        if info is not None:
+            working_cameras.append(info)
     
     print()
     print("=" * 60)
@@ -73,17 +101,9 @@ def enumerate_cameras():
     ]
     
     for alt_path in alternative_paths:
-        try:
-            cap = cv2.VideoCapture(alt_path, cv2.CAP_DSHOW)
-            if cap.isOpened():
-                ret, frame = cap.read()
-                if ret:
-                    print(f"[OK] Found working path format: {alt_path}")
-                    cap.release()
-                    return alt_path
-                cap.release()
-        except:
-            pass
+        if _probe_path(alt_path):
+            print(f"[OK] Found working path format: {alt_path}")
+            return alt_path
     
     print("[X] No alternative path format worked")
     return None
@@ -5,6 +5,8 @@ Find camera index from device path
 import cv2
 import sys
 
+from test_utils import available_camera_indices
+
 def find_camera_by_path(target_path: str):
     """Try to find camera index that matches the given device path"""
     print(f"Looking for camera with path: {target_path}")
@@ -31,21 +33,14 @@ def find_camera_by_path(target_path: str):
     
     # Try to enumerate cameras and check their backends
     print("\nEnumerating cameras by index...")
-    for i in range(10):
+    for i in available_camera_indices(cv2.CAP_DSHOW):
         try:
             cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)  # Try DirectShow backend
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Read a fresh frame, not a queued one
             if cap.isOpened():
                 backend = cap.getBackendName()
                 print(f"  Camera {i}: Backend={backend}", end="")
                 
-                # Try to get device info if available
-                try:
-                    # Some backends support getting device path
-                    backend_name = cap.getBackendName()
-                    print(f", Backend={backend_name}")
-                except:
-                    pass
-                
                 ret, frame = cap.read()
                 if ret:
                     print(f" [OK] - Can read frames ({frame.shape[1]}x{frame.shape[0]})")
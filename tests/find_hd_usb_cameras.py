@@ -2,8 +2,12 @@
 Find the 2 HD USB cameras (exclude built-in system camera)
 """
 
+import argparse
 import cv2
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from test_utils import available_camera_indices
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -14,6 +18,7 @@ def test_camera_detailed(index):
     """Test a camera and get detailed info"""
     try:
         cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Read a fresh frame, not a queued one
         
         if not cap.isOpened():
             return None
@@ -30,7 +35,9 @@ def test_camera_detailed(index):
         fps = cap.get(cv2.CAP_PROP_FPS)
         backend = cap.getBackendName()
         
-        # Test if it supports 60fps at 720p
+        # Test if it supports 60fps at 720p. Ask for MJPEG first; most USB
+        # cameras only reach 720p60 compressed, uncompressed YUYV tops out lower
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
         cap.set(cv2.CAP_PROP_FPS, 60)
@@ -42,16 +49,19 @@ def test_camera_detailed(index):
         # Test frame capture rate at 60fps
         frame_count = 0
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         test_duration = 1.0
-        
-        while time.time() - start_time < test_duration:
-            ret, _ = cap.read()
-            if ret:
+        deadline = start_time + test_duration
+        
+        # grab() only advances the stream; nothing is decoded, so the count
+        # reflects the camera's cadence rather than the decoder's. No sleep:
+        # grab() blocks until the next frame, and a 1 ms sleep can take ~15 ms
+        # on Windows.
+        while (now := time.perf_counter()) < deadline:
+            if cap.grab():
                 frame_count += 1
-            time.sleep(0.001)
         
-        measured_fps = frame_count / (time.time() - start_time)
+        measured_fps = frame_count / (now - start_time)
         
         cap.release()
         
@@ -78,7 +88,47 @@ def test_camera_detailed(index):
     except Exception as e:
         return None
 
-def main():
+def verify_simultaneous_access(cam1, cam2):
+    """Open both cameras at 720p@60 and grab a frame from each at the same time"""
+    print()
+    print("Testing simultaneous access...")
+    cap1 = cv2.VideoCapture(cam1, cv2.CAP_DSHOW)
+    cap2 = cv2.VideoCapture(cam2, cv2.CAP_DSHOW)
+    
+    if cap1.isOpened() and cap2.isOpened():
+        for cap in (cap1, cap2):
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+            cap.set(cv2.CAP_PROP_FPS, 60)
+        
+        # Grab on both cameras concurrently so a serial read does not hide
+        # a camera that only delivers when the other one is idle
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            grabbed = list(ex.map(lambda cap: cap.grab(), (cap1, cap2)))
+        ret1, frame1 = cap1.retrieve() if grabbed[0] else (False, None)
+        ret2, frame2 = cap2.retrieve() if grabbed[1] else (False, None)
+        
+        if ret1 and ret2:
+            print("[OK] Both HD USB cameras can be accessed simultaneously at 60fps!")
+            print(f"  Camera {cam1}: {frame1.shape[1]}x{frame1.shape[0]}")
+            print(f"  Camera {cam2}: {frame2.shape[1]}x{frame2.shape[0]}")
+        else:
+            print("[WARNING] Cameras opened but cannot read frames simultaneously")
+    else:
+        print("[WARNING] Cannot open both cameras simultaneously")
+    
+    cap1.release()
+    cap2.release()
+
+def main(max_workers=4, verify_simul=False, verbose=False):
+    """
+    Probe the cameras present at indices 0-9. Probes run max_workers at a time; each spends its
+    1-second FPS measurement waiting on the device. Use max_workers=1 if
+    simultaneous HD streams saturate the USB bus and skew measured_fps.
+    verify_simul additionally opens the two chosen cameras together;
+    verbose prints the full details for every camera.
+    """
     print("=" * 70)
     print("HD USB Camera Finder")
     print("=" * 70)
@@ -87,22 +137,23 @@ def main():
     print("(Excluding built-in system camera)")
     print()
     
-    cameras = []
-    hd_usb_cameras = []
+    # Test the cameras present at indices 0-9
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        results = list(ex.map(test_camera_detailed, available_camera_indices(cv2.CAP_DSHOW)))
     
-    # Test cameras 0-9
-    for i in range(10):
-        info = test_camera_detailed(i)
-        if info:
-            cameras.append(info)
-            if info['supports_720p_60fps']:
-                hd_usb_cameras.append(info)
+    # map() keeps index order, so the result lists are deterministic
+    cameras = [info for info in results if info]
+    hd_usb_cameras = [info for info in cameras if info['supports_720p_60fps']]
     
     print(f"Found {len(cameras)} total camera(s):")
     print()
     
     for cam in cameras:
         status = "[HD USB]" if cam['supports_720p_60fps'] else "[Built-in/Other]"
+        if not verbose:
+            print(f"Camera {cam['index']}: {status} {cam['width']}x{cam['height']}, "
+                  f"measured {cam['measured_fps']:.1f} FPS")
+            continue
         print(f"Camera {cam['index']}: {status}")
         print(f"  Current: {cam['width']}x{cam['height']}")
         print(f"  Supports 720p@60fps: {cam['supports_720p_60fps']}")
@@ -110,6 +161,8 @@ def main():
             print(f"  Actual FPS at 720p: {cam['actual_fps_at_720p']:.1f}")
             print(f"  Measured capture rate: {cam['measured_fps']:.1f} FPS")
         print()
+    if cameras and not verbose:
+        print()
     
     print("=" * 70)
     
@@ -129,34 +182,11 @@ def main():
         print("Or update your code to use:")
         print(f"  recorder = DualCameraRecorder(camera1_id={cam1}, camera2_id={cam2})")
         
-        # Test simultaneous access
-        print()
-        print("Testing simultaneous access...")
-        cap1 = cv2.VideoCapture(cam1, cv2.CAP_DSHOW)
-        cap2 = cv2.VideoCapture(cam2, cv2.CAP_DSHOW)
-        
-        if cap1.isOpened() and cap2.isOpened():
-            cap1.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            cap1.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-            cap1.set(cv2.CAP_PROP_FPS, 60)
-            cap2.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            cap2.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-            cap2.set(cv2.CAP_PROP_FPS, 60)
-            
-            ret1, frame1 = cap1.read()
-            ret2, frame2 = cap2.read()
-            
-            if ret1 and ret2:
-                print("[OK] Both HD USB cameras can be accessed simultaneously at 60fps!")
-                print(f"  Camera {cam1}: {frame1.shape[1]}x{frame1.shape[0]}")
-                print(f"  Camera {cam2}: {frame2.shape[1]}x{frame2.shape[0]}")
-            else:
-                print("[WARNING] Cameras opened but cannot read frames simultaneously")
+        if verify_simul:
+            verify_simultaneous_access(cam1, cam2)
         else:
-            print("[WARNING] Cannot open both cameras simultaneously")
-        
-        cap1.release()
-        cap2.release()
+            print()
+            print("Run with --verify-simul to check both cameras stream together")
         
     elif len(hd_usb_cameras) == 1:
         print(f"[WARNING] Only found 1 HD USB camera (index {hd_usb_cameras[0]['index']})")
@@ -166,5 +196,11 @@ def main():
         print("Make sure your HD USB cameras are connected")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Find the 2 HD USB cameras")
+    parser.add_argument('--verify-simul', action='store_true',
+                        help="Also check that both cameras can stream at 720p@60 together")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Print full details for each camera")
+    args = parser.parse_args()
+    main(verify_simul=args.verify_simul, verbose=args.verbose)
 
@@ -17,38 +17,44 @@ sys.path.insert(0, os.path.join(project_root, 'scripts'))
 from camera_setup_recorder_gui import TabbedCameraGUI
 
 
+def setUpModule():
+    # No test here talks to a camera; patch cv2.VideoCapture once for all of them
+    patcher = patch('cv2.VideoCapture')
+    patcher.start()
+    unittest.addModuleCleanup(patcher.stop)
+
+
 class TestFrameNavigation(unittest.TestCase):
     """Test frame navigation in analysis tab"""
     
     def setUp(self):
         """Set up GUI with mock analysis data"""
-        with patch('cv2.VideoCapture'):
-            self.gui = TabbedCameraGUI()
+        self.gui = TabbedCameraGUI()
             
-            # Create mock analysis data with per-frame metrics
-            self.gui.analysis_camera1 = {
-                'sway': [0, -5, -10, -15, -12, -8, -5, 0, 5, 10, 8, 5, 0],  # 13 frames
-                'summary': {
-                    'max_sway_left': -15,
-                    'max_sway_right': 10
-                },
-                'detection_rate': 95.0
-            }
+        # Create mock analysis data with per-frame metrics
+        self.gui.analysis_camera1 = {
+            'sway': [0, -5, -10, -15, -12, -8, -5, 0, 5, 10, 8, 5, 0],  # 13 frames
+            'summary': {
+                'max_sway_left': -15,
+                'max_sway_right': 10
+            },
+            'detection_rate': 95.0
+        }
             
-            self.gui.analysis_camera2 = {
-                'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20, 10, 0],  # 11 frames
-                'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10, 5, 0],
-                'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10, 5, 0],
-                'summary': {
-                    'max_shoulder_turn': 45,
-                    'max_hip_turn': 25,
-                    'max_x_factor': 20
-                },
-                'detection_rate': 90.0
-            }
+        self.gui.analysis_camera2 = {
+            'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20, 10, 0],  # 11 frames
+            'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10, 5, 0],
+            'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10, 5, 0],
+            'summary': {
+                'max_shoulder_turn': 45,
+                'max_hip_turn': 25,
+                'max_x_factor': 20
+            },
+            'detection_rate': 90.0
+        }
             
-            self.gui.current_tab = 3  # Analysis tab
-            self.gui.analysis_frame_index = 0
+        self.gui.current_tab = 3  # Analysis tab
+        self.gui.analysis_frame_index = 0
     
     def test_frame_index_initialization(self):
         """Test that frame index is initialized to 0"""
@@ -121,8 +127,7 @@ class TestSummaryCorrectness(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI with test analysis data"""
-        with patch('cv2.VideoCapture'):
-            self.gui = TabbedCameraGUI()
+        self.gui = TabbedCameraGUI()
     
     def test_camera1_summary_structure(self):
         """Test that camera1 summary has correct structure"""
@@ -244,26 +249,25 @@ class TestLiveMetrics(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI with mock analysis data"""
-        with patch('cv2.VideoCapture'):
-            self.gui = TabbedCameraGUI()
+        self.gui = TabbedCameraGUI()
             
-            self.gui.analysis_camera1 = {
-                'sway': [0, -5, -10, -15, -10, -5, 0, 5, 10, 5, 0],
-                'summary': {'max_sway_left': -15, 'max_sway_right': 10}
-            }
+        self.gui.analysis_camera1 = {
+            'sway': [0, -5, -10, -15, -10, -5, 0, 5, 10, 5, 0],
+            'summary': {'max_sway_left': -15, 'max_sway_right': 10}
+        }
             
-            self.gui.analysis_camera2 = {
-                'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20, 10, 0],
-                'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10, 5, 0],
-                'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10, 5, 0],
-                'summary': {
-                    'max_shoulder_turn': 45,
-                    'max_hip_turn': 25,
-                    'max_x_factor': 20
-                }
+        self.gui.analysis_camera2 = {
+            'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20, 10, 0],
+            'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10, 5, 0],
+            'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10, 5, 0],
+            'summary': {
+                'max_shoulder_turn': 45,
+                'max_hip_turn': 25,
+                'max_x_factor': 20
             }
+        }
             
-            self.gui.analysis_frame_index = 0
+        self.gui.analysis_frame_index = 0
     
     def test_current_frame_sway(self):
         """Test getting current frame sway value"""
@@ -329,8 +333,7 @@ class TestAnalysisTabRendering(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI instance"""
-        with patch('cv2.VideoCapture'):
-            self.gui = TabbedCameraGUI()
+        self.gui = TabbedCameraGUI()
     
     def test_draw_analysis_tab_with_navigation(self):
         """Test analysis tab rendering with frame navigation"""
@@ -396,89 +399,86 @@ class TestPerVideoSummary(unittest.TestCase):
     
     def test_camera1_video_summary(self):
         """Test camera1 (face-on) video summary"""
-        with patch('cv2.VideoCapture'):
-            gui = TabbedCameraGUI()
+        gui = TabbedCameraGUI()
             
-            # Simulate analysis results for camera1
-            camera1_analysis = {
-                'sway': [-5, -10, -15, -10, -5, 0, 5, 10, 5, 0],
-                'summary': {
-                    'max_sway_left': -15,
-                    'max_sway_right': 10
-                },
-                'detection_rate': 95.0
-            }
+        # Simulate analysis results for camera1
+        camera1_analysis = {
+            'sway': [-5, -10, -15, -10, -5, 0, 5, 10, 5, 0],
+            'summary': {
+                'max_sway_left': -15,
+                'max_sway_right': 10
+            },
+            'detection_rate': 95.0
+        }
             
-            gui.analysis_camera1 = camera1_analysis
+        gui.analysis_camera1 = camera1_analysis
             
-            # Verify camera1 summary
-            summary1 = gui.analysis_camera1.get('summary', {})
-            self.assertIsNotNone(summary1)
-            self.assertIn('max_sway_left', summary1)
-            self.assertIn('max_sway_right', summary1)
-            self.assertEqual(summary1['max_sway_left'], -15)
-            self.assertEqual(summary1['max_sway_right'], 10)
+        # Verify camera1 summary
+        summary1 = gui.analysis_camera1.get('summary', {})
+        self.assertIsNotNone(summary1)
+        self.assertIn('max_sway_left', summary1)
+        self.assertIn('max_sway_right', summary1)
+        self.assertEqual(summary1['max_sway_left'], -15)
+        self.assertEqual(summary1['max_sway_right'], 10)
     
     def test_camera2_video_summary(self):
         """Test camera2 (down-the-line) video summary"""
-        with patch('cv2.VideoCapture'):
-            gui = TabbedCameraGUI()
+        gui = TabbedCameraGUI()
             
-            # Simulate analysis results for camera2
-            camera2_analysis = {
-                'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20, 10, 0],
-                'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10, 5, 0],
-                'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10, 5, 0],
-                'summary': {
-                    'max_shoulder_turn': 45,
-                    'max_hip_turn': 25,
-                    'max_x_factor': 20
-                },
-                'detection_rate': 90.0
-            }
+        # Simulate analysis results for camera2
+        camera2_analysis = {
+            'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20, 10, 0],
+            'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10, 5, 0],
+            'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10, 5, 0],
+            'summary': {
+                'max_shoulder_turn': 45,
+                'max_hip_turn': 25,
+                'max_x_factor': 20
+            },
+            'detection_rate': 90.0
+        }
             
-            gui.analysis_camera2 = camera2_analysis
+        gui.analysis_camera2 = camera2_analysis
             
-            # Verify camera2 summary
-            summary2 = gui.analysis_camera2.get('summary', {})
-            self.assertIsNotNone(summary2)
-            self.assertIn('max_shoulder_turn', summary2)
-            self.assertIn('max_hip_turn', summary2)
-            self.assertIn('max_x_factor', summary2)
-            self.assertEqual(summary2['max_shoulder_turn'], 45)
-            self.assertEqual(summary2['max_hip_turn'], 25)
-            self.assertEqual(summary2['max_x_factor'], 20)
+        # Verify camera2 summary
+        summary2 = gui.analysis_camera2.get('summary', {})
+        self.assertIsNotNone(summary2)
+        self.assertIn('max_shoulder_turn', summary2)
+        self.assertIn('max_hip_turn', summary2)
+        self.assertIn('max_x_factor', summary2)
+        self.assertEqual(summary2['max_shoulder_turn'], 45)
+        self.assertEqual(summary2['max_hip_turn'], 25)
+        self.assertEqual(summary2['max_x_factor'], 20)
     
     def test_both_videos_separate_summaries(self):
         """Test that both videos maintain separate summaries"""
-        with patch('cv2.VideoCapture'):
-            gui = TabbedCameraGUI()
+        gui = TabbedCameraGUI()
             
-            gui.analysis_camera1 = {
-                'sway': [-10, -5, 0],
-                'summary': {'max_sway_left': -10, 'max_sway_right': 0},
-                'detection_rate': 100.0
-            }
+        gui.analysis_camera1 = {
+            'sway': [-10, -5, 0],
+            'summary': {'max_sway_left': -10, 'max_sway_right': 0},
+            'detection_rate': 100.0
+        }
             
-            gui.analysis_camera2 = {
-                'shoulder_turn': [0, 30, 0],
-                'hip_turn': [0, 15, 0],
-                'x_factor': [0, 15, 0],
-                'summary': {
-                    'max_shoulder_turn': 30,
-                    'max_hip_turn': 15,
-                    'max_x_factor': 15
-                },
-                'detection_rate': 100.0
-            }
+        gui.analysis_camera2 = {
+            'shoulder_turn': [0, 30, 0],
+            'hip_turn': [0, 15, 0],
+            'x_factor': [0, 15, 0],
+            'summary': {
+                'max_shoulder_turn': 30,
+                'max_hip_turn': 15,
+                'max_x_factor': 15
+            },
+            'detection_rate': 100.0
+        }
             
-            # Verify summaries are independent
-            summary1 = gui.analysis_camera1['summary']
-            summary2 = gui.analysis_camera2['summary']
+        # Verify summaries are independent
+        summary1 = gui.analysis_camera1['summary']
+        summary2 = gui.analysis_camera2['summary']
             
-            self.assertNotEqual(summary1, summary2)
-            self.assertNotIn('max_shoulder_turn', summary1)
-            self.assertNotIn('max_sway_left', summary2)
+        self.assertNotEqual(summary1, summary2)
+        self.assertNotIn('max_shoulder_turn', summary1)
+        self.assertNotIn('max_sway_left', summary2)
 
 
 def run_analysis_tests():
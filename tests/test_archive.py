@@ -23,35 +23,29 @@ from flask_gui import (
     _load_archive_config, _save_archive_config,
     _load_archive_manifest, _save_archive_manifest,
     _archive_recording, _disk_usage,
-    _get_recordings_dir, _ARCHIVE_CONFIG_FILE,
+    _get_recordings_dir,
 )
 
 
 class TestArchiveConfig(unittest.TestCase):
     """Test archive config load/save helpers."""
 
-    def setUp(self):
-        self._orig = _ARCHIVE_CONFIG_FILE
-        self._tmp = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
-        self._tmp.close()
-        # Monkey-patch the config file path
-        import flask_gui
-        flask_gui._ARCHIVE_CONFIG_FILE = self._tmp.name
+    @classmethod
+    def setUpClass(cls):
+        cls._tmpdir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls._tmpdir)
 
-    def tearDown(self):
+    def setUp(self):
+        # Each test gets its own (not yet existing) config file path
         import flask_gui
-        flask_gui._ARCHIVE_CONFIG_FILE = self._orig
-        os.unlink(self._tmp.name)
+        path = os.path.join(self._tmpdir, f'{self._testMethodName}.json')
+        patcher = patch.object(flask_gui, '_ARCHIVE_CONFIG_FILE', path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_load_empty(self):
         """Returns empty dict when file doesn't exist."""
-        os.unlink(self._tmp.name)
-        import flask_gui
-        flask_gui._ARCHIVE_CONFIG_FILE = self._tmp.name + '.nonexistent'
         self.assertEqual(_load_archive_config(), {})
-        flask_gui._ARCHIVE_CONFIG_FILE = self._tmp.name
-        # recreate for tearDown
-        open(self._tmp.name, 'w').close()
 
     def test_save_and_load(self):
         config = {'archive_path': '/mnt/seagate/golf'}
@@ -86,25 +80,27 @@ class TestArchiveManifest(unittest.TestCase):
 class TestArchiveRecording(unittest.TestCase):
     """Test _archive_recording file copy logic."""
 
-    def setUp(self):
-        self._rec_dir = tempfile.mkdtemp()
-        self._archive_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        # The recording files are only read, so one set serves every test
+        cls._rec_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls._rec_dir)
 
         # Create fake recording files
         ts = '20260215_140000'
         for cam in ['camera1', 'camera2']:
-            path = os.path.join(self._rec_dir, f'recording_{ts}_{cam}.mp4')
+            path = os.path.join(cls._rec_dir, f'recording_{ts}_{cam}.mp4')
             with open(path, 'wb') as f:
                 f.write(b'fakevideodata_' + cam.encode())
 
         # Create fake analysis JSON
-        analysis_path = os.path.join(self._rec_dir, f'analysis_{ts}.json')
+        analysis_path = os.path.join(cls._rec_dir, f'analysis_{ts}.json')
         with open(analysis_path, 'w') as f:
             json.dump({'camera1': {}, 'camera2': {}}, f)
 
-    def tearDown(self):
-        shutil.rmtree(self._rec_dir)
-        shutil.rmtree(self._archive_dir)
+    def setUp(self):
+        self._archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._archive_dir)
 
     @patch('flask_gui._get_recordings_dir')
     def test_copies_all_files(self, mock_dir):
@@ -115,8 +111,14 @@ class TestArchiveRecording(unittest.TestCase):
         self.assertIn('analysis_20260215_140000.json', result['copied'])
         self.assertFalse(result.get('errors'))
         # Verify files exist in archive
-        self.assertTrue(os.path.exists(
-            os.path.join(self._archive_dir, 'recording_20260215_140000_camera1.mp4')))
+        expected = {
+            'recording_20260215_140000_camera1.mp4',
+            'recording_20260215_140000_camera2.mp4',
+            'analysis_20260215_140000.json',
+        }
+        with os.scandir(self._archive_dir) as entries:
+            archived = {e.name for e in entries}
+        self.assertLessEqual(expected, archived)
 
     @patch('flask_gui._get_recordings_dir')
     def test_missing_files_not_error(self, mock_dir):
@@ -131,6 +133,8 @@ class TestArchiveRecording(unittest.TestCase):
         result = _archive_recording('20260215_140000', new_dir)
         self.assertTrue(os.path.isdir(new_dir))
         self.assertTrue(len(result['copied']) > 0)
+        with os.scandir(new_dir) as entries:
+            self.assertEqual({e.name for e in entries}, set(result['copied']))
 
 
 class TestDiskUsage(unittest.TestCase):
@@ -151,24 +155,27 @@ class TestDiskUsage(unittest.TestCase):
 class TestArchiveAPIEndpoints(unittest.TestCase):
     """Test Flask archive API routes."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmpdir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls._tmpdir)
         app.config['TESTING'] = True
-        self.client = app.test_client()
+        cls.client = app.test_client()
+        cls.mgr = MagicMock(spec=CameraManager)
+
+    def setUp(self):
         import flask_gui
-        self.mgr = CameraManager()
         flask_gui.camera_manager = self.mgr
 
-        # Use temp config file
-        self._orig_config = flask_gui._ARCHIVE_CONFIG_FILE
-        self._tmp_config = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
-        self._tmp_config.close()
-        flask_gui._ARCHIVE_CONFIG_FILE = self._tmp_config.name
+        # Use a temp config file per test
+        path = os.path.join(self._tmpdir, f'{self._testMethodName}.json')
+        patcher = patch.object(flask_gui, '_ARCHIVE_CONFIG_FILE', path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def tearDown(self):
         import flask_gui
         flask_gui.camera_manager = None
-        flask_gui._ARCHIVE_CONFIG_FILE = self._orig_config
-        os.unlink(self._tmp_config.name)
 
     def test_get_config_unconfigured(self):
         resp = self.client.get('/api/archive/config')
@@ -231,11 +238,14 @@ class TestArchiveAPIEndpoints(unittest.TestCase):
 class TestTemplateSettingsTab(unittest.TestCase):
     """Test that the template includes the Settings tab."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         app.config['TESTING'] = True
-        self.client = app.test_client()
+        cls.client = app.test_client()
+        cls.mgr = MagicMock(spec=CameraManager)
+
+    def setUp(self):
         import flask_gui
-        self.mgr = CameraManager()
         flask_gui.camera_manager = self.mgr
 
     def tearDown(self):
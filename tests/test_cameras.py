@@ -3,26 +3,37 @@ Quick test script to check if cameras are accessible
 Run this first to debug camera issues
 """
 
+import argparse
 import cv2
 import sys
 import os
 
+from test_utils import available_camera_indices
+
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+# Many UVC cameras default to YUYV, which caps the frame rate at high
+# resolutions; probe on MJPEG as the recorder's capture modes prefer it
+MJPG_FOURCC = cv2.VideoWriter_fourcc(*'MJPG')
+
 
-def test_camera(camera_id: int):
-    """Test if a camera can be opened and read from"""
-    print(f"\nTesting Camera {camera_id}...")
+def test_camera(camera_id: int, verbose: bool = False):
+    """Test if a camera can be opened and read from. One summary line unless verbose."""
+    if verbose:
+        print(f"\nTesting Camera {camera_id}...")
     cap = cv2.VideoCapture(camera_id)
+    cap.set(cv2.CAP_PROP_FOURCC, MJPG_FOURCC)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Read a fresh frame, not a queued one
     
     if not cap.isOpened():
         print(f"  [X] Camera {camera_id} failed to open")
         return False
     
-    print(f"  [OK] Camera {camera_id} opened successfully")
+    if verbose:
+        print(f"  [OK] Camera {camera_id} opened successfully")
     
     # Try to read a frame
     ret, frame = cap.read()
@@ -31,33 +42,35 @@ def test_camera(camera_id: int):
         cap.release()
         return False
     
-    print(f"  [OK] Camera {camera_id} can read frames")
-    print(f"  Frame size: {frame.shape[1]}x{frame.shape[0]}")
-    
     # Get camera properties
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     fps = cap.get(cv2.CAP_PROP_FPS)
     backend = cap.getBackendName()
     
-    print(f"  Properties:")
-    print(f"    Resolution: {width}x{height}")
-    print(f"    FPS: {fps}")
-    print(f"    Backend: {backend}")
+    if verbose:
+        print(f"  [OK] Camera {camera_id} can read frames")
+        print(f"  Frame size: {frame.shape[1]}x{frame.shape[0]}")
+        print(f"  Properties:")
+        print(f"    Resolution: {width}x{height}")
+        print(f"    FPS: {fps}")
+        print(f"    Backend: {backend}")
+    else:
+        print(f"  [OK] Camera {camera_id}: {width}x{height} @ {fps}fps, Backend: {backend}")
     
     cap.release()
     return True
 
 
-def main():
+def main(verbose=False):
     print("=" * 60)
     print("Camera Diagnostic Tool")
     print("=" * 60)
     
-    # Test cameras 0-4
+    # Test the cameras present at indices 0-4
     available_cameras = []
-    for i in range(5):
-        if test_camera(i):
+    for i in available_camera_indices(max_index=5):
+        if test_camera(i, verbose):
             available_cameras.append(i)
     
     print("\n" + "=" * 60)
@@ -106,5 +119,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Check which cameras are accessible")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Print full details for each camera")
+    args = parser.parse_args()
+    main(verbose=args.verbose)
 
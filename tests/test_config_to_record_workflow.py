@@ -3,14 +3,19 @@ Test the workflow from camera configuration to recording
 This verifies the complete user journey: configure -> record
 The goal is to ensure this sequence WORKS successfully when cameras are available
 """
+import copy
 import sys
 import os
 import unittest
-from unittest.mock import Mock, MagicMock, patch
-import time
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, patch, DEFAULT, create_autospec
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+import cv2
+
+# Add parent directory to path (test_gui imports this module after adding it)
+scripts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+if scripts_dir not in sys.path:
+    sys.path.insert(0, scripts_dir)
 
 from camera_setup_recorder_gui import TabbedCameraGUI
 
@@ -18,25 +23,27 @@ from camera_setup_recorder_gui import TabbedCameraGUI
 class TestConfigToRecordWorkflow(unittest.TestCase):
     """Test the complete workflow from configuration to recording - SUCCESS PATH"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the GUI once with cameras mocked out; tests get shallow copies"""
+        with patch.multiple('cv2', VideoCapture=DEFAULT, namedWindow=DEFAULT, resizeWindow=DEFAULT), \
+                patch('camera_setup_recorder_gui.DualCameraRecorder'):
+            cls._gui_template = TabbedCameraGUI()
+    
     def setUp(self):
         """Set up GUI with mocked cameras that are OPEN and AVAILABLE"""
-        self.mock_cap1 = MagicMock()
-        self.mock_cap2 = MagicMock()
+        self.mock_cap1 = create_autospec(cv2.VideoCapture, spec_set=True, instance=True)
+        self.mock_cap2 = create_autospec(cv2.VideoCapture, spec_set=True, instance=True)
         self.mock_cap1.isOpened.return_value = True
         self.mock_cap2.isOpened.return_value = True
         self.mock_cap1.get.return_value = 128  # brightness default
         self.mock_cap2.get.return_value = 128
         
-        with patch('cv2.VideoCapture') as mock_cap_class:
-            mock_cap_class.side_effect = [self.mock_cap1, self.mock_cap2]
-            with patch('camera_setup_recorder_gui.DualCameraRecorder'):
-                with patch('cv2.namedWindow'):
-                    with patch('cv2.resizeWindow'):
-                        self.gui = TabbedCameraGUI()
-                        self.gui.cap1 = self.mock_cap1
-                        self.gui.cap2 = self.mock_cap2
-                        # CRITICAL: Cameras are available - workflow should succeed
-                        self.gui.cameras_available = True
+        self.gui = copy.copy(self._gui_template)
+        self.gui.cap1 = self.mock_cap1
+        self.gui.cap2 = self.mock_cap2
+        # CRITICAL: Cameras are available - workflow should succeed
+        self.gui.cameras_available = True
     
     def test_workflow_configure_then_record_succeeds(self):
         """Test: Configure cameras, then record - THIS SHOULD SUCCEED"""
@@ -58,10 +65,8 @@ class TestConfigToRecordWorkflow(unittest.TestCase):
         with patch('camera_setup_recorder_gui.DualCameraRecorder') as mock_recorder_class:
             mock_recorder = MagicMock()
             mock_recorder.output_dir = "recordings"
-            mock_recorder.camera1 = MagicMock()
-            mock_recorder.camera2 = MagicMock()
-            mock_recorder.camera1.cap = self.mock_cap1
-            mock_recorder.camera2.cap = self.mock_cap2
+            mock_recorder.camera1 = SimpleNamespace(set_property=self.mock_cap1.set)
+            mock_recorder.camera2 = SimpleNamespace(set_property=self.mock_cap2.set)
             mock_recorder.start_cameras.return_value = None
             mock_recorder.start_recording.return_value = None
             mock_recorder_class.return_value = mock_recorder
@@ -89,28 +94,22 @@ class TestConfigToRecordWorkflow(unittest.TestCase):
             mock_recorder.start_cameras.assert_called_once()
             mock_recorder.start_recording.assert_called_once()
     
-    def test_workflow_cameras_released_before_recording(self):
-        """Test: Cameras are released before recorder opens them (critical for Linux)"""
-        # Set up: cameras are open for GUI preview
-        self.gui.cap1 = self.mock_cap1
-        self.gui.cap2 = self.mock_cap2
-        self.mock_cap1.isOpened.return_value = True
-        self.mock_cap2.isOpened.return_value = True
+    def test_workflow_camera_lifecycle(self):
+        """Test: Cameras are released for the recorder, then reopened for preview once it stops"""
+        mock_recorder = MagicMock()
+        mock_recorder.output_dir = "recordings"
+        mock_recorder.camera1 = SimpleNamespace(set_property=self.mock_cap1.set)
+        mock_recorder.camera2 = SimpleNamespace(set_property=self.mock_cap2.set)
+        mock_recorder.start_cameras.return_value = None
+        mock_recorder.start_recording.return_value = None
         
-        with patch('camera_setup_recorder_gui.DualCameraRecorder') as mock_recorder_class:
-            mock_recorder = MagicMock()
-            mock_recorder.output_dir = "recordings"
-            mock_recorder.camera1 = MagicMock()
-            mock_recorder.camera2 = MagicMock()
-            mock_recorder.start_cameras.return_value = None
-            mock_recorder.start_recording.return_value = None
-            mock_recorder_class.return_value = mock_recorder
-            
+        with self.subTest("released before recording"):
+            # Set up: cameras are open for GUI preview
             self.gui.recorder = None
             self.gui.is_recording = False
             
-            # Start recording
-            self.gui.start_recording()
+            with patch('camera_setup_recorder_gui.DualCameraRecorder', return_value=mock_recorder):
+                self.gui.start_recording()
             
             # CRITICAL TEST: Verify cameras were released BEFORE recorder.start_cameras() was called
             # This prevents "camera already open" errors on Linux
@@ -120,32 +119,29 @@ class TestConfigToRecordWorkflow(unittest.TestCase):
             
             # Verify recorder was called (meaning cameras were released first)
             mock_recorder.start_cameras.assert_called_once()
-    
-    def test_workflow_cameras_reopened_after_recording_stops(self):
-        """Test: Cameras are reopened after recording stops for GUI preview"""
-        # Set up: recording is in progress
-        mock_recorder = MagicMock()
-        mock_recorder.output_dir = "recordings"
-        self.gui.recorder = mock_recorder
-        self.gui.is_recording = True
-        self.gui.recording_start_time = time.time() - 5.0
-        self.gui.recording_files = ["test1.mp4", "test2.mp4"]
         
-        # Mock VideoCapture for reopening
-        with patch('cv2.VideoCapture') as mock_cap_class:
-            mock_cap_class.side_effect = [self.mock_cap1, self.mock_cap2]
+        with self.subTest("reopened after recording stops"):
+            # Set up: recording is in progress
+            self.gui.recorder = mock_recorder
+            self.gui.is_recording = True
+            self.gui.recording_start_time = 0.0
+            self.gui._now = lambda: 5.0
+            self.gui.recording_files = ["test1.mp4", "test2.mp4"]
             
-            # Stop recording
-            self.gui.stop_recording()
-            
-            # CRITICAL TEST: Verify cameras were reopened after recording stopped
-            # This allows GUI preview to continue after recording
-            self.assertGreater(mock_cap_class.call_count, 0,
-                             "Cameras MUST be reopened after recording stops")
-            
-            # Verify recording was stopped
-            self.assertFalse(self.gui.is_recording)
-
+            # Mock VideoCapture for reopening
+            with patch('cv2.VideoCapture') as mock_cap_class:
+                mock_cap_class.side_effect = [self.mock_cap1, self.mock_cap2]
+                
+                # Stop recording
+                self.gui.stop_recording()
+                
+                # CRITICAL TEST: Verify cameras were reopened after recording stopped
+                # This allows GUI preview to continue after recording
+                self.assertGreater(mock_cap_class.call_count, 0,
+                                 "Cameras MUST be reopened after recording stops")
+                
+                # Verify recording was stopped
+                self.assertFalse(self.gui.is_recording)
 
 if __name__ == '__main__':
     unittest.main()
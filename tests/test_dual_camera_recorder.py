@@ -0,0 +1,272 @@
+"""
+Tests for CameraCapture in the dual camera recorder.
+
+Covers the optional libuvc capture path without pyuvc or cameras: a fake
+``uvc`` module is installed in sys.modules before the recorder is imported.
+"""
+
+import sys
+import os
+import importlib
+import types
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+import cv2
+import numpy as np
+
+# Add project paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+
+class _FakeUvcCapture:
+    """Stands in for uvc.Capture: a few modes, picture controls and one frame."""
+
+    def __init__(self, uid):
+        self.uid = uid
+        self.available_modes = [
+            SimpleNamespace(width=1280, height=720, fps=30, format_name='YUYV'),
+            SimpleNamespace(width=1280, height=720, fps=60, format_name='MJPG'),
+            SimpleNamespace(width=1280, height=720, fps=120, format_name='MJPG'),
+            SimpleNamespace(width=640, height=480, fps=120, format_name='MJPG'),
+        ]
+        self.frame_mode = None
+        self.bandwidth_factor = None
+        self.controls = [
+            SimpleNamespace(display_name='Brightness', value=0, min_val=-64, max_val=64),
+            SimpleNamespace(display_name='Absolute Exposure Time', value=0, min_val=1, max_val=5000),
+        ]
+        self.frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        self.closed = False
+        _uvc.opened.append(self)
+
+    def get_frame_robust(self):
+        if self.frame is None:
+            raise RuntimeError('stream error')
+        return SimpleNamespace(bgr=self.frame)
+
+    def close(self):
+        self.closed = True
+
+
+_uvc = types.ModuleType('uvc')
+_uvc.Capture = _FakeUvcCapture
+_uvc.opened = []
+# Deliberately not in OpenCV index order
+_uvc.device_list = lambda: [
+    {'uid': '1:7', 'serialNumber': 'DTL-CAM', 'name': 'USB Camera'},
+    {'uid': '1:4', 'serialNumber': 'FACE-CAM', 'name': 'USB Camera'},
+]
+
+dcr = None
+
+
+def setUpModule():
+    global dcr
+    patcher = patch.dict(sys.modules, {'uvc': _uvc})
+    patcher.start()
+    unittest.addModuleCleanup(patcher.stop)
+    import dual_camera_recorder
+    dcr = importlib.reload(dual_camera_recorder)
+
+
+class _UvcTestCase(unittest.TestCase):
+    def setUp(self):
+        _uvc.opened.clear()
+
+
+# ======================================================================
+# Opening through libuvc
+# ======================================================================
+
+class TestUvcOpen(_UvcTestCase):
+    """libuvc is opt-in and matches devices by UID or serial number."""
+
+    def test_opt_in_by_default_off(self):
+        cam = dcr.CameraCapture(0)
+        self.assertFalse(cam.use_uvc)
+        self.assertIsNone(cam.uvc_dims)
+        with patch.object(dcr.cv2, 'VideoCapture') as video_capture:
+            video_capture.return_value.isOpened.return_value = False
+            with self.assertRaises(ValueError):
+                cam.start(1280, 720, 60)
+        self.assertEqual(_uvc.opened, [])
+
+    def test_no_uid_uses_opencv(self):
+        cam = dcr.CameraCapture(0, use_uvc=True)
+        self.assertFalse(cam._start_uvc(1280, 720, 60))
+        self.assertEqual(_uvc.opened, [])
+
+    def test_matches_uid_not_list_position(self):
+        cam = dcr.CameraCapture(0, use_uvc=True, uvc_uid='1:4')
+        self.assertTrue(cam._start_uvc(1280, 720, 60))
+        self.assertEqual([c.uid for c in _uvc.opened], ['1:4'])
+        self.assertEqual(cam.uvc_dims, (1280, 720, 60.0))
+
+    def test_matches_serial_number(self):
+        cam = dcr.CameraCapture(1, use_uvc=True, uvc_uid='DTL-CAM')
+        self.assertTrue(cam._start_uvc(1280, 720, 100))
+        self.assertEqual(_uvc.opened[0].uid, '1:7')
+        # MJPEG preferred, then the closest rate
+        self.assertEqual(cam.uvc_dims, (1280, 720, 120.0))
+
+    def test_unknown_uid_falls_back(self):
+        cam = dcr.CameraCapture(0, use_uvc=True, uvc_uid='9:9')
+        self.assertFalse(cam._start_uvc(1280, 720, 60))
+        self.assertEqual(_uvc.opened, [])
+
+    def test_unsupported_mode_closes_device(self):
+        cam = dcr.CameraCapture(0, use_uvc=True, uvc_uid='1:4')
+        self.assertFalse(cam._start_uvc(1920, 1080, 60))
+        self.assertTrue(_uvc.opened[0].closed)
+        self.assertIsNone(cam.uvc_cap)
+
+    @patch('dual_camera_recorder.os.makedirs')
+    def test_recorder_opts_in_with_uids(self, _makedirs):
+        rec = dcr.DualCameraRecorder(0, 1, uvc_uids=('1:4', '1:7'))
+        self.assertEqual((rec.camera1.uvc_uid, rec.camera2.uvc_uid), ('1:4', '1:7'))
+        self.assertTrue(rec.camera1.use_uvc and rec.camera2.use_uvc)
+        self.assertFalse(dcr.DualCameraRecorder(0, 1).camera1.use_uvc)
+
+
+# ======================================================================
+# Reading and settings
+# ======================================================================
+
+class TestUvcReadAndSettings(_UvcTestCase):
+    """Frames and camera settings go through whichever backend is open."""
+
+    def setUp(self):
+        super().setUp()
+        self.cam = dcr.CameraCapture(0, use_uvc=True, uvc_uid='1:4')
+        self.assertTrue(self.cam._start_uvc(1280, 720, 60))
+        self.device = _uvc.opened[0]
+
+    def test_read_returns_bgr_frame(self):
+        ok, frame = self.cam._read()
+        self.assertTrue(ok)
+        self.assertIs(frame, self.device.frame)
+
+    def test_read_error_is_a_failed_read(self):
+        self.device.frame = None
+        self.assertEqual(self.cam._read(), (False, None))
+
+    def test_brightness_passes_through(self):
+        self.assertTrue(self.cam.set_property(cv2.CAP_PROP_BRIGHTNESS, 12.0))
+        self.assertEqual(self.device.controls[0].value, 12)
+
+    def test_exposure_converted_from_log2_seconds(self):
+        # 2**-6 s = 15.6 ms = 156 units of 100 us
+        self.assertTrue(self.cam.set_property(cv2.CAP_PROP_EXPOSURE, -6))
+        self.assertEqual(self.device.controls[1].value, 156)
+        # Clamped to the control's range
+        self.cam.set_property(cv2.CAP_PROP_EXPOSURE, -13)
+        self.assertEqual(self.device.controls[1].value, 1)
+
+    def test_unmapped_property_not_applied(self):
+        self.assertFalse(self.cam.set_property(cv2.CAP_PROP_WHITE_BALANCE_BLUE_U, 4000))
+        self.assertFalse(self.cam.set_property(cv2.CAP_PROP_SATURATION, 64))  # no such control
+
+    def test_stop_closes_device(self):
+        self.cam.stop()
+        self.assertTrue(self.device.closed)
+        self.assertIsNone(self.cam.uvc_cap)
+
+    def test_opencv_backend_uses_cap_set(self):
+        cam = dcr.CameraCapture(0)
+        self.assertFalse(cam.set_property(cv2.CAP_PROP_BRIGHTNESS, 10))  # not started
+        cam.cap = MagicMock()
+        cam.cap.set.return_value = True
+        self.assertTrue(cam.set_property(cv2.CAP_PROP_BRIGHTNESS, 10))
+        cam.cap.set.assert_called_once_with(cv2.CAP_PROP_BRIGHTNESS, 10)
+
+
+# ======================================================================
+# Capture loop
+# ======================================================================
+
+class TestCaptureLoopBackoff(unittest.TestCase):
+    """Failed reads back off exponentially and warn once per outage."""
+
+    def _run_loop(self, reads):
+        """Run _capture_loop over scripted read results on a fake clock."""
+        cam = dcr.CameraCapture(0)
+        script = iter(reads)
+        clock = [0.0]
+        sleeps = []
+
+        def read():
+            ok = next(script, None)
+            if ok is None:
+                cam.running = False
+                return False, None
+            return ok, (np.zeros((2, 2, 3), dtype=np.uint8) if ok else None)
+
+        def sleep(seconds):
+            sleeps.append(round(seconds, 3))
+            clock[0] += seconds
+
+        cam._read = read
+        cam.running = True
+        with patch.object(dcr.time, 'sleep', side_effect=sleep), \
+                patch.object(dcr.time, 'monotonic', side_effect=lambda: clock[0]), \
+                patch('builtins.print') as printed:
+            cam._capture_loop()
+        return sleeps, printed
+
+    def test_delays_double_from_10ms_to_320ms(self):
+        sleeps, _ = self._run_loop([False] * 8)
+        self.assertEqual(sleeps[:8], [0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.32, 0.32])
+
+    def test_success_resets_backoff(self):
+        sleeps, _ = self._run_loop([False, False, False, True, False])
+        self.assertEqual(sleeps[:4], [0.01, 0.02, 0.04, 0.01])
+
+    def test_warns_once_after_a_second_of_failures(self):
+        # Failures land at 0, 10, 30, ... 950ms, then 1270ms: the 9th one warns
+        _, printed = self._run_loop([False] * 7)
+        printed.assert_not_called()
+        _, printed = self._run_loop([False] * 30)
+        self.assertEqual(printed.call_count, 1)
+        self.assertIn('failed to read frames', printed.call_args[0][0])
+
+    def test_warns_again_for_a_new_outage(self):
+        _, printed = self._run_loop([False] * 10 + [True] + [False] * 10)
+        self.assertEqual(printed.call_count, 2)
+
+
+# ======================================================================
+# Runner
+# ======================================================================
+
+def run_dual_camera_recorder_tests():
+    """Run all CameraCapture tests."""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    for cls in [
+        TestUvcOpen,
+        TestUvcReadAndSettings,
+        TestCaptureLoopBackoff,
+    ]:
+        suite.addTests(loader.loadTestsFromTestCase(cls))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == '__main__':
+    print("=" * 70)
+    print("Dual Camera Recorder Tests")
+    print("=" * 70)
+    print()
+    success = run_dual_camera_recorder_tests()
+    print()
+    print("=" * 70)
+    if success:
+        print("All Dual Camera Recorder tests passed!")
+    else:
+        print("Some Dual Camera Recorder tests failed")
+    print("=" * 70)
+    sys.exit(0 if success else 1)
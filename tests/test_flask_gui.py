@@ -7,21 +7,70 @@ CameraManager class instead of the OpenCV-based TabbedCameraGUI.
 
 import sys
 import os
+import copy
+import gzip
 import json
+import threading
+import time
+from types import SimpleNamespace
 import unittest
-from unittest.mock import Mock, MagicMock, patch, PropertyMock
+from unittest.mock import Mock, MagicMock, patch, PropertyMock, create_autospec
 import numpy as np
 
 # Add project paths
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, os.path.join(project_root, 'src'))
-sys.path.insert(0, os.path.join(project_root, 'scripts'))
-sys.path.insert(0, os.path.join(project_root, 'tests'))
+for subdir in ('src', 'scripts', 'tests'):
+    path = os.path.join(project_root, subdir)
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 import cv2
+import flask_gui
 from flask_gui import app, CameraManager, load_windows_config
 from test_utils import get_camera_ids
 
+# No test here should open real cameras through a recorder; patch it once for
+# the module and let tests that start recording configure the mock they get.
+_recorder_class = None
+
+
+def setUpModule():
+    global _recorder_class
+    patcher = patch('flask_gui.DualCameraRecorder')
+    _recorder_class = patcher.start()
+    unittest.addModuleCleanup(patcher.stop)
+
+
+class _ManagerTemplate:
+    """
+    Mixin: construct CameraManager once per class (on Windows that reads
+    the camera config from disk) and hand each test a fresh copy of its state.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._mgr_state = CameraManager().__dict__.copy()
+
+    def _new_manager(self):
+        mgr = CameraManager.__new__(CameraManager)
+        mgr.__dict__.update(self._mgr_state)
+        # Mutable per-instance state must not leak between tests
+        mgr.frame_lock = threading.Lock()
+        mgr.analysis_frames_cam1 = []
+        mgr.analysis_frames_cam2 = []
+        return mgr
+
+
+class _AppClient:
+    """Mixin: one Flask test client per class; it keeps no state between requests."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        app.config['TESTING'] = True
+        cls.client = app.test_client()
+
 
 # ======================================================================
 # CameraManager Initialization
@@ -30,26 +79,25 @@ from test_utils import get_camera_ids
 class TestCameraManagerInitialization(unittest.TestCase):
     """Test CameraManager initialization with platform-appropriate defaults."""
 
-    def test_platform_defaults_linux(self):
-        """Linux should use cameras 0, 1 by default."""
-        with patch('sys.platform', 'linux'):
-            mgr = CameraManager()
-            self.assertEqual(mgr.camera1_id, 0)
-            self.assertEqual(mgr.camera2_id, 1)
-
-    def test_platform_defaults_windows(self):
-        """Windows should read from config file."""
+    @classmethod
+    def setUpClass(cls):
+        # Expected Windows IDs come from the config file; read it once
         with patch('sys.platform', 'win32'):
-            expected_cam1, expected_cam2 = get_camera_ids()
-            mgr = CameraManager()
-            self.assertEqual(mgr.camera1_id, expected_cam1)
-            self.assertEqual(mgr.camera2_id, expected_cam2)
-
-    def test_explicit_camera_ids(self):
-        """Explicit IDs override defaults."""
-        mgr = CameraManager(camera1_id=5, camera2_id=7)
-        self.assertEqual(mgr.camera1_id, 5)
-        self.assertEqual(mgr.camera2_id, 7)
+            cls.windows_camera_ids = get_camera_ids()
+
+    def test_platform_defaults(self):
+        """Linux uses cameras 0, 1, Windows reads the config file, explicit IDs override both."""
+        cases = [
+            ('linux', {}, (0, 1)),
+            ('win32', {}, self.windows_camera_ids),
+            (sys.platform, {'camera1_id': 5, 'camera2_id': 7}, (5, 7)),
+        ]
+        for platform, kwargs, (expected_cam1, expected_cam2) in cases:
+            with self.subTest(platform=platform, **kwargs):
+                with patch('sys.platform', platform):
+                    mgr = CameraManager(**kwargs)
+                self.assertEqual(mgr.camera1_id, expected_cam1)
+                self.assertEqual(mgr.camera2_id, expected_cam2)
 
     def test_tab_names(self):
         """All tab names should be present."""
@@ -92,12 +140,15 @@ class TestCameraManagerInitialization(unittest.TestCase):
 # Camera Properties
 # ======================================================================
 
-class TestCameraProperties(unittest.TestCase):
+class TestCameraProperties(_ManagerTemplate, unittest.TestCase):
     """Test camera property get/set/reset via CameraManager."""
 
+    # Property names are fixed on the class; read them once
+    PROP_NAMES = tuple(CameraManager.PROP_MAP)
+
     def setUp(self):
-        self.mgr = CameraManager()
-        self.mock_cap = MagicMock()
+        self.mgr = self._new_manager()
+        self.mock_cap = create_autospec(cv2.VideoCapture, spec_set=True, instance=True)
         self.mock_cap.isOpened.return_value = True
         self.mock_cap.get.return_value = 128.0
         self.mgr.cap1 = self.mock_cap
@@ -106,7 +157,7 @@ class TestCameraProperties(unittest.TestCase):
         """Properties dict contains all expected keys."""
         props = self.mgr.get_camera_properties(1)
         self.assertIsNotNone(props)
-        for name in CameraManager.PROP_MAP:
+        for name in self.PROP_NAMES:
             self.assertIn(name, props)
             self.assertIn('value', props[name])
             self.assertIn('min', props[name])
@@ -135,28 +186,27 @@ class TestCameraProperties(unittest.TestCase):
         ok = self.mgr.reset_camera_properties(1)
         self.assertTrue(ok)
         # One set call per property
-        self.assertEqual(self.mock_cap.set.call_count, len(CameraManager.PROP_MAP))
+        self.assertEqual(self.mock_cap.set.call_count, len(self.PROP_NAMES))
 
     def test_property_ranges_defined(self):
         """All property ranges have required keys."""
+        required = {'min', 'max', 'default', 'step'}
         for name, rng in CameraManager.PROP_RANGES.items():
-            self.assertIn('min', rng, f"Missing 'min' for {name}")
-            self.assertIn('max', rng, f"Missing 'max' for {name}")
-            self.assertIn('default', rng, f"Missing 'default' for {name}")
-            self.assertIn('step', rng, f"Missing 'step' for {name}")
+            missing = required - rng.keys()
+            self.assertFalse(missing, f"Missing {sorted(missing)} for {name}")
 
 
 # ======================================================================
 # Recording Controls
 # ======================================================================
 
-class TestRecordingControls(unittest.TestCase):
+class TestRecordingControls(_ManagerTemplate, unittest.TestCase):
     """Test recording start/stop functionality."""
 
     def setUp(self):
-        self.mgr = CameraManager()
-        self.mock_cap1 = MagicMock()
-        self.mock_cap2 = MagicMock()
+        self.mgr = self._new_manager()
+        self.mock_cap1 = create_autospec(cv2.VideoCapture, spec_set=True, instance=True)
+        self.mock_cap2 = create_autospec(cv2.VideoCapture, spec_set=True, instance=True)
         self.mock_cap1.isOpened.return_value = True
         self.mock_cap2.isOpened.return_value = True
         self.mock_cap1.get.return_value = 128.0
@@ -165,24 +215,29 @@ class TestRecordingControls(unittest.TestCase):
         self.mgr.cap2 = self.mock_cap2
         self.mgr.cameras_available = True
 
+    def test_recording_duration(self):
+        """recording_duration() counts from the start time, 0 when idle."""
+        self.mgr._now = lambda: 12.5
+        self.assertEqual(self.mgr.recording_duration(), 0)
+        self.mgr.recording_start_time = 10.0
+        self.assertEqual(self.mgr.recording_duration(), 2.5)
+
     def test_start_recording_creates_recorder(self):
         """start_recording should create DualCameraRecorder and begin."""
-        with patch('flask_gui.DualCameraRecorder') as MockRec:
-            mock_rec = MagicMock()
-            mock_rec.output_dir = 'recordings'
-            mock_rec.camera1 = MagicMock()
-            mock_rec.camera2 = MagicMock()
-            mock_rec.camera1.cap = self.mock_cap1
-            mock_rec.camera2.cap = self.mock_cap2
-            MockRec.return_value = mock_rec
-
-            result = self.mgr.start_recording()
-
-            self.assertIn('success', result)
-            self.assertTrue(result['success'])
-            self.assertTrue(self.mgr.is_recording)
-            mock_rec.start_cameras.assert_called_once()
-            mock_rec.start_recording.assert_called_once()
+        _recorder_class.reset_mock(return_value=True, side_effect=True)
+        mock_rec = MagicMock()
+        mock_rec.output_dir = 'recordings'
+        mock_rec.camera1 = SimpleNamespace(set_property=self.mock_cap1.set)
+        mock_rec.camera2 = SimpleNamespace(set_property=self.mock_cap2.set)
+        _recorder_class.return_value = mock_rec
+
+        result = self.mgr.start_recording()
+
+        self.assertIn('success', result)
+        self.assertTrue(result['success'])
+        self.assertTrue(self.mgr.is_recording)
+        mock_rec.start_cameras.assert_called_once()
+        mock_rec.start_recording.assert_called_once()
 
     def test_start_recording_fails_without_cameras(self):
         """Recording must not start when cameras_available is False."""
@@ -212,8 +267,8 @@ class TestRecordingControls(unittest.TestCase):
 
         with patch.object(self.mgr, '_reopen_cameras'):
             with patch.object(self.mgr, 'start_analysis'):
-                with patch('time.time', return_value=5.0):
-                    result = self.mgr.stop_recording()
+                self.mgr._now = lambda: 5.0
+                result = self.mgr.stop_recording()
 
         self.assertIn('success', result)
         self.assertFalse(self.mgr.is_recording)
@@ -236,11 +291,58 @@ class TestRecordingControls(unittest.TestCase):
 # Analysis
 # ======================================================================
 
-class TestAnalysis(unittest.TestCase):
+class TestAnalysis(_ManagerTemplate, unittest.TestCase):
     """Test analysis triggering and result formatting."""
 
+    # Per-frame results for the two cameras, built once for the class
+    CAM1_DATA = {
+        'sway': [0, -5, -10, -5, 0, 5, 10, 5, 0],
+        'head_sway': [0, -1, -2, -1, 0, 1, 2, 1, 0],
+        'spine_tilt': [0] * 9,
+        'knee_flex': [170] * 9,
+        'weight_shift': [50] * 9,
+        'shoulder_turn': [0] * 9,
+        'hip_turn': [0] * 9,
+        'x_factor': [0] * 9,
+        'spine_angle': [30] * 9,
+        'lead_arm_angle': [175] * 9,
+        'phases': ['Address', 'Backswing', 'Backswing', 'Top', 'Downswing',
+                   'Impact', 'Follow-through', 'Follow-through', 'Follow-through'],
+        'tempo': 2.0,
+        'summary': {'max_sway_left': -10, 'max_sway_right': 10},
+        'detection_rate': 95.0,
+    }
+    CAM2_DATA = {
+        'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20],
+        'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10],
+        'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10],
+        'sway': [0] * 9,
+        'head_sway': [0] * 9,
+        'spine_tilt': [0] * 9,
+        'knee_flex': [170] * 9,
+        'weight_shift': [50] * 9,
+        'spine_angle': [30] * 9,
+        'lead_arm_angle': [175] * 9,
+        'phases': ['Address'] * 9,
+        'tempo': 3.0,
+        'summary': {
+            'max_shoulder_turn': 45,
+            'max_hip_turn': 25,
+            'max_x_factor': 20,
+        },
+        'detection_rate': 90.0,
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # No recorded videos exist for these tests; keep start_analysis off the disk
+        patcher = patch('flask_gui.os.path.exists', return_value=False)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
-        self.mgr = CameraManager()
+        self.mgr = self._new_manager()
 
     def test_analysis_state_initialization(self):
         """Analysis state should be clean on init."""
@@ -264,8 +366,7 @@ class TestAnalysis(unittest.TestCase):
     def test_start_analysis_requires_existing_files(self):
         """start_analysis with non-existent files should not start."""
         self.mgr.recording_files = ['nonexistent1.mp4', 'nonexistent2.mp4']
-        with patch('os.path.exists', return_value=False):
-            self.mgr.start_analysis()
+        self.mgr.start_analysis()
         self.assertFalse(self.mgr.is_analyzing)
 
     def test_get_analysis_results_empty(self):
@@ -278,43 +379,8 @@ class TestAnalysis(unittest.TestCase):
 
     def test_get_analysis_results_with_data(self):
         """get_analysis_results formats camera data correctly."""
-        self.mgr.analysis_camera1 = {
-            'sway': [0, -5, -10, -5, 0, 5, 10, 5, 0],
-            'head_sway': [0, -1, -2, -1, 0, 1, 2, 1, 0],
-            'spine_tilt': [0] * 9,
-            'knee_flex': [170] * 9,
-            'weight_shift': [50] * 9,
-            'shoulder_turn': [0] * 9,
-            'hip_turn': [0] * 9,
-            'x_factor': [0] * 9,
-            'spine_angle': [30] * 9,
-            'lead_arm_angle': [175] * 9,
-            'phases': ['Address', 'Backswing', 'Backswing', 'Top', 'Downswing',
-                       'Impact', 'Follow-through', 'Follow-through', 'Follow-through'],
-            'tempo': 2.0,
-            'summary': {'max_sway_left': -10, 'max_sway_right': 10},
-            'detection_rate': 95.0,
-        }
-        self.mgr.analysis_camera2 = {
-            'shoulder_turn': [0, 10, 20, 30, 40, 45, 40, 30, 20],
-            'hip_turn': [0, 5, 10, 15, 20, 25, 20, 15, 10],
-            'x_factor': [0, 5, 10, 15, 20, 20, 20, 15, 10],
-            'sway': [0] * 9,
-            'head_sway': [0] * 9,
-            'spine_tilt': [0] * 9,
-            'knee_flex': [170] * 9,
-            'weight_shift': [50] * 9,
-            'spine_angle': [30] * 9,
-            'lead_arm_angle': [175] * 9,
-            'phases': ['Address'] * 9,
-            'tempo': 3.0,
-            'summary': {
-                'max_shoulder_turn': 45,
-                'max_hip_turn': 25,
-                'max_x_factor': 20,
-            },
-            'detection_rate': 90.0,
-        }
+        self.mgr.analysis_camera1 = copy.copy(self.CAM1_DATA)
+        self.mgr.analysis_camera2 = copy.copy(self.CAM2_DATA)
         self.mgr.analysis_frame_index = 5
 
         results = self.mgr.get_analysis_results()
@@ -348,9 +414,45 @@ class TestAnalysis(unittest.TestCase):
             'summary': {},
         }
         self.mgr.analysis_camera2 = None
-        self.mgr.analysis_frame_index = 999
-        results = self.mgr.get_analysis_results()
-        self.assertEqual(results['frame_index'], 9)
+        for index, expected in ((999, 9), (-3, 0), (4, 4)):
+            with self.subTest(index=index):
+                self.mgr.analysis_frame_index = index
+                results = self.mgr.get_analysis_results()
+                self.assertEqual(results['frame_index'], expected)
+
+    def test_results_json_reused_until_inputs_change(self):
+        """Encoded results are reused for the same frame and data, rebuilt otherwise."""
+        self.mgr.analysis_camera1 = copy.copy(self.CAM1_DATA)
+        self.mgr.analysis_frame_index = 2
+        body = self.mgr.get_analysis_results_json()
+        self.assertIs(self.mgr.get_analysis_results_json(), body)
+        self.assertEqual(json.loads(body), self.mgr.get_analysis_results())
+
+        self.mgr.analysis_frame_index = 3
+        self.assertEqual(json.loads(self.mgr.get_analysis_results_json())['frame_index'], 3)
+
+        self.mgr.analysis_camera1 = copy.copy(self.CAM1_DATA)
+        self.assertIsNot(self.mgr.get_analysis_results_json(), body)
+
+        # Out-of-range requests are clamped every time, cached or not
+        for _ in range(2):
+            self.mgr.analysis_frame_index = 999
+            self.assertEqual(json.loads(self.mgr.get_analysis_results_json())['frame_index'], 8)
+            self.assertEqual(self.mgr.analysis_frame_index, 8)
+
+    def test_results_json_not_cached_under_a_moved_index(self):
+        """A slider move during encoding must not file the old frame under the new index."""
+        self.mgr.analysis_camera1 = copy.copy(self.CAM1_DATA)
+        self.mgr.analysis_frame_index = 2
+        dumps = flask_gui.app.json.dumps
+
+        def move_slider_then_dump(obj):
+            self.mgr.analysis_frame_index = 5
+            return dumps(obj)
+
+        with patch.object(flask_gui.app.json, 'dumps', side_effect=move_slider_then_dump):
+            self.assertEqual(json.loads(self.mgr.get_analysis_results_json())['frame_index'], 2)
+        self.assertEqual(json.loads(self.mgr.get_analysis_results_json())['frame_index'], 5)
 
     def test_stop_recording_triggers_analysis(self):
         """stop_recording should call start_analysis when files are available."""
@@ -364,8 +466,8 @@ class TestAnalysis(unittest.TestCase):
 
         with patch.object(self.mgr, '_reopen_cameras'):
             with patch.object(self.mgr, 'start_analysis') as mock_analyze:
-                with patch('time.time', return_value=5.0):
-                    self.mgr.stop_recording()
+                self.mgr._now = lambda: 5.0
+                self.mgr.stop_recording()
         mock_analyze.assert_called_once()
 
 
@@ -373,11 +475,11 @@ class TestAnalysis(unittest.TestCase):
 # Analysis Frame Navigation
 # ======================================================================
 
-class TestFrameNavigation(unittest.TestCase):
+class TestFrameNavigation(_ManagerTemplate, unittest.TestCase):
     """Test analysis frame navigation logic."""
 
     def setUp(self):
-        self.mgr = CameraManager()
+        self.mgr = self._new_manager()
         n1 = 13
         n2 = 11
         self.mgr.analysis_camera1 = {
@@ -510,16 +612,12 @@ class TestSummaryCorrectness(unittest.TestCase):
 # Flask Routes
 # ======================================================================
 
-class TestFlaskRoutes(unittest.TestCase):
+class TestFlaskRoutes(_AppClient, _ManagerTemplate, unittest.TestCase):
     """Test Flask HTTP endpoints."""
 
     def setUp(self):
-        app.config['TESTING'] = True
-        self.client = app.test_client()
-
         # Create a CameraManager with mocked cameras
-        import flask_gui
-        self.mgr = CameraManager()
+        self.mgr = self._new_manager()
         self.mock_cap1 = MagicMock()
         self.mock_cap2 = MagicMock()
         self.mock_cap1.isOpened.return_value = True
@@ -532,7 +630,6 @@ class TestFlaskRoutes(unittest.TestCase):
         flask_gui.camera_manager = self.mgr
 
     def tearDown(self):
-        import flask_gui
         flask_gui.camera_manager = None
 
     def test_index_returns_html(self):
@@ -540,6 +637,24 @@ class TestFlaskRoutes(unittest.TestCase):
         resp = self.client.get('/')
         self.assertEqual(resp.status_code, 200)
         self.assertIn(b'Camera Setup', resp.data)
+        self.assertEqual(resp.headers['Cache-Control'], 'public, max-age=60')
+
+    def test_index_not_modified(self):
+        """GET / with the page's ETag returns 304 and no body."""
+        etag = self.client.get('/').headers['ETag']
+        resp = self.client.get('/', headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.data, b'')
+
+    @unittest.skipUnless(flask_gui.Compress, 'Flask-Compress not installed')
+    def test_gzip_enabled(self):
+        """Large JSON responses are gzipped for clients that accept it."""
+        self.mgr.analysis_camera1 = {'sway': list(range(300)), 'summary': {}}
+        resp = self.client.get('/api/analysis/results',
+                               headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(resp.headers.get('Content-Encoding'), 'gzip')
+        data = json.loads(gzip.decompress(resp.data))
+        self.assertEqual(data['max_frames'], 300)
 
     def test_api_status(self):
         """GET /api/status returns JSON with expected keys."""
@@ -590,19 +705,17 @@ class TestFlaskRoutes(unittest.TestCase):
 
     def test_api_recording_start(self):
         """POST /api/recording/start triggers recording."""
-        with patch('flask_gui.DualCameraRecorder') as MockRec:
-            mock_rec = MagicMock()
-            mock_rec.output_dir = 'recordings'
-            mock_rec.camera1 = MagicMock()
-            mock_rec.camera2 = MagicMock()
-            mock_rec.camera1.cap = self.mock_cap1
-            mock_rec.camera2.cap = self.mock_cap2
-            MockRec.return_value = mock_rec
-
-            resp = self.client.post('/api/recording/start')
-            self.assertEqual(resp.status_code, 200)
-            data = json.loads(resp.data)
-            self.assertTrue(data.get('success'))
+        _recorder_class.reset_mock(return_value=True, side_effect=True)
+        mock_rec = MagicMock()
+        mock_rec.output_dir = 'recordings'
+        mock_rec.camera1 = SimpleNamespace(set_property=self.mock_cap1.set)
+        mock_rec.camera2 = SimpleNamespace(set_property=self.mock_cap2.set)
+        _recorder_class.return_value = mock_rec
+
+        resp = self.client.post('/api/recording/start')
+        self.assertEqual(resp.status_code, 200)
+        data = json.loads(resp.data)
+        self.assertTrue(data.get('success'))
 
     def test_api_recording_start_no_cameras(self):
         """POST /api/recording/start without cameras returns error."""
@@ -624,8 +737,8 @@ class TestFlaskRoutes(unittest.TestCase):
 
         with patch.object(self.mgr, '_reopen_cameras'):
             with patch.object(self.mgr, 'start_analysis'):
-                with patch('time.time', return_value=5.0):
-                    resp = self.client.post('/api/recording/stop')
+                self.mgr._now = lambda: 5.0
+                resp = self.client.post('/api/recording/stop')
 
         data = json.loads(resp.data)
         self.assertTrue(data.get('success'))
@@ -693,8 +806,8 @@ class TestFlaskRoutes(unittest.TestCase):
         self.mgr.recording_start_time = 100.0
         self.mgr.recording_files = ['cam1.mp4', 'cam2.mp4']
 
-        with patch('time.time', return_value=105.0):
-            resp = self.client.get('/api/status')
+        self.mgr._now = lambda: 105.0
+        resp = self.client.get('/api/status')
         data = json.loads(resp.data)
         self.assertTrue(data['is_recording'])
         self.assertAlmostEqual(data['recording_duration'], 5.0, places=1)
@@ -713,119 +826,85 @@ class TestFlaskRoutes(unittest.TestCase):
 # Template Rendering
 # ======================================================================
 
-class TestTemplateRendering(unittest.TestCase):
+class TestTemplateRendering(_AppClient, unittest.TestCase):
     """Test that the HTML template renders with all expected elements."""
 
-    def setUp(self):
-        app.config['TESTING'] = True
-        self.client = app.test_client()
-        import flask_gui
-        self.mgr = CameraManager()
-        flask_gui.camera_manager = self.mgr
-
-    def tearDown(self):
-        import flask_gui
-        flask_gui.camera_manager = None
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The page is static; render it once and check it from every test
+        cls.html = cls.client.get('/').data.decode()
 
     def test_template_contains_all_tabs(self):
         """HTML should contain all 6 tab buttons."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('Camera 1 Setup', html)
-        self.assertIn('Camera 2 Setup', html)
-        self.assertIn('Recording', html)
-        self.assertIn('Recordings', html)
-        self.assertIn('Analysis', html)
-        self.assertIn('Compare', html)
+        self.assertIn('Camera 1 Setup', self.html)
+        self.assertIn('Camera 2 Setup', self.html)
+        self.assertIn('Recording', self.html)
+        self.assertIn('Recordings', self.html)
+        self.assertIn('Analysis', self.html)
+        self.assertIn('Compare', self.html)
 
     def test_template_contains_keyboard_hints(self):
         """HTML should include keyboard shortcut hints."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('[1]', html)
-        self.assertIn('[2]', html)
-        self.assertIn('[3]', html)
-        self.assertIn('[4]', html)
-        self.assertIn('[5]', html)
-        self.assertIn('[6]', html)
-        self.assertIn('Space', html)
+        self.assertIn('[1]', self.html)
+        self.assertIn('[2]', self.html)
+        self.assertIn('[3]', self.html)
+        self.assertIn('[4]', self.html)
+        self.assertIn('[5]', self.html)
+        self.assertIn('[6]', self.html)
+        self.assertIn('Space', self.html)
 
     def test_template_contains_video_feeds(self):
         """HTML should reference the MJPEG video feed URLs."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('/video_feed/1', html)
-        self.assertIn('/video_feed/2', html)
+        self.assertIn('/video_feed/1', self.html)
+        self.assertIn('/video_feed/2', self.html)
 
     def test_template_contains_recording_controls(self):
         """HTML should have recording start/stop UI."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('Start Recording', html)
-        self.assertIn('toggleRecording', html)
+        self.assertIn('Start Recording', self.html)
+        self.assertIn('toggleRecording', self.html)
 
     def test_template_contains_analysis_sections(self):
         """HTML should have analysis result sections."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('metrics-dashboard', html)
-        self.assertIn('timeseries-canvas', html)
-        self.assertIn('phase-badge', html)
-        self.assertIn('Face-On', html)
-        self.assertIn('Down-the-Line', html)
+        self.assertIn('metrics-dashboard', self.html)
+        self.assertIn('timeseries-canvas', self.html)
+        self.assertIn('phase-badge', self.html)
+        self.assertIn('Face-On', self.html)
+        self.assertIn('Down-the-Line', self.html)
 
     def test_template_contains_compare_tab(self):
         """HTML should have the comparison tab."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('tab-compare', html)
-        self.assertIn('compare-a', html)
-        self.assertIn('compare-b', html)
-        self.assertIn('compare-canvas', html)
+        self.assertIn('tab-compare', self.html)
+        self.assertIn('compare-a', self.html)
+        self.assertIn('compare-b', self.html)
+        self.assertIn('compare-canvas', self.html)
 
     def test_template_contains_property_controls(self):
         """HTML should have camera property sections."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('Camera 1 Properties', html)
-        self.assertIn('Camera 2 Properties', html)
-        self.assertIn('Save Settings', html)
-        self.assertIn('Reset Defaults', html)
+        self.assertIn('Camera 1 Properties', self.html)
+        self.assertIn('Camera 2 Properties', self.html)
+        self.assertIn('Save Settings', self.html)
+        self.assertIn('Reset Defaults', self.html)
 
     def test_template_contains_settings_display(self):
         """HTML should show the recording settings (fps, resolution)."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('120fps', html)
-        self.assertIn('1280x720', html)
+        self.assertIn('120fps', self.html)
+        self.assertIn('1280x720', self.html)
 
     def test_template_contains_frame_navigation(self):
         """HTML should have frame navigation controls."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('Prev', html)
-        self.assertIn('Next', html)
-        self.assertIn('frame-slider', html)
+        self.assertIn('Prev', self.html)
+        self.assertIn('Next', self.html)
+        self.assertIn('frame-slider', self.html)
 
 
 # ======================================================================
 # New Analysis & Compare Endpoints
 # ======================================================================
 
-class TestNewAnalysisEndpoints(unittest.TestCase):
+class TestNewAnalysisEndpoints(_AppClient, unittest.TestCase):
     """Test new API endpoints for analyses listing and comparison."""
 
-    def setUp(self):
-        app.config['TESTING'] = True
-        self.client = app.test_client()
-        import flask_gui
-        self.mgr = CameraManager()
-        flask_gui.camera_manager = self.mgr
-
-    def tearDown(self):
-        import flask_gui
-        flask_gui.camera_manager = None
-
     def test_analyses_list_endpoint_exists(self):
         """GET /api/analyses should return 200."""
         resp = self.client.get('/api/analyses')
@@ -844,23 +923,34 @@ class TestNewAnalysisEndpoints(unittest.TestCase):
         resp = self.client.get('/api/compare?a=20260215_140000')
         self.assertEqual(resp.status_code, 400)
 
+    def test_compare_summary_deltas(self):
+        """GET /api/compare should report b - a for each summary metric."""
+        saved = {
+            'a': {'camera1': {'summary': {'max_sway_left': -10.0}}, 'camera2': None},
+            'b': {'camera1': {'summary': {'max_sway_left': -12.5}}, 'camera2': None},
+        }
+        with patch('flask_gui._load_analysis', side_effect=saved.get):
+            resp = self.client.get('/api/compare?a=a&b=b')
+        self.assertEqual(resp.status_code, 200)
+        deltas = json.loads(resp.data)['deltas']
+        self.assertEqual(deltas['camera1']['max_sway_left'],
+                         {'a': -10.0, 'b': -12.5, 'delta': -2.5})
+        self.assertIsNone(deltas['camera1']['max_hip_turn']['delta'])
+        self.assertIsNone(deltas['camera2'])
+
 
 # ======================================================================
 # Video Playback & Auto-Detect Endpoints
 # ======================================================================
 
-class TestAnalysisFrameEndpoint(unittest.TestCase):
+class TestAnalysisFrameEndpoint(_AppClient, _ManagerTemplate, unittest.TestCase):
     """Test /api/analysis/frame/<camera_num> image endpoint."""
 
     def setUp(self):
-        app.config['TESTING'] = True
-        self.client = app.test_client()
-        import flask_gui
-        self.mgr = CameraManager()
+        self.mgr = self._new_manager()
         flask_gui.camera_manager = self.mgr
 
     def tearDown(self):
-        import flask_gui
         flask_gui.camera_manager = None
 
     def test_returns_placeholder_when_no_frames(self):
@@ -907,18 +997,14 @@ class TestAnalysisFrameEndpoint(unittest.TestCase):
         self.assertTrue(self.mgr.get_analysis_results()['has_frames'])
 
 
-class TestAutoDetectEndpoints(unittest.TestCase):
+class TestAutoDetectEndpoints(_AppClient, _ManagerTemplate, unittest.TestCase):
     """Test /api/auto-detect/* endpoints."""
 
     def setUp(self):
-        app.config['TESTING'] = True
-        self.client = app.test_client()
-        import flask_gui
-        self.mgr = CameraManager()
+        self.mgr = self._new_manager()
         flask_gui.camera_manager = self.mgr
 
     def tearDown(self):
-        import flask_gui
         if self.mgr.swing_detector:
             try:
                 self.mgr.swing_detector.release()
@@ -995,52 +1081,75 @@ class TestCompressFrames(unittest.TestCase):
         compressed = CameraManager._compress_frames([])
         self.assertEqual(compressed, [])
 
-
-class TestTemplateNewFeatures(unittest.TestCase):
+    def test_process_video_compressed_streams_frames(self):
+        frames = [np.full((50, 60, 3), i * 40, dtype=np.uint8) for i in range(3)]
+        processor = MagicMock()
+        processor.iter_video.return_value = iter([
+            ({'nose': {'x': 0.5, 'y': 0.5, 'z': 0.0, 'visibility': 1.0}}, frames[0]),
+            (None, frames[1]),
+            (None, frames[2]),
+        ])
+        landmarks, compressed = CameraManager._process_video_compressed(processor, 'v.mp4')
+        processor.iter_video.assert_called_once_with('v.mp4')
+        self.assertEqual(len(landmarks), 3)
+        self.assertIsNone(landmarks[1])
+        self.assertEqual(len(compressed), 3)
+        self.assertTrue(all(c[:2] == b'\xff\xd8' for c in compressed))
+
+    def test_process_video_compressed_bounds_queued_frames(self):
+        encoded = []
+        yielded = []
+
+        def slow_encode(frame):
+            time.sleep(0.005)
+            encoded.append(frame)
+            return b'jpeg'
+
+        def frames():
+            for i in range(12):
+                yielded.append(len(yielded) - len(encoded))
+                yield None, np.zeros((2, 2, 3), dtype=np.uint8)
+
+        processor = MagicMock()
+        processor.iter_video.return_value = frames()
+        with patch.object(CameraManager, '_compress_frame', side_effect=slow_encode):
+            _, compressed = CameraManager._process_video_compressed(processor, 'v.mp4')
+        self.assertEqual(compressed, [b'jpeg'] * 12)
+        self.assertLessEqual(max(yielded), CameraManager.ENCODE_AHEAD)
+
+
+class TestTemplateNewFeatures(_AppClient, unittest.TestCase):
     """Test that the template includes the new video playback and auto-detect UI."""
 
-    def setUp(self):
-        app.config['TESTING'] = True
-        self.client = app.test_client()
-        import flask_gui
-        self.mgr = CameraManager()
-        flask_gui.camera_manager = self.mgr
-
-    def tearDown(self):
-        import flask_gui
-        flask_gui.camera_manager = None
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The page is static; render it once and check it from every test
+        cls.html = cls.client.get('/').data.decode()
 
     def test_template_has_video_panels(self):
         """HTML should contain analysis video playback panels."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('analysis-video-panels', html)
-        self.assertIn('analysis-frame-cam1', html)
-        self.assertIn('analysis-frame-cam2', html)
+        self.assertIn('analysis-video-panels', self.html)
+        self.assertIn('analysis-frame-cam1', self.html)
+        self.assertIn('analysis-frame-cam2', self.html)
 
     def test_template_has_play_button(self):
         """HTML should contain the play/pause button."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('play-btn', html)
-        self.assertIn('togglePlayback', html)
-        self.assertIn('speed-label', html)
+        self.assertIn('play-btn', self.html)
+        self.assertIn('togglePlayback', self.html)
+        self.assertIn('speed-label', self.html)
 
     def test_template_has_auto_detect_toggle(self):
         """HTML should contain the auto-detect toggle switch."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('auto-detect-cb', html)
-        self.assertIn('Auto Detect', html)
-        self.assertIn('auto-detect-panel', html)
+        self.assertIn('auto-detect-cb', self.html)
+        self.assertIn('Auto Detect', self.html)
+        self.assertIn('auto-detect-panel', self.html)
 
     def test_template_has_auto_detect_gauge(self):
         """HTML should contain the shoulder turn gauge."""
-        resp = self.client.get('/')
-        html = resp.data.decode()
-        self.assertIn('auto-detect-gauge-fill', html)
-        self.assertIn('auto-detect-badge', html)
-        self.assertIn('Shoulder Turn', html)
+        self.assertIn('auto-detect-gauge-fill', self.html)
+        self.assertIn('auto-detect-badge', self.html)
+        self.assertIn('Shoulder Turn', self.html)
 
 
 # ======================================================================
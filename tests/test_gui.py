@@ -6,6 +6,7 @@ Tests button functionality, tab switching, and other GUI logic
 import sys
 import os
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch, PropertyMock
 import cv2
 import numpy as np
@@ -19,6 +20,32 @@ sys.path.insert(0, os.path.join(project_root, 'tests'))
 from camera_setup_recorder_gui import TabbedCameraGUI
 from test_utils import get_camera_ids
 
+# One patch each of cv2.VideoCapture and DualCameraRecorder for the whole
+# module; tests that need particular captures or recorders reset them in setUp.
+_video_capture = None
+_recorder_class = None
+
+# Blank 720p camera frame shared by every mocked read(); the GUI only resizes
+# it, so it is made read-only to catch anything that would write into it
+_CAMERA_FRAME = np.zeros((720, 1280, 3), dtype=np.uint8)
+_CAMERA_FRAME.flags.writeable = False
+
+
+def setUpModule():
+    global _video_capture, _recorder_class
+    capture_patcher = patch('cv2.VideoCapture')
+    recorder_patcher = patch('camera_setup_recorder_gui.DualCameraRecorder')
+    _video_capture = capture_patcher.start()
+    unittest.addModuleCleanup(capture_patcher.stop)
+    _recorder_class = recorder_patcher.start()
+    unittest.addModuleCleanup(recorder_patcher.stop)
+
+
+def _captures_return(*caps):
+    """Reset the module-wide VideoCapture mock to hand out the given captures."""
+    _video_capture.reset_mock(return_value=True, side_effect=True)
+    _video_capture.side_effect = list(caps)
+
 
 class TestGUIInitialization(unittest.TestCase):
     """Test GUI initialization with platform-appropriate defaults"""
@@ -26,47 +53,42 @@ class TestGUIInitialization(unittest.TestCase):
     def test_platform_defaults_linux(self):
         """Test that Linux uses cameras 0, 1 by default"""
         with patch('sys.platform', 'linux'):
-            with patch('cv2.VideoCapture'):
-                gui = TabbedCameraGUI()
-                self.assertEqual(gui.camera1_id, 0)
-                self.assertEqual(gui.camera2_id, 1)
+            gui = TabbedCameraGUI()
+            self.assertEqual(gui.camera1_id, 0)
+            self.assertEqual(gui.camera2_id, 1)
     
     def test_platform_defaults_windows(self):
         """Test that Windows uses cameras from config file"""
         with patch('sys.platform', 'win32'):
-            with patch('cv2.VideoCapture'):
-                # Get expected camera IDs from config file
-                expected_cam1_id, expected_cam2_id = get_camera_ids()
-                gui = TabbedCameraGUI()
-                self.assertEqual(gui.camera1_id, expected_cam1_id)
-                self.assertEqual(gui.camera2_id, expected_cam2_id)
+            # Get expected camera IDs from config file
+            expected_cam1_id, expected_cam2_id = get_camera_ids()
+            gui = TabbedCameraGUI()
+            self.assertEqual(gui.camera1_id, expected_cam1_id)
+            self.assertEqual(gui.camera2_id, expected_cam2_id)
     
     def test_explicit_camera_ids(self):
         """Test that explicit camera IDs override defaults"""
-        with patch('cv2.VideoCapture'):
-            gui = TabbedCameraGUI(camera1_id=5, camera2_id=7)
-            self.assertEqual(gui.camera1_id, 5)
-            self.assertEqual(gui.camera2_id, 7)
+        gui = TabbedCameraGUI(camera1_id=5, camera2_id=7)
+        self.assertEqual(gui.camera1_id, 5)
+        self.assertEqual(gui.camera2_id, 7)
     
     def test_tab_names(self):
         """Test that all 4 tabs are present"""
-        with patch('cv2.VideoCapture'):
-            gui = TabbedCameraGUI()
-            self.assertEqual(len(gui.tab_names), 4)
-            self.assertIn("Camera 1 Setup", gui.tab_names)
-            self.assertIn("Camera 2 Setup", gui.tab_names)
-            self.assertIn("Recording", gui.tab_names)
-            self.assertIn("Analysis", gui.tab_names)
+        gui = TabbedCameraGUI()
+        self.assertEqual(len(gui.tab_names), 4)
+        self.assertIn("Camera 1 Setup", gui.tab_names)
+        self.assertIn("Camera 2 Setup", gui.tab_names)
+        self.assertIn("Recording", gui.tab_names)
+        self.assertIn("Analysis", gui.tab_names)
     
     def test_initial_state(self):
         """Test initial GUI state"""
-        with patch('cv2.VideoCapture'):
-            gui = TabbedCameraGUI()
-            self.assertEqual(gui.current_tab, 0)
-            self.assertFalse(gui.is_recording)
-            self.assertFalse(gui.is_analyzing)
-            self.assertIsNone(gui.analysis_camera1)
-            self.assertIsNone(gui.analysis_camera2)
+        gui = TabbedCameraGUI()
+        self.assertEqual(gui.current_tab, 0)
+        self.assertFalse(gui.is_recording)
+        self.assertFalse(gui.is_analyzing)
+        self.assertIsNone(gui.analysis_camera1)
+        self.assertIsNone(gui.analysis_camera2)
 
 
 class TestTabSwitching(unittest.TestCase):
@@ -74,8 +96,7 @@ class TestTabSwitching(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI instance for testing"""
-        with patch('cv2.VideoCapture'):
-            self.gui = TabbedCameraGUI()
+        self.gui = TabbedCameraGUI()
     
     def test_tab_cycle_next(self):
         """Test cycling to next tab"""
@@ -122,65 +143,59 @@ class TestRecordingControls(unittest.TestCase):
         self.mock_cap1.get.return_value = 1280  # width
         self.mock_cap2.get.return_value = 1280
         
-        with patch('cv2.VideoCapture') as mock_cap_class:
-            mock_cap_class.side_effect = [self.mock_cap1, self.mock_cap2]
-            
-            # Mock DualCameraRecorder
-            with patch('camera_setup_recorder_gui.DualCameraRecorder'):
-                self.gui = TabbedCameraGUI()
-                self.gui.cap1 = self.mock_cap1
-                self.gui.cap2 = self.mock_cap2
+        _captures_return(self.mock_cap1, self.mock_cap2)
+        _recorder_class.reset_mock(return_value=True, side_effect=True)
+        
+        self.gui = TabbedCameraGUI()
+        self.gui.cap1 = self.mock_cap1
+        self.gui.cap2 = self.mock_cap2
     
     def test_start_recording_creates_recorder(self):
         """Test that start_recording creates DualCameraRecorder"""
-        with patch('camera_setup_recorder_gui.DualCameraRecorder') as mock_recorder_class:
-            mock_recorder = MagicMock()
-            mock_recorder.video1_path = "test1.mp4"
-            mock_recorder.video2_path = "test2.mp4"
-            mock_recorder.output_dir = "recordings"
-            mock_recorder.camera1 = MagicMock()
-            mock_recorder.camera2 = MagicMock()
-            mock_recorder.camera1.cap = self.mock_cap1
-            mock_recorder.camera2.cap = self.mock_cap2
-            mock_recorder.start_cameras.return_value = None
-            mock_recorder.start_recording.return_value = None
-            mock_recorder_class.return_value = mock_recorder
+        mock_recorder = MagicMock()
+        mock_recorder.video1_path = "test1.mp4"
+        mock_recorder.video2_path = "test2.mp4"
+        mock_recorder.output_dir = "recordings"
+        mock_recorder.camera1 = SimpleNamespace(set_property=self.mock_cap1.set)
+        mock_recorder.camera2 = SimpleNamespace(set_property=self.mock_cap2.set)
+        mock_recorder.start_cameras.return_value = None
+        mock_recorder.start_recording.return_value = None
+        _recorder_class.return_value = mock_recorder
             
-            # Ensure cameras are marked as available
-            self.gui.cameras_available = True
-            self.gui.recorder = None
-            self.gui.current_tab = 2  # Recording tab
-            self.gui.start_recording()
+        # Ensure cameras are marked as available
+        self.gui.cameras_available = True
+        self.gui.recorder = None
+        self.gui.current_tab = 2  # Recording tab
+        self.gui.start_recording()
             
-            self.assertIsNotNone(self.gui.recorder)
-            self.assertTrue(self.gui.is_recording)
-            mock_recorder.start_cameras.assert_called_once()
-            mock_recorder.start_recording.assert_called_once()
+        self.assertIsNotNone(self.gui.recorder)
+        self.assertTrue(self.gui.is_recording)
+        mock_recorder.start_cameras.assert_called_once()
+        mock_recorder.start_recording.assert_called_once()
     
     def test_start_recording_fails_when_cameras_unavailable(self):
         """Test that start_recording fails gracefully when cameras are unavailable"""
-        with patch('camera_setup_recorder_gui.DualCameraRecorder') as mock_recorder_class:
-            # Set cameras as unavailable (failed to open)
-            self.gui.cameras_available = False
-            self.gui.cap1 = None
-            self.gui.cap2 = None
-            self.gui.recorder = None
-            self.gui.is_recording = False
-            self.gui.status_message = ""
-            self.gui.status_time = 0
+        # Set cameras as unavailable (failed to open)
+        self.gui.cameras_available = False
+        self.gui.cap1 = None
+        self.gui.cap2 = None
+        self.gui.recorder = None
+        self.gui.is_recording = False
+        self.gui.status_message = ""
+        self.gui.status_time = 0
             
-            # Try to start recording
-            self.gui.start_recording()
+        # Try to start recording
+        self.gui.start_recording()
             
-            # Verify recording was NOT started
-            self.assertFalse(self.gui.is_recording, 
-                           "Recording should not start when cameras unavailable")
-            self.assertIsNone(self.gui.recorder, 
-                            "Recorder should not be created when cameras unavailable")
-            self.assertIn("not available", self.gui.status_message.lower(),
-                         "Status message should indicate cameras not available")
-            # Verify DualCameraRecorder was never instantiated
-            mock_recorder_class.assert_not_called()
+        # Verify recording was NOT started
+        self.assertFalse(self.gui.is_recording, 
+                       "Recording should not start when cameras unavailable")
+        self.assertIsNone(self.gui.recorder, 
+                        "Recorder should not be created when cameras unavailable")
+        self.assertIn("not available", self.gui.status_message.lower(),
+                     "Status message should indicate cameras not available")
+        # Verify DualCameraRecorder was never instantiated
+        _recorder_class.assert_not_called()
     
     def test_stop_recording(self):
         """Test that stop_recording stops the recording"""
@@ -192,8 +207,8 @@ class TestRecordingControls(unittest.TestCase):
         self.gui.recording_start_time = 0
         self.gui.recording_files = ["test1.mp4", "test2.mp4"]
         
-        with patch('time.time', return_value=5.0):
-            self.gui.stop_recording()
+        self.gui._now = lambda: 5.0
+        self.gui.stop_recording()
         
         self.assertFalse(self.gui.is_recording)
         mock_recorder.stop_recording.assert_called_once()
@@ -216,10 +231,9 @@ class TestAnalysisIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI instance"""
-        with patch('cv2.VideoCapture'):
-            with patch('camera_setup_recorder_gui.PoseProcessor'):
-                with patch('camera_setup_recorder_gui.SwayCalculator'):
-                    self.gui = TabbedCameraGUI()
+        with patch('camera_setup_recorder_gui.PoseProcessor'):
+            with patch('camera_setup_recorder_gui.SwayCalculator'):
+                self.gui = TabbedCameraGUI()
     
     def test_analysis_state_initialization(self):
         """Test that analysis state variables are initialized"""
@@ -256,8 +270,8 @@ class TestAnalysisIntegration(unittest.TestCase):
         
         with patch('os.path.exists', return_value=True):
             with patch.object(self.gui, 'start_analysis') as mock_start_analysis:
-                with patch('time.time', return_value=5.0):
-                    self.gui.stop_recording()
+                self.gui._now = lambda: 5.0
+                self.gui.stop_recording()
                     
                 # Check that start_analysis was called
                 mock_start_analysis.assert_called_once()
@@ -268,17 +282,16 @@ class TestCameraPropertyAdjustment(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI with mocked cameras"""
-        with patch('cv2.VideoCapture') as mock_cap_class:
-            self.mock_cap1 = MagicMock()
-            self.mock_cap2 = MagicMock()
-            self.mock_cap1.isOpened.return_value = True
-            self.mock_cap2.isOpened.return_value = True
-            self.mock_cap1.get.return_value = 128  # brightness
-            mock_cap_class.side_effect = [self.mock_cap1, self.mock_cap2]
-            
-            self.gui = TabbedCameraGUI()
-            self.gui.cap1 = self.mock_cap1
-            self.gui.cap2 = self.mock_cap2
+        self.mock_cap1 = MagicMock()
+        self.mock_cap2 = MagicMock()
+        self.mock_cap1.isOpened.return_value = True
+        self.mock_cap2.isOpened.return_value = True
+        self.mock_cap1.get.return_value = 128  # brightness
+        _captures_return(self.mock_cap1, self.mock_cap2)
+        
+        self.gui = TabbedCameraGUI()
+        self.gui.cap1 = self.mock_cap1
+        self.gui.cap2 = self.mock_cap2
     
     def test_adjust_property_brightness(self):
         """Test adjusting brightness property"""
@@ -305,8 +318,7 @@ class TestTextRendering(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI instance"""
-        with patch('cv2.VideoCapture'):
-            self.gui = TabbedCameraGUI()
+        self.gui = TabbedCameraGUI()
     
     def _find_text_in_region(self, frame, text, region_bounds, min_brightness=200):
         """Helper: Check if text is visible in a region of the frame"""
@@ -455,16 +467,12 @@ class TestTextRendering(unittest.TestCase):
         """Test that recording tab displays camera labels correctly"""
         frame = np.zeros((900, 1600, 3), dtype=np.uint8)
         
-        # Mock camera frames
-        mock_frame1 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        mock_frame2 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        
         with patch.object(self.gui, 'cap1') as mock_cap1, \
              patch.object(self.gui, 'cap2') as mock_cap2:
             mock_cap1.isOpened.return_value = True
             mock_cap2.isOpened.return_value = True
-            mock_cap1.read.return_value = (True, mock_frame1)
-            mock_cap2.read.return_value = (True, mock_frame2)
+            mock_cap1.read.return_value = (True, _CAMERA_FRAME)
+            mock_cap2.read.return_value = (True, _CAMERA_FRAME)
             
             frame = self.gui.draw_recording_tab(frame)
         
@@ -495,8 +503,8 @@ class TestTextRendering(unittest.TestCase):
         # Test recording state
         self.gui.is_recording = True
         self.gui.recording_start_time = 0
-        with patch('time.time', return_value=5.0):
-            frame = self.gui.draw_recording_tab(frame)
+        self.gui._now = lambda: 5.0
+        frame = self.gui.draw_recording_tab(frame)
         
         h, w = frame.shape[:2]
         content_y = self.gui.tab_height + 10
@@ -574,7 +582,7 @@ class TestTextRendering(unittest.TestCase):
         # Mock camera
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = True
-        mock_cap.read.return_value = (True, np.zeros((720, 1280, 3), dtype=np.uint8))
+        mock_cap.read.return_value = (True, _CAMERA_FRAME)
         mock_cap.get.side_effect = lambda x: {
             cv2.CAP_PROP_FRAME_WIDTH: 1280,
             cv2.CAP_PROP_FRAME_HEIGHT: 720,
@@ -605,7 +613,7 @@ class TestTextRendering(unittest.TestCase):
         # Mock camera
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = True
-        mock_cap.read.return_value = (True, np.zeros((720, 1280, 3), dtype=np.uint8))
+        mock_cap.read.return_value = (True, _CAMERA_FRAME)
         mock_cap.get.side_effect = lambda x: {
             cv2.CAP_PROP_FRAME_WIDTH: 1280,
             cv2.CAP_PROP_FRAME_HEIGHT: 720,
@@ -648,7 +656,7 @@ class TestTextRendering(unittest.TestCase):
         # Mock camera
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = True
-        mock_cap.read.return_value = (True, np.zeros((720, 1280, 3), dtype=np.uint8))
+        mock_cap.read.return_value = (True, _CAMERA_FRAME)
         mock_cap.get.side_effect = lambda x: 128 if x not in [cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT, cv2.CAP_PROP_FPS] else (1280 if x == cv2.CAP_PROP_FRAME_WIDTH else (720 if x == cv2.CAP_PROP_FRAME_HEIGHT else 60.0))
         
         self.gui.cap1 = mock_cap
@@ -690,23 +698,20 @@ class TestTextRendering(unittest.TestCase):
         frame = np.zeros((900, 1600, 3), dtype=np.uint8)
         
         # Mock cameras
-        mock_frame1 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        mock_frame2 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        
         with patch.object(self.gui, 'cap1') as mock_cap1, \
              patch.object(self.gui, 'cap2') as mock_cap2:
             mock_cap1.isOpened.return_value = True
             mock_cap2.isOpened.return_value = True
-            mock_cap1.read.return_value = (True, mock_frame1)
-            mock_cap2.read.return_value = (True, mock_frame2)
+            mock_cap1.read.return_value = (True, _CAMERA_FRAME)
+            mock_cap2.read.return_value = (True, _CAMERA_FRAME)
             
             self.gui.is_recording = True
             self.gui.recording_start_time = 0
             self.gui.recording_files = ["test_camera1_20240101_120000.mp4", 
                                         "test_camera2_20240101_120000.mp4"]
             
-            with patch('time.time', return_value=5.0):
-                frame = self.gui.draw_recording_tab(frame)
+            self.gui._now = lambda: 5.0
+            frame = self.gui.draw_recording_tab(frame)
         
         # Check for file name text
         h, w = frame.shape[:2]
@@ -729,21 +734,18 @@ class TestTextRendering(unittest.TestCase):
         """Test that recording tab renders duration text"""
         frame = np.zeros((900, 1600, 3), dtype=np.uint8)
         
-        mock_frame1 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        mock_frame2 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        
         with patch.object(self.gui, 'cap1') as mock_cap1, \
              patch.object(self.gui, 'cap2') as mock_cap2:
             mock_cap1.isOpened.return_value = True
             mock_cap2.isOpened.return_value = True
-            mock_cap1.read.return_value = (True, mock_frame1)
-            mock_cap2.read.return_value = (True, mock_frame2)
+            mock_cap1.read.return_value = (True, _CAMERA_FRAME)
+            mock_cap2.read.return_value = (True, _CAMERA_FRAME)
             
             self.gui.is_recording = True
             self.gui.recording_start_time = 0
             
-            with patch('time.time', return_value=12.5):  # 12.5 seconds elapsed
-                frame = self.gui.draw_recording_tab(frame)
+            self.gui._now = lambda: 12.5  # 12.5 seconds elapsed
+            frame = self.gui.draw_recording_tab(frame)
         
         # Check for duration text
         h, w = frame.shape[:2]
@@ -762,15 +764,12 @@ class TestTextRendering(unittest.TestCase):
         """Test that recording tab renders button text correctly"""
         frame = np.zeros((900, 1600, 3), dtype=np.uint8)
         
-        mock_frame1 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        mock_frame2 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        
         with patch.object(self.gui, 'cap1') as mock_cap1, \
              patch.object(self.gui, 'cap2') as mock_cap2:
             mock_cap1.isOpened.return_value = True
             mock_cap2.isOpened.return_value = True
-            mock_cap1.read.return_value = (True, mock_frame1)
-            mock_cap2.read.return_value = (True, mock_frame2)
+            mock_cap1.read.return_value = (True, _CAMERA_FRAME)
+            mock_cap2.read.return_value = (True, _CAMERA_FRAME)
             
             # Test START button
             self.gui.is_recording = False
@@ -795,8 +794,8 @@ class TestTextRendering(unittest.TestCase):
             self.gui.is_recording = True
             self.gui.recording_start_time = 0
             
-            with patch('time.time', return_value=5.0):
-                frame2 = self.gui.draw_recording_tab(frame2)
+            self.gui._now = lambda: 5.0
+            frame2 = self.gui.draw_recording_tab(frame2)
             
             stop_x = w - 200
             stop_y = status_y - 10
@@ -999,15 +998,12 @@ class TestTextRendering(unittest.TestCase):
         h, w = frame.shape[:2]
         
         # Recording tab instructions
-        mock_frame1 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        mock_frame2 = np.zeros((720, 1280, 3), dtype=np.uint8)
-        
         with patch.object(self.gui, 'cap1') as mock_cap1, \
              patch.object(self.gui, 'cap2') as mock_cap2:
             mock_cap1.isOpened.return_value = True
             mock_cap2.isOpened.return_value = True
-            mock_cap1.read.return_value = (True, mock_frame1)
-            mock_cap2.read.return_value = (True, mock_frame2)
+            mock_cap1.read.return_value = (True, _CAMERA_FRAME)
+            mock_cap2.read.return_value = (True, _CAMERA_FRAME)
             
             frame = self.gui.draw_recording_tab(frame)
         
@@ -1088,8 +1084,7 @@ class TestAnalysisTabRendering(unittest.TestCase):
     
     def setUp(self):
         """Set up GUI instance"""
-        with patch('cv2.VideoCapture'):
-            self.gui = TabbedCameraGUI()
+        self.gui = TabbedCameraGUI()
     
     def test_analysis_frame_index_exists(self):
         """Test that analysis_frame_index state variable exists"""
@@ -0,0 +1,72 @@
+"""
+Tests for PoseProcessor delegate selection.
+
+The MediaPipe landmarker is replaced with mocks, so no model file or GPU
+is needed.
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Add project paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import pose_processor
+from pose_processor import PoseProcessor, python
+
+
+class TestDelegateFallback(unittest.TestCase):
+    """The GPU delegate is used only if it survives creation and a first inference."""
+
+    def setUp(self):
+        self.landmarkers = {}
+
+        def create(options):
+            delegate = options.base_options.delegate
+            landmarker = MagicMock(name=str(delegate))
+            self.landmarkers[delegate] = landmarker
+            if delegate == python.BaseOptions.Delegate.GPU and self.gpu_warmup_error:
+                landmarker.detect_for_video.side_effect = self.gpu_warmup_error
+            return landmarker
+
+        self.gpu_warmup_error = None
+        patchers = [
+            patch.object(pose_processor.vision.PoseLandmarker, 'create_from_options', side_effect=create),
+            patch.object(pose_processor.os.path, 'exists', return_value=True),
+            patch.object(PoseProcessor, '_gpu_unavailable', False),
+            patch('builtins.print'),
+        ]
+        for p in patchers:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _new(self):
+        return PoseProcessor(model_path='pose.task')
+
+    def test_gpu_used_when_warmup_succeeds(self):
+        proc = self._new()
+        self.assertTrue(proc.uses_gpu)
+        self.assertIs(proc.pose_landmarker, self.landmarkers[python.BaseOptions.Delegate.GPU])
+        self.assertNotIn(python.BaseOptions.Delegate.CPU, self.landmarkers)
+
+    def test_gpu_warmup_failure_falls_back_to_cpu(self):
+        self.gpu_warmup_error = RuntimeError('Unable to initialize EGL')
+        proc = self._new()
+        self.assertFalse(proc.uses_gpu)
+        self.landmarkers[python.BaseOptions.Delegate.GPU].close.assert_called_once()
+        cpu = self.landmarkers[python.BaseOptions.Delegate.CPU]
+        self.assertIs(proc.pose_landmarker, cpu)
+        cpu.detect_for_video.assert_called_once()
+        self.assertTrue(PoseProcessor._gpu_unavailable)
+
+        # Later instances go straight to CPU
+        self.landmarkers.clear()
+        self._new()
+        self.assertEqual(list(self.landmarkers), [python.BaseOptions.Delegate.CPU])
+
+
+if __name__ == '__main__':
+    unittest.main()
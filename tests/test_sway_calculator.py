@@ -9,8 +9,11 @@ import unittest
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-from sway_calculator import SwayCalculator, _angle_between
+from sway_calculator import (PHASE_NAMES, SwayCalculator, _angle_between, _stack_landmarks,
+                             pack_landmarks, unpack_landmarks)
 
 
 # ---------------------------------------------------------------------------
@@ -131,6 +134,14 @@ class TestLateralSway(unittest.TestCase):
     def test_none_with_none_landmarks(self):
         self.assertIsNone(self.calc.calculate_lateral_sway(None, 640))
 
+    def test_reassigning_address_updates_reference(self):
+        moved = _make_landmarks({
+            'left_hip': {'x': 0.50, 'y': 0.60, 'z': -0.02, 'visibility': 1.0},
+            'right_hip': {'x': 0.60, 'y': 0.60, 'z': 0.02, 'visibility': 1.0},
+        })
+        self.calc.address_landmarks = moved
+        self.assertAlmostEqual(self.calc.calculate_lateral_sway(moved, 640), 0.0, places=3)
+
 
 class TestShoulderTurn(unittest.TestCase):
     def setUp(self):
@@ -218,6 +229,12 @@ class TestHeadSway(unittest.TestCase):
         del lm['nose']
         self.assertIsNone(self.calc.calculate_head_sway(lm, 640))
 
+    def test_none_when_address_has_no_nose(self):
+        addr = _make_landmarks()
+        del addr['nose']
+        self.calc.set_address_position(addr)
+        self.assertIsNone(self.calc.calculate_head_sway(self.address, 640))
+
 
 class TestSpineTilt(unittest.TestCase):
     def setUp(self):
@@ -435,6 +452,13 @@ class TestTempo(unittest.TestCase):
         tempo = SwayCalculator.calculate_tempo(phases)
         self.assertAlmostEqual(tempo, 0.0)
 
+    def test_phase_codes_match_names(self):
+        phases = ['Address', 'Backswing', 'Backswing', 'Backswing',
+                  'Top', 'Downswing', 'Impact', 'Follow-through']
+        codes = np.array([PHASE_NAMES.index(p) for p in phases], dtype=np.int8)
+        self.assertEqual(SwayCalculator.calculate_tempo(codes),
+                         SwayCalculator.calculate_tempo(phases))
+
 
 class TestAnalyzeSequence(unittest.TestCase):
     """Integration test for the full analyze_sequence method."""
@@ -530,6 +554,153 @@ class TestAnalyzeSequence(unittest.TestCase):
         results = calc.analyze_sequence(seq, frame_width=640)
         self.assertTrue(results['tempo'] is None or isinstance(results['tempo'], (int, float)))
 
+    def test_weight_shift_edge_cases(self):
+        stacked = _make_landmarks({'left_ankle': {'x': 0.5}, 'right_ankle': {'x': 0.5}})
+        no_hips = _make_landmarks({'left_ankle': {'x': 0.5}, 'right_ankle': {'x': 0.5}, 'left_hip': None})
+        past_lead = _make_landmarks({'left_ankle': {'x': 0.52}, 'right_ankle': {'x': 0.48},
+                                     'left_hip': {'x': 0.6}, 'right_hip': {'x': 0.7}})
+        results = SwayCalculator().analyze_sequence([stacked, no_hips, past_lead])
+        self.assertEqual(results['weight_shift'][0], 50.0)
+        self.assertIsNone(results['weight_shift'][1])
+        self.assertEqual(results['weight_shift'][2], 100.0)
+
+    def test_explicit_address_frame(self):
+        seq = _make_sequence(8)
+        results = SwayCalculator().analyze_sequence(seq, frame_width=640, address_frame_idx=3)
+        self.assertAlmostEqual(results['sway'][3], 0.0, places=3)
+        self.assertAlmostEqual(results['head_sway'][3], 0.0, places=3)
+        self.assertLess(results['head_sway'][0], 0)
+
+    def test_explicit_address_frame_without_landmarks(self):
+        seq = _make_sequence(5)
+        seq[1] = None
+        with self.assertRaises(ValueError):
+            SwayCalculator().analyze_sequence(seq, address_frame_idx=1)
+
+    def test_x_factor_derived_from_reported_turns(self):
+        seq = _make_sequence(8)
+        seq[2] = None
+        results = SwayCalculator().analyze_sequence(seq, frame_width=640)
+        for st, ht, xf in zip(results['shoulder_turn'], results['hip_turn'], results['x_factor']):
+            if st is None or ht is None:
+                self.assertIsNone(xf)
+            else:
+                self.assertAlmostEqual(xf, abs(st - ht), places=4)
+
+    def test_vectorised_metrics_match_scalar_methods(self):
+        seq = _make_sequence(8)
+        seq[3] = None
+        seq[5] = _make_landmarks({'left_hip': None})
+        seq[6] = _make_landmarks({'left_ankle': {'x': 0.55}, 'left_elbow': None})
+        seq[7]['left_knee'] = dict(seq[7]['left_hip'])  # degenerate knee angle
+        calc = SwayCalculator()
+        results = calc.analyze_sequence(seq, frame_width=640)
+        ref = SwayCalculator()
+        ref.set_address_position(seq[0])
+        for i, lm in enumerate(seq):
+            for key, expected in (
+                ('sway', ref.calculate_lateral_sway(lm, 640)),
+                ('shoulder_turn', ref.calculate_shoulder_turn(lm)),
+                ('hip_turn', ref.calculate_hip_turn(lm)),
+                ('x_factor', ref.calculate_x_factor(lm)),
+                ('head_sway', ref.calculate_head_sway(lm, 640)),
+                ('spine_tilt', ref.calculate_spine_tilt(lm)),
+                ('spine_angle', ref.calculate_spine_angle(lm)),
+                ('knee_flex', ref.calculate_knee_flex(lm)),
+                ('lead_arm_angle', ref.calculate_lead_arm_angle(lm)),
+                ('weight_shift', ref.calculate_weight_shift(lm)),
+            ):
+                if expected is None:
+                    self.assertIsNone(results[key][i], f"{key}[{i}]")
+                else:
+                    self.assertAlmostEqual(results[key][i], expected, places=3, msg=f"{key}[{i}]")
+            expected_hip = ref.calculate_hip_center(lm)
+            if expected_hip is None:
+                self.assertIsNone(results['hip_center'][i])
+            else:
+                self.assertAlmostEqual(results['hip_center'][i][0], expected_hip[0], places=5)
+                self.assertAlmostEqual(results['hip_center'][i][1], expected_hip[1], places=5)
+
+    def test_float_array_matches_dicts(self):
+        seq = _make_sequence(10)
+        seq[4] = None
+        del seq[6]['nose']
+        expected = SwayCalculator().analyze_sequence(seq, frame_width=640)
+        results = SwayCalculator().analyze_sequence(_stack_landmarks(seq), frame_width=640)
+        self.assertEqual(results, expected)
+
+    def test_metrics_match_scalar_methods_exactly(self):
+        # analyze_sequence works in float64, so stored values carry no float32
+        # rounding noise and agree with the scalar methods over jittered poses
+        rng = np.random.default_rng(0)
+        seq = []
+        for jitter in rng.uniform(-0.05, 0.05, size=(200, 13, 3)):
+            lm = _make_landmarks()
+            for point, (dx, dy, dz) in zip(lm.values(), jitter):
+                point.update(x=point['x'] + dx, y=point['y'] + dy, z=point['z'] + dz)
+            seq.append(lm)
+        results = SwayCalculator().analyze_sequence(seq, frame_width=640)
+        ref = SwayCalculator()
+        ref.set_address_position(seq[0])
+        for key, method in (('sway', lambda lm: ref.calculate_lateral_sway(lm, 640)),
+                            ('head_sway', lambda lm: ref.calculate_head_sway(lm, 640)),
+                            ('weight_shift', ref.calculate_weight_shift),
+                            ('shoulder_turn', ref.calculate_shoulder_turn),
+                            ('hip_turn', ref.calculate_hip_turn),
+                            ('spine_tilt', ref.calculate_spine_tilt),
+                            ('spine_angle', ref.calculate_spine_angle),
+                            ('knee_flex', ref.calculate_knee_flex),
+                            ('lead_arm_angle', ref.calculate_lead_arm_angle)):
+            error = max(abs(a - method(lm)) for a, lm in zip(results[key], seq))
+            self.assertLess(error, 1e-9, key)
+
+
+class TestCoreMetricKernels(unittest.TestCase):
+    """The fused-loop kernel (Numba-compiled when available) must match NumPy."""
+
+    def test_loop_matches_numpy(self):
+        from sway_calculator import _core_metrics_loop, _core_metrics_numpy, _stack_landmarks
+        seq = _make_sequence(12)
+        seq[3] = None
+        seq[7] = _make_landmarks({'right_hip': None})
+        arr = _stack_landmarks(seq)
+        for address_idx in (0, -1):
+            expected = _core_metrics_numpy(arr, address_idx, 640)
+            actual = _core_metrics_loop(arr, address_idx, 640)
+            for e, a in zip(expected, actual):
+                self.assertEqual(list(np.isnan(e)), list(np.isnan(a)))
+                mask = ~np.isnan(e)
+                self.assertTrue(np.allclose(e[mask], a[mask], atol=1e-4))
+
+
+class TestPackedLandmarks(unittest.TestCase):
+    """Test int16 fixed-point landmark storage."""
+
+    def test_round_trip(self):
+        seq = _make_sequence(5)
+        seq[2] = None
+        del seq[3]['left_knee']
+        packed = pack_landmarks(seq)
+        self.assertEqual(packed.dtype.name, 'int16')
+        restored = unpack_landmarks(packed)
+        self.assertIsNone(restored[2])
+        self.assertNotIn('left_knee', restored[3])
+        for name, lm in seq[4].items():
+            for k in ('x', 'y', 'z', 'visibility'):
+                self.assertAlmostEqual(restored[4][name][k], lm[k], delta=1e-4)
+
+    def test_analyze_packed_matches_dicts(self):
+        seq = _make_sequence(10)
+        seq[4] = None
+        expected = SwayCalculator().analyze_sequence(seq, frame_width=640)
+        packed = SwayCalculator().analyze_sequence(pack_landmarks(seq), frame_width=640)
+        self.assertEqual(packed['phases'], expected['phases'])
+        for key, value in expected['summary'].items():
+            if value is None:
+                self.assertIsNone(packed['summary'][key], key)
+            else:
+                self.assertAlmostEqual(packed['summary'][key], value, delta=0.1, msg=key)
+
 
 class TestLegacyInterface(unittest.TestCase):
     """Test backwards-compatible legacy functions."""
@@ -7,6 +7,8 @@ requiring real cameras or MediaPipe models.
 
 import sys
 import os
+import math
+import threading
 import time
 import unittest
 from unittest.mock import patch, MagicMock
@@ -16,7 +18,7 @@ import numpy as np
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, os.path.join(project_root, 'src'))
 
-from swing_detector import SwingDetector
+from swing_detector import SwingDetector, _shoulder_turn_scalar
 
 
 class _MockableSwingDetector(SwingDetector):
@@ -28,15 +30,20 @@ class _MockableSwingDetector(SwingDetector):
         self.confirmation_frames = kwargs.get('confirmation_frames', 5)
         self.cooldown_seconds = kwargs.get('cooldown_seconds', 2.0)
         self.window_size = kwargs.get('window_size', 10)
+        self.idle_skip = kwargs.get('idle_skip', 0)
 
         self.state = self.IDLE
         self._confirm_count = 0
         self._cooldown_start = None
+        self._frame_counter = 0
+        self._last_checked = 0.0
         self._baseline = None
         from collections import deque
         self._history = deque(maxlen=self.window_size)
         self._current_turn = None
         self._processor = None
+        self._processor_lock = threading.Lock()
+        self._released = False
         self._model_complexity = 0
 
         # Queue of turn values to feed
@@ -235,6 +242,15 @@ class TestResetAndRelease(unittest.TestCase):
         det = _MockableSwingDetector()
         det.release()  # should not raise
 
+    @patch('swing_detector.PoseProcessor')
+    def test_no_processor_rebuilt_after_release(self, MockProcessor):
+        """A capture thread still holding the detector must not reopen MediaPipe."""
+        det = SwingDetector()
+        det.release()
+        self.assertIsNone(det._get_shoulder_turn(np.zeros((10, 10, 3), dtype=np.uint8)))
+        MockProcessor.assert_not_called()
+        self.assertIsNone(det._processor)
+
 
 class TestGetStatus(unittest.TestCase):
     """Test the get_status() serialisation helper."""
@@ -313,6 +329,67 @@ class TestFullSwingCycle(unittest.TestCase):
         self.assertIn('start', events2)
 
 
+class TestIdleSkip(unittest.TestCase):
+    """Test that pose checks are thinned out while idle."""
+
+    def _counting_detector(self, **kwargs):
+        det = _MockableSwingDetector(**kwargs)
+        det.checked = 0
+        # Frozen clock: only the frame counter decides which frames are checked
+        det.clock = 100.0
+        det._now = lambda: det.clock
+
+        def turn(frame):
+            det.checked += 1
+            return 0.0
+        det._get_shoulder_turn = turn
+        return det
+
+    def test_idle_checks_every_third_frame(self):
+        det = self._counting_detector(idle_skip=2)
+        dummy = np.zeros((10, 10, 3), dtype=np.uint8)
+        for _ in range(9):
+            det.process_frame(dummy)
+        # The first frame is always checked, then frames 3, 6 and 9
+        self.assertEqual(det.checked, 4)
+
+    def test_every_frame_checked_once_motion_seen(self):
+        det = _MockableSwingDetector(motion_threshold=10, confirmation_frames=3, idle_skip=2)
+        det.state = SwingDetector.MOTION_DETECTED
+        det._confirm_count = 1
+        det._baseline = 0.0
+        events = det.feed_turns([25, 25])
+        self.assertEqual(events[-1], 'start')
+
+    def test_gap_forces_check(self):
+        det = self._counting_detector(idle_skip=5)
+        dummy = np.zeros((10, 10, 3), dtype=np.uint8)
+        det.process_frame(dummy)
+        det.process_frame(dummy)
+        self.assertEqual(det.checked, 1)
+        det.clock += SwingDetector.MAX_IDLE_GAP
+        det.process_frame(dummy)
+        self.assertEqual(det.checked, 2)
+
+
+# ======================================================================
+# Shoulder-turn kernel
+# ======================================================================
+
+class TestShoulderTurnKernel(unittest.TestCase):
+    """Test the scalar shoulder-turn kernel (Numba-compiled when available)."""
+
+    def test_square_shoulders_is_zero(self):
+        self.assertAlmostEqual(_shoulder_turn_scalar(0.4, 0.0, 0.6, 0.0), 0.0)
+
+    def test_matches_atan2(self):
+        expected = math.degrees(math.atan2(0.1, 0.2))
+        self.assertAlmostEqual(_shoulder_turn_scalar(0.4, -0.05, 0.6, 0.05), expected, places=6)
+
+    def test_overlapping_shoulders_is_nan(self):
+        self.assertTrue(math.isnan(_shoulder_turn_scalar(0.5, 0.0, 0.5, 0.1)))
+
+
 # ======================================================================
 # Runner
 # ======================================================================
@@ -331,6 +408,8 @@ def run_swing_detector_tests():
         TestResetAndRelease,
         TestGetStatus,
         TestFullSwingCycle,
+        TestShoulderTurnKernel,
+        TestIdleSkip,
     ]:
         suite.addTests(loader.loadTestsFromTestCase(cls))
 
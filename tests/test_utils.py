@@ -6,6 +6,10 @@ Provides functions to load camera IDs from config files
 import sys
 import os
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
 
 
 def load_windows_camera_config(config_path=None):
@@ -42,5 +46,20 @@ def get_camera_ids():
         return 0, 1
 
 
+@functools.lru_cache(maxsize=None)
+def available_camera_indices(backend=cv2.CAP_ANY, max_index=10):
+    """
+    Camera indices below max_index that open on the given backend.
+    Probed once per process, concurrently and with a short open timeout,
+    so finder scripts skip indices with no device behind them.
+    """
+    def opens(index):
+        cap = cv2.VideoCapture(index, backend, [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, 300])
+        try:
+            return cap.isOpened()
+        finally:
+            cap.release()
 
-
+    with ThreadPoolExecutor(max_workers=max_index) as ex:
+        found = list(ex.map(opens, range(max_index)))
+    return tuple(i for i, ok in enumerate(found) if ok)